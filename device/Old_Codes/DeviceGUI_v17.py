@@ -2,16 +2,24 @@
 """Compact control GUI for the alternate device sharing MainGUI_v5 aesthetics."""
 import faulthandler; faulthandler.enable()
 import importlib.util
+import queue
+from collections import deque
+from itertools import islice
+import struct
 import sys
 import threading
 import time
+import traceback
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import partial
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
 import serial
 
 from simple_pid import PID
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
-from PyQt5.QtGui import QDoubleValidator
+from PyQt5.QtGui import QDoubleValidator, QTextCursor
 from PyQt5.QtWidgets import (
     QApplication,
     QAbstractSpinBox,
@@ -41,6 +49,13 @@ try:
 except ImportError:  # pragma: no cover
     GPIO = None
 
+try:
+    import numba  # type: ignore
+    import numpy as np
+except ImportError:  # pragma: no cover
+    numba = None
+    np = None
+
 
 # ===== Init timeouts =====
 INIT_CONNECT_TIMEOUT = 6.0      # seconds per device connect probe
@@ -48,16 +63,70 @@ INIT_HOME_TIMEOUT = 10.0        # seconds per homing action
 INIT_TOTAL_TIMEOUT = 25.0       # hard cap for full initialization
 REQUIRE_SYRINGE_FOR_INIT = False # abort init if syringe doesn't ACK
 
+class _WorkerPool:
+    """
+    Reusable daemon worker threads for short one-shot I/O jobs (homing, moves,
+    probes). Idle workers are reused; a new one is started only when all are
+    busy, so a hung serial call can never starve later jobs.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._jobs: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._idle = 0
+        self._count = 0
+
+    def submit(self, func: Callable, *args) -> None:
+        with self._lock:
+            if self._idle:
+                self._idle -= 1
+            else:
+                self._count += 1
+                threading.Thread(
+                    target=self._worker, name=f"{self._name}-{self._count}", daemon=True
+                ).start()
+        self._jobs.put((func, args))
+
+    def _worker(self):
+        while True:
+            func, args = self._jobs.get()
+            try:
+                func(*args)
+            except Exception as exc:
+                # Same reporting path as an unhandled exception in a bare thread.
+                threading.excepthook(
+                    threading.ExceptHookArgs((type(exc), exc, exc.__traceback__, threading.current_thread()))
+                )
+            finally:
+                with self._lock:
+                    self._idle += 1
+
+
+_IO_WORKERS = _WorkerPool("gui-io")
+
+
+# Emergency-stop quick stops run one after another on a pooled worker, since
+# every axis and the syringe share one half-duplex bus; the GUI thread waits
+# at most EMERGENCY_STOP_WAIT_S for them before switching the relays off.
+EMERGENCY_STOP_WAIT_S = 2.0
+
+
 def _run_with_timeout(func, timeout_s: float) -> bool:
-    """Run func() in a thread; return True if it finishes before timeout."""
+    """
+    Run func() on a pooled daemon worker; return True if it finishes before
+    timeout. A hung probe keeps its worker but never blocks later probes or
+    interpreter exit; exceptions reach the UI log via threading.excepthook.
+    """
     done = threading.Event()
+
     def _wrap():
         try:
             func()
         finally:
             done.set()
-    th = threading.Thread(target=_wrap, daemon=True)
-    th.start()
+
+    _IO_WORKERS.submit(_wrap)
     return done.wait(timeout_s)
 
 
@@ -101,7 +170,9 @@ RELAY_OUTPUTS = [
     (7, "Relay 7"),
     (8, "Relay 8"),
 ]
-RELAY_COMMAND_DELAY = 0.08  # seconds between batch commands
+# Board channels in write order; relay_states is always keyed by exactly these.
+RELAY_CHANNELS = tuple(sorted(channel for channel, _ in RELAY_OUTPUTS))
+RELAY_COMMAND_DELAY = 0.08  # seconds between back-to-back relay frames
 
 STEPPER_AXES = (
     {
@@ -149,7 +220,25 @@ AXIS_PRESET_POSITIONS = {
     },
 }
 
+# Flat (axis, normalized label) -> (display label, mm) view, built once.
+_PRESET_MAP: Dict[Tuple[str, str], Tuple[str, float]] = {
+    (axis, key.strip().lower()): target
+    for axis, targets in AXIS_PRESET_POSITIONS.items()
+    for key, target in targets.items()
+}
+
+
+def _preset_key(label: str) -> str:
+    return label.strip().lower()
+
+
+def preset_mm(axis_name: str, label: str) -> Optional[float]:
+    target = _PRESET_MAP.get((axis_name, _preset_key(label)))
+    return None if target is None else target[1]
+
+
 AXIS_JOG_STEPS_PER_MM = 2000   # jog distance conversion
+EXTRA_BUTTON_DEBOUNCE_S = 0.2  # ignore preset re-clicks closer together than this
 AXIS_SPEED_STEPS_PER_RPM = 5  # steps/s per RPM for jog speed
 SEQUENCE_AXIS_SPEED_RPM = 5.0  # enforced RPM for automated sequences
 HORIZONTAL_AXIS_VERTICAL_LIMIT_MM = 10
@@ -164,6 +253,8 @@ PERISTALTIC_PINS = {
 FLOW_SENSOR_PORT = "/dev/ttyUSB0"
 FLOW_SENSOR_MEDIUM = "water"
 FLOW_SENSOR_INTERVAL_MS = 20  # match stable CLI test settings
+LOG_MAX_BLOCKS = 400  # lines kept in the event log view
+LOG_FLUSH_INTERVAL_MS = 50  # event log repaint cadence
 FLOW_SENSOR_SCALE_FACTOR = 500.0  # datasheet value for SLF3S-1300F
 FLOW_SENSOR_STALE_RESTART_LIMIT = 20  # polls before watchdog restart
 
@@ -182,6 +273,7 @@ PRIMARY_BUTTON_STYLE = (
     "border: none; border-radius: 8px; padding: 4px 8px;}"
     "QPushButton:pressed {background-color: #1e40af;}"
 )
+COMPACT_BUTTON_STYLE = PRIMARY_BUTTON_STYLE + " QPushButton {padding: 2px 6px; font-size: 12px;}"
 COMMAND_ON_ACTIVE_STYLE = (
     "QPushButton {background-color: #22c55e; color: #0f172a; font-weight: 600;"
     "border: none; border-radius: 8px; padding: 4px 8px;}"
@@ -200,22 +292,162 @@ SPIN_STYLE = (
     "QDoubleSpinBox::up-button, QDoubleSpinBox::down-button {width: 0px; height: 0px; border: none;}"
 )
 
+# Initialize button text for the idle and running states.
+_INIT_LABELS = ("Initialize", "Initializing...")
+
+# Window-wide sheet: parsed once on the root widget. Buttons opt in via
+# objectName (#stopButton/#initButton) or the "class" property.
+MAIN_WINDOW_QSS = """
+QWidget {
+    background-color: #0f172a;
+    color: #e2e8f0;
+    font-family: 'Segoe UI', 'Helvetica Neue', Arial, sans-serif;
+    font-size: 13px;
+}
+QLabel#panelTitle {
+    font-size: 14px;
+    font-weight: 600;
+    color: #f8fafc;
+    margin: 0;
+    padding: 0 0 6px 0;
+}
+QFrame#panel {
+    background-color: #1e293b;
+    border-radius: 12px;
+}
+QLineEdit {
+    background-color: #0f172a;
+    border: 1px solid #334155;
+    border-radius: 8px;
+    padding: 4px 10px;
+    color: #f8fafc;
+    font-weight: 500;
+}
+QLineEdit:focus {
+    border: 1px solid #38bdf8;
+}
+QPlainTextEdit {
+    background-color: #0f172a;
+    border: 1px solid #1e293b;
+    border-radius: 12px;
+    padding: 10px;
+    font-family: 'JetBrains Mono', 'SFMono', monospace;
+    font-size: 12px;
+}
+QPushButton[class="primary"] {
+    background-color: #1d4ed8;
+    color: #f8fafc;
+    font-weight: 600;
+    border: none;
+    border-radius: 8px;
+    padding: 4px 8px;
+}
+QPushButton[class="primary"]:pressed {
+    background-color: #1e40af;
+}
+QPushButton#stopButton {
+    background-color: #dc2626;
+    color: #f8fafc;
+    font-weight: 700;
+    border: none;
+    border-radius: 10px;
+    padding: 10px 20px;
+}
+QPushButton#stopButton:pressed {
+    background-color: #b91c1c;
+}
+QPushButton#initButton {
+    background-color: #22c55e;
+    color: #0f172a;
+    font-weight: 700;
+    border: none;
+    border-radius: 10px;
+    padding: 10px 20px;
+}
+QPushButton#initButton:pressed {
+    background-color: #16a34a;
+}
+"""
+
+class LogLevel(IntEnum):
+    DEBUG = 10
+    INFO = 20
+    WARN = 30
+    ERROR = 40
+
+
+# Lines below this level are dropped at the call site, before any formatting.
+UI_LOG_LEVEL = LogLevel.INFO
+
 _ui_log_callback: Optional[Callable[[str], None]] = None
 
 
-def register_ui_logger(callback: Callable[[str], None]):
+def register_ui_logger(callback: Optional[Callable[[str], None]]):
     global _ui_log_callback
     _ui_log_callback = callback
 
 
-def emit_ui_log(message: str):
-    if _ui_log_callback:
+# Log lines are handed to a drainer thread so threads that log never run the
+# UI callback themselves.
+_LOG_QUEUE: "queue.SimpleQueue" = queue.SimpleQueue()
+# Bursts are delivered to the UI at most once per frame (~60 Hz) as one
+# newline-joined string, so the log view does one append/layout per batch.
+_LOG_FLUSH_INTERVAL = 1.0 / 60.0
+# Set by WARN/ERROR lines so the drainer skips the rest of the frame pause.
+_LOG_URGENT = threading.Event()
+
+
+def _log_drainer():
+    last_flush = float("-inf")
+    while True:
+        batch = [_LOG_QUEUE.get()]
+        # Idle: the first line goes out at once. Busy: gather until a frame
+        # has passed since the previous flush.
+        pause = last_flush + _LOG_FLUSH_INTERVAL - time.monotonic()
+        if pause > 0 and not _LOG_URGENT.is_set():
+            _LOG_URGENT.wait(pause)
+        _LOG_URGENT.clear()
+        while True:
+            try:
+                batch.append(_LOG_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+        callback = _ui_log_callback
+        lines = []
+        for item in batch:
+            if isinstance(item, tuple):
+                # Lazy (fmt, args) entry: only formatted when a sink is attached.
+                if callback is not None:
+                    fmt, args = item
+                    try:
+                        lines.append(fmt % args)
+                    except (TypeError, ValueError):
+                        lines.append(f"{fmt} {args!r}")
+            else:
+                lines.append(item)
+        last_flush = time.monotonic()
+        if not lines or callback is None:
+            continue
         try:
-            _ui_log_callback(message)
+            # The registered callback only emits a Qt signal, which is queued
+            # onto the GUI thread.
+            callback("\n".join(lines))
         except Exception as exc:  # pragma: no cover
             print(f"[WARN] UI log callback failed: {exc}")
 
 
+threading.Thread(target=_log_drainer, name="ui-log-drainer", daemon=True).start()
+
+
+def emit_ui_log(message: str, *args, level: LogLevel = LogLevel.INFO):
+    """Queue a UI log line; with args, message is a %-format applied by the drainer."""
+    if level < UI_LOG_LEVEL:
+        return
+    _LOG_QUEUE.put((message, args) if args else message)
+    if level >= LogLevel.WARN:
+        _LOG_URGENT.set()
+
+
 # --- Global safety and threading helpers (auto-injected) ---
 
 _plc_lock = threading.RLock()
@@ -228,7 +460,7 @@ def safe_plc_call(op_name: str, func: Callable, *args, **kwargs):
             return func(*args, **kwargs)
     except Exception as exc:
         try:
-            emit_ui_log(f"[PLC:{op_name}] error: {exc}")
+            emit_ui_log(f"[PLC:{op_name}] error: {exc}", level=LogLevel.WARN)
         except Exception:
             # Last-resort logging if UI is not yet available
             print(f"[PLC:{op_name}] error: {exc}")
@@ -243,7 +475,7 @@ def _thread_excepthook(args):
     except Exception:
         msg = "[Thread] unhandled exception in background worker"
     try:
-        emit_ui_log(msg)
+        emit_ui_log(msg, level=LogLevel.ERROR)
     except Exception:
         print(msg)
 
@@ -255,12 +487,12 @@ if hasattr(threading, "excepthook"):
 
 # Install a global sys.excepthook to keep the Qt event loop alive on errors.
 def _global_excepthook(exc_type, exc_value, exc_traceback):
-    try:
-        emit_ui_log(f"[FATAL] Unhandled exception: {exc_type.__name__}: {exc_value}")
-    except Exception:
-        print(f"[FATAL] Unhandled exception: {exc_type.__name__}: {exc_value}")
-    import traceback as _traceback
-    _traceback.print_exception(exc_type, exc_value, exc_traceback)
+    emit_ui_log(
+        f"[FATAL] Unhandled exception: {exc_type.__name__}: {exc_value}", level=LogLevel.ERROR
+    )
+    # Printed synchronously: a fatal error can end the interpreter before the
+    # daemon drainer runs.
+    traceback.print_exception(exc_type, exc_value, exc_traceback)
 
 
 sys.excepthook = _global_excepthook
@@ -271,178 +503,442 @@ class TaskManager:
 
     def __init__(self, logger: Callable[[str], None]):
         self._logger = logger
-        self._lock = threading.Lock()
-        self._active: Dict[str, threading.Thread] = {}
+        # name -> claim token; dict.setdefault/pop are atomic, so no lock needed.
+        self._active: Dict[str, object] = {}
+        self._closed = False
 
-    def submit(self, name: str, func: Callable[[], None]) -> bool:
-        with self._lock:
-            if name in self._active:
+    def shutdown(self):
+        """Reject further submissions; running tasks finish on their own."""
+        self._closed = True
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def submit(self, name: str, func: Callable[[], None], quiet: bool = False) -> bool:
+        """Run func under name; quiet skips the busy log for callers that handle it."""
+        if self._closed:
+            return False
+        token = object()
+        if self._active.setdefault(name, token) is not token:
+            if not quiet:
                 self._logger(f"[Task:{name}] already running")
-                return False
+            return False
 
-            def runner():
-                try:
-                    func()
-                except Exception as exc:
-                    self._logger(f"[Task:{name}] error: {exc}")
-                finally:
-                    with self._lock:
-                        self._active.pop(name, None)
-
-            thread = threading.Thread(target=runner, daemon=True)
-            self._active[name] = thread
-            thread.start()
-            return True
+        def runner():
+            try:
+                func()
+            except Exception as exc:
+                self._logger(f"[Task:{name}] error: {exc}")
+            finally:
+                self._active.pop(name, None)
+
+        try:
+            _IO_WORKERS.submit(runner)
+        except Exception:
+            self._active.pop(name, None)
+            raise
+        return True
 
 
 class MotionGate:
     """Global guard to serialize high-energy motion commands."""
 
     def __init__(self):
-        self._state_lock = threading.Lock()
+        # The gate lock is the claim itself: a non-blocking acquire is one
+        # uncontended operation, and it may be released from another thread.
+        self._gate = threading.Lock()
         self._owner: Optional[str] = None
 
     def try_claim(self, owner: str) -> bool:
-        with self._state_lock:
-            if self._owner is not None:
-                return False
-            self._owner = owner
-            return True
+        if not self._gate.acquire(blocking=False):
+            return False
+        self._owner = owner
+        return True
 
     def release(self, owner: str):
-        with self._state_lock:
-            if self._owner == owner:
-                self._owner = None
+        if self._owner != owner:
+            return
+        self._owner = None
+        try:
+            self._gate.release()
+        except RuntimeError:
+            pass
 
     def current_owner(self) -> Optional[str]:
-        with self._state_lock:
-            return self._owner
+        return self._owner
 
 
 MOTION_GATE = MotionGate()
 
 
-def wait_standstill(pump: Optional[SyringePump], timeout: float = 120.0, poll: float = 0.2) -> bool:
-    """Return True when the drive reports standstill before the timeout."""
-    if pump is None:
+class StatusPoller:
+    """
+    Single MODBUS status reader for one pump. It only polls while somebody is
+    waiting, and every waiter evaluates its predicate on the shared samples,
+    so concurrent waits no longer multiply status traffic on the RS-485 bus.
+    """
+
+    def __init__(self, pump: SyringePump, poll: float = 0.2):
+        self.pump = pump
+        # SyringePump.read_status opens the port at 9600 baud and sleeps ~200 ms
+        # per call; polling faster gains no latency and only loads the bus.
+        self.poll = poll
+        self.cond = threading.Condition()
+        self.snapshot: Optional[dict] = None
+        self._seq = 0
+        self._waiters = 0
+        self._stopped = False
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="StatusPoller")
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            with self.cond:
+                while not self._stopped and self._waiters == 0:
+                    self.cond.wait()
+                if self._stopped:
+                    return
+            while True:
+                try:
+                    status = self.pump.read_status()
+                except Exception:
+                    status = None
+                with self.cond:
+                    self.snapshot = status
+                    self._seq += 1
+                    self.cond.notify_all()
+                    idle = self._waiters == 0
+                if self._stop_event.wait(self.poll):
+                    return
+                if idle:
+                    break
+
+    def wait_for(self, predicate: Callable[[Optional[dict]], bool], timeout: float) -> bool:
+        """Return True once predicate(status) holds for a sample taken after this call."""
+        deadline = time.monotonic() + timeout
+        with self.cond:
+            self._waiters += 1
+            self.cond.notify_all()
+            try:
+                seen = self._seq
+                while not self._stopped:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self.cond.wait(remaining)
+                    if self._seq != seen:
+                        seen = self._seq
+                        if predicate(self.snapshot):
+                            return True
+                return False
+            finally:
+                self._waiters -= 1
+
+    def stop(self):
+        with self.cond:
+            self._stopped = True
+            self.cond.notify_all()
+        self._stop_event.set()
+
+
+# id(pump) -> StatusPoller, maintained by SyringeAxisDriver.connect()/disconnect().
+_STATUS_POLLERS: Dict[int, StatusPoller] = {}
+_STATUS_POLLERS_LOCK = threading.Lock()
+
+
+def _status_poller_for(pump: SyringePump) -> Optional[StatusPoller]:
+    with _STATUS_POLLERS_LOCK:
+        poller = _STATUS_POLLERS.get(id(pump))
+    if poller is not None and poller.pump is pump:
+        return poller
+    return None
+
+
+def _is_standstill(status: Optional[dict]) -> bool:
+    return bool(status) and status.get("standstill") == 1
+
+
+def _pos_done_check(tol_steps: int, stable_s: float) -> Callable[[Optional[dict]], bool]:
+    """
+    Predicate: standstill & pos_ok with the position stable for stable_s seconds
+    (time-based, so it does not depend on how fast statuses are sampled).
+    """
+    last_position: Optional[int] = None
+    stable_since: Optional[float] = None
+
+    def check(status: Optional[dict]) -> bool:
+        nonlocal last_position, stable_since
+        if status and status.get("standstill") == 1 and status.get("pos_ok") == 1:
+            current = status.get("actual_position")
+            now = time.monotonic()
+            if last_position is None:
+                last_position = current
+                stable_since = now
+            elif current is not None and last_position is not None:
+                if abs(current - last_position) <= tol_steps:
+                    if stable_since is None:
+                        stable_since = now
+                    elif now - stable_since >= stable_s:
+                        return True
+                else:
+                    stable_since = None
+                last_position = current
         return False
+
+    return check
+
+
+def _poll_status_until(
+    pump: SyringePump,
+    predicate: Callable[[Optional[dict]], bool],
+    timeout: float,
+    poll: float,
+) -> bool:
+    poller = _status_poller_for(pump)
+    if poller is not None:
+        return poller.wait_for(predicate, timeout)
     start = time.time()
     while time.time() - start < timeout:
         try:
             status = pump.read_status()
         except Exception:
             status = None
-        if status and status.get("standstill") == 1:
+        if predicate(status):
             return True
         time.sleep(poll)
     return False
 
 
+def _attach_status_poller(pump: SyringePump):
+    """Route wait_standstill/wait_pos_done on this pump through one shared poller."""
+    with _STATUS_POLLERS_LOCK:
+        previous = _STATUS_POLLERS.get(id(pump))
+        _STATUS_POLLERS[id(pump)] = StatusPoller(pump)
+    if previous is not None:
+        previous.stop()
+
+
+def _detach_status_poller(pump: Optional[SyringePump]):
+    if pump is None:
+        return
+    with _STATUS_POLLERS_LOCK:
+        poller = _STATUS_POLLERS.pop(id(pump), None)
+    if poller is not None:
+        poller.stop()
+
+
+def wait_standstill(pump: Optional[SyringePump], timeout: float = 120.0, poll: float = 0.2) -> bool:
+    """Return True when the drive reports standstill before the timeout."""
+    if pump is None:
+        return False
+    return _poll_status_until(pump, _is_standstill, timeout, poll)
+
+
 def wait_pos_done(
     pump: Optional[SyringePump],
     timeout: float = 300.0,
     poll: float = 0.2,
     tol_steps: int = 200,
-    stable_cycles: int = 3,
+    stable_s: float = 0.4,
 ) -> bool:
-    """Wait until standstill & pos_ok stay stable for multiple polls."""
+    """Wait until standstill & pos_ok stay stable for stable_s seconds."""
     if pump is None:
         return False
-    start = time.time()
-    last_position: Optional[int] = None
-    stable_count = 0
+    return _poll_status_until(pump, _pos_done_check(tol_steps, stable_s), timeout, poll)
 
-    while time.time() - start < timeout:
-        try:
-            status = pump.read_status()
-        except Exception:
-            status = None
-        if status and status.get("standstill") == 1 and status.get("pos_ok") == 1:
-            current = status.get("actual_position")
-            if last_position is None:
-                last_position = current
-                stable_count = 1
-            elif current is not None and last_position is not None:
-                if abs(current - last_position) <= tol_steps:
-                    stable_count += 1
-                    if stable_count >= stable_cycles:
-                        return True
-                else:
-                    stable_count = 0
-                last_position = current
-        time.sleep(poll)
-    return False
+
+def _crc16_table_entry(index: int) -> int:
+    crc = index
+    for _ in range(8):
+        crc = (crc >> 1) ^ 0xA001 if (crc & 1) else (crc >> 1)
+    return crc
+
+
+_CRC16_TABLE = tuple(_crc16_table_entry(i) for i in range(256))
+
+
+# Below this length the numba call overhead outweighs the per-byte savings.
+_CRC16_NATIVE_MIN_LEN = 64
+
+if numba is not None:
+    _CRC16_TABLE_NP = np.array(_CRC16_TABLE, dtype=np.uint16)
+
+    @numba.njit(cache=True)
+    def _crc16_modbus_native(buf, table):  # pragma: no cover - compiled
+        crc = 0xFFFF
+        for byte in buf:
+            crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+        return crc
+else:
+    _crc16_modbus_native = None
+
+
+# Precompiled frame layouts; struct.pack(fmt, ...) would re-parse fmt per call.
+_CRC_STRUCT = struct.Struct("<H")
+_ACK_HEADER = struct.Struct(">BB")
+_POS_STRUCT = struct.Struct(">i")
 
 
-def _crc16_modbus(data: bytes) -> bytes:
+def _crc16_modbus(data) -> bytes:
+    """CRC16/MODBUS of any bytes-like object (bytes, bytearray, memoryview)."""
+    if _crc16_modbus_native is not None and len(data) >= _CRC16_NATIVE_MIN_LEN:
+        return _CRC_STRUCT.pack(
+            int(_crc16_modbus_native(np.frombuffer(data, dtype=np.uint8), _CRC16_TABLE_NP))
+        )
     crc = 0xFFFF
+    table = _CRC16_TABLE
     for byte in data:
-        crc ^= byte
-        for _ in range(8):
-            crc = (crc >> 1) ^ 0xA001 if (crc & 1) else (crc >> 1)
-    return bytes((crc & 0xFF, (crc >> 8) & 0xFF))
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return _CRC_STRUCT.pack(crc)
 
 
-def _int_be4(value: int) -> bytes:
-    return int(value).to_bytes(4, "big", signed=True)
+# Quick-stop frame (0x10 write of 7 registers at 0xA79E): 21 payload bytes +
+# 2 CRC bytes. Only the address, stop flag (byte 9), position (17..20) and CRC vary.
+_QUICK_STOP_TEMPLATE = bytes(
+    [0x00, 0x10, 0xA7, 0x9E, 0x00, 0x07, 0x0E, 0x07, 0x00, 0x00, 0x03, 0x01, 0xF4, 0x00, 0x00, 0x00, 0x00]
+    + [0] * 6
+)
 
 
-def _read_actual_position_safe(pump: SyringePump) -> int:
-    try:
-        status = pump.read_status()
-        if status and "actual_position" in status:
-            return int(status["actual_position"])
-    except Exception:
-        pass
-    try:
-        position = pump.read_feedback()
-        if isinstance(position, int):
-            return position
-    except Exception:
-        pass
-    return 0
+@dataclass(slots=True)
+class PumpTelemetry:
+    """One status read with every position/volume view derived from it."""
 
+    timestamp: float
+    position_steps: Optional[int] = None
+    volume_ml: Optional[float] = None
+    position_mm: Optional[float] = None
+    standstill: Optional[bool] = None
+    pos_ok: Optional[bool] = None
+    busy: Optional[bool] = None
 
-def _read_volume_ml(pump: SyringePump) -> Optional[float]:
-    """Best-effort volume reading modeled after control_guiV15 architecture."""
+
+def _volume_from(source: dict) -> Optional[float]:
+    for key in ("volume_ml", "volume"):
+        value = source.get(key)
+        if value is not None:
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                pass
+    return None
+
+
+def read_telemetry(
+    pump: SyringePump,
+    steps_per_mm: Optional[float] = None,
+    read_status: Optional[Callable[[], Optional[dict]]] = None,
+) -> PumpTelemetry:
+    """
+    Best-effort telemetry modeled after control_guiV15 architecture: one
+    read_status(), with read_feedback() only when the status carries neither a
+    position nor a volume.
+    """
+    telemetry = PumpTelemetry(timestamp=time.monotonic())
     try:
-        status = pump.read_status()
+        status = (read_status or pump.read_status)()
     except Exception:
         status = None
     if isinstance(status, dict):
-        for key in ("volume_ml", "volume"):
-            value = status.get(key)
-            if value is not None:
-                try:
-                    return float(value)
-                except (TypeError, ValueError):
-                    pass
         actual = status.get("actual_position")
         if actual is not None:
             try:
-                return float(actual) / float(pump.steps_per_ml)
-            except Exception:
+                telemetry.position_steps = int(actual)
+            except (TypeError, ValueError):
                 pass
+        telemetry.volume_ml = _volume_from(status)
+        for field in ("standstill", "pos_ok", "busy"):
+            value = status.get(field)
+            if value is not None:
+                setattr(telemetry, field, bool(value))
+
+    if telemetry.position_steps is None and telemetry.volume_ml is None:
+        try:
+            feedback = pump.read_feedback()
+        except Exception:
+            feedback = None
+        if isinstance(feedback, dict):
+            telemetry.volume_ml = _volume_from(feedback)
+        elif isinstance(feedback, (int, float)):
+            telemetry.position_steps = int(feedback)
 
     try:
-        feedback = pump.read_feedback()
+        steps_per_ml = float(pump.steps_per_ml)
     except Exception:
-        feedback = None
+        steps_per_ml = 0.0
+    if steps_per_ml:
+        if telemetry.volume_ml is None and telemetry.position_steps is not None:
+            telemetry.volume_ml = telemetry.position_steps / steps_per_ml
+        elif telemetry.position_steps is None and telemetry.volume_ml is not None:
+            telemetry.position_steps = int(telemetry.volume_ml * steps_per_ml)
+    if steps_per_mm and telemetry.position_steps is not None:
+        telemetry.position_mm = telemetry.position_steps / float(steps_per_mm)
+    return telemetry
 
-    if isinstance(feedback, dict):
-        for key in ("volume_ml", "volume"):
-            value = feedback.get(key)
-            if value is not None:
-                try:
-                    return float(value)
-                except (TypeError, ValueError):
-                    pass
-    elif isinstance(feedback, (int, float)):
+
+def _read_actual_position_safe(pump: SyringePump) -> int:
+    steps = read_telemetry(pump).position_steps
+    return 0 if steps is None else steps
+
+
+def _read_volume_ml(
+    pump: SyringePump, read_status: Optional[Callable[[], Optional[dict]]] = None
+) -> Optional[float]:
+    return read_telemetry(pump, read_status=read_status).volume_ml
+
+
+# Quick-stop handles kept open per (port, baudrate): the emergency path should
+# not pay for open()/tcsetattr()/RS485 setup on every stop.
+class _PooledSerial:
+    """Pooled handle plus its ACK buffer; all fields are guarded by ``lock``."""
+
+    __slots__ = ("handle", "lock", "ack_buf")
+
+    def __init__(self, handle: serial.Serial):
+        self.handle = handle
+        self.lock = threading.Lock()
+        self.ack_buf = bytearray(8)
+
+
+_SERIAL_POOL: Dict[Tuple[str, int], _PooledSerial] = {}
+_SERIAL_POOL_LOCK = threading.Lock()
+
+
+def _get_serial(port: str, baudrate: int) -> _PooledSerial:
+    key = (port, baudrate)
+    with _SERIAL_POOL_LOCK:
+        entry = _SERIAL_POOL.get(key)
+        if entry is not None and entry.handle.is_open:
+            return entry
+        handle = serial.Serial(
+            port,
+            baudrate,
+            bytesize=serial.EIGHTBITS,
+            parity=serial.PARITY_NONE,
+            stopbits=serial.STOPBITS_ONE,
+            timeout=0.3,
+        )
         try:
-            return float(feedback) / float(pump.steps_per_ml)
+            from serial.rs485 import RS485Settings
+
+            handle.rs485_mode = RS485Settings(delay_before_tx=0, delay_before_rx=0)
+        except Exception:
+            pass
+        entry = _PooledSerial(handle)
+        _SERIAL_POOL[key] = entry
+        return entry
+
+
+def _evict_serial(key: Tuple[str, int]) -> None:
+    with _SERIAL_POOL_LOCK:
+        entry = _SERIAL_POOL.pop(key, None)
+    if entry is not None:
+        try:
+            entry.handle.close()
         except Exception:
             pass
-    return None
 
 
 def quick_stop_device(pump: Optional[SyringePump], stop_flag: int = 0x01) -> bool:
@@ -451,58 +947,38 @@ def quick_stop_device(pump: Optional[SyringePump], stop_flag: int = 0x01) -> boo
         return False
     address = pump.address
     position = _read_actual_position_safe(pump)
-    frame = bytearray(
-        [
-            address,
-            0x10,
-            0xA7,
-            0x9E,
-            0x00,
-            0x07,
-            0x0E,
-            0x07,
-            0x00,
-            stop_flag,
-            0x03,
-            0x01,
-            0xF4,
-            0x00,
-            0x00,
-            0x00,
-            0x00,
-        ]
-    )
-    frame.extend(_int_be4(position))
-    frame.extend(_crc16_modbus(frame))
+    frame = bytearray(_QUICK_STOP_TEMPLATE)
+    frame[0] = address
+    frame[9] = stop_flag
+    _POS_STRUCT.pack_into(frame, 17, position)
+    frame[21:23] = _crc16_modbus(memoryview(frame)[:21])
+    key = (pump.port, pump.baudrate)
     try:
-        with serial.Serial(
-            pump.port,
-            pump.baudrate,
-            bytesize=serial.EIGHTBITS,
-            parity=serial.PARITY_NONE,
-            stopbits=serial.STOPBITS_ONE,
-            timeout=0.3,
-        ) as handle:
-            try:
-                from serial.rs485 import RS485Settings
-
-                handle.rs485_mode = RS485Settings(delay_before_tx=0, delay_before_rx=0)
-            except Exception:
-                pass
+        entry = _get_serial(*key)
+    except Exception:
+        return False
+    try:
+        with entry.lock:
+            handle = entry.handle
+            # The bus is shared with per-call SyringePump handles and the relay
+            # board, so stale bytes may be queued on every stop, not only
+            # after a bad ACK: flush both directions before each frame.
             handle.reset_input_buffer()
             handle.reset_output_buffer()
             handle.write(frame)
-            time.sleep(0.01)
-            ack = handle.read(8)
+            # readinto() blocks up to the 0.3 s port timeout for the 8-byte ACK.
+            n = handle.readinto(entry.ack_buf)
+            ack = memoryview(entry.ack_buf)
             return (
-                len(ack) == 8
-                and ack[0] == address
-                and ack[1] == 0x10
-                and _crc16_modbus(ack[:-2]) == ack[-2:]
+                n == 8
+                and _ACK_HEADER.unpack_from(ack) == (address, 0x10)
+                and _crc16_modbus(ack[:6]) == ack[6:8]
             )
     except Exception:
+        _evict_serial(key)
         return False
 
+
 def probe_pump_response(
     pump: Optional[SyringePump],
     timeout: float = CONNECTION_PROBE_TIMEOUT,
@@ -548,18 +1024,51 @@ class SyringeAxisDriver:
         self.max_mm = max_mm
         self._pump: Optional[SyringePump] = None
         self._lock = threading.Lock()
+        # (monotonic timestamp, status) of the last read_status(); see _status().
+        self._status_lock = threading.Lock()
+        self._status_cache: Tuple[float, Optional[dict]] = (float("-inf"), None)
+        self._ready_listeners: List[Callable[[bool], None]] = []
 
     @property
     def ready(self) -> bool:
         return self._pump is not None
 
-    def is_busy(self) -> Optional[bool]:
-        """Return True if the drive reports busy, False if idle, None if unknown."""
+    def add_ready_listener(self, callback: Callable[[bool], None]):
+        """Call callback(ready) whenever connect/disconnect flips the ready state."""
+        if callback not in self._ready_listeners:
+            self._ready_listeners.append(callback)
+
+    def _notify_ready(self, ready: bool):
+        for callback in list(self._ready_listeners):
+            try:
+                callback(ready)
+            except Exception as exc:
+                emit_ui_log(f"[{self.name}] ready listener error: {exc}")
+
+    def _status(self, max_age: float = 0.05) -> Optional[dict]:
+        """
+        pump.read_status() shared between back-to-back callers: a result younger
+        than max_age is reused instead of issuing another MODBUS read.
+        """
         pump = self._pump
         if pump is None:
             return None
-        try:
+        with self._status_lock:
+            ts, status = self._status_cache
+            if time.monotonic() - ts < max_age:
+                return status
             status = pump.read_status()
+            self._status_cache = (time.monotonic(), status)
+            return status
+
+    def _invalidate_status(self):
+        with self._status_lock:
+            self._status_cache = (float("-inf"), None)
+
+    def is_busy(self) -> Optional[bool]:
+        """Return True if the drive reports busy, False if idle, None if unknown."""
+        try:
+            status = self._status()
         except Exception:
             return None
         if not status:
@@ -579,14 +1088,25 @@ class SyringeAxisDriver:
             emit_ui_log(f"[{self.name}] no response on {self.port} @ {self.address:#04x}")
             return False
         with self._lock:
+            previous = self._pump
             self._pump = pump
+        self._invalidate_status()
+        _detach_status_poller(previous)
+        _attach_status_poller(pump)
         emit_ui_log(f"[{self.name}] Connected on {self.port} @ {self.address:#04x}")
+        if previous is None:
+            self._notify_ready(True)
         return True
 
     def disconnect(self):
         with self._lock:
+            pump = self._pump
             self._pump = None
+        self._invalidate_status()
+        _detach_status_poller(pump)
         emit_ui_log(f"[{self.name}] Disconnected")
+        if pump is not None:
+            self._notify_ready(False)
 
     def _require_pump(self) -> SyringePump:
         pump = self._pump
@@ -602,12 +1122,6 @@ class SyringeAxisDriver:
             raise ValueError("steps_per_ml must be > 0")
         return (mm * self.steps_per_mm) / self.steps_per_ml
 
-    def _ml_to_mm(self, volume_ml: float) -> Optional[float]:
-        if not self.steps_per_mm:
-            return None
-        steps = volume_ml * self.steps_per_ml
-        return steps / self.steps_per_mm
-
     def _clamp_mm(self, target_mm: float) -> float:
         if self.min_mm is not None:
             target_mm = max(self.min_mm, target_mm)
@@ -615,28 +1129,15 @@ class SyringeAxisDriver:
             target_mm = min(self.max_mm, target_mm)
         return target_mm
 
-    def _read_position_mm(self) -> Optional[float]:
+    def _telemetry(self) -> Optional[PumpTelemetry]:
         pump = self._pump
         if pump is None:
             return None
-        if not self.steps_per_mm:
-            return None
-        try:
-            status = pump.read_status()
-            if status and "actual_position" in status:
-                return float(status["actual_position"]) / float(self.steps_per_mm)
-        except Exception:
-            pass
-        try:
-            feedback = pump.read_feedback()
-            if isinstance(feedback, int):
-                return float(feedback) / float(self.steps_per_mm)
-        except Exception:
-            pass
-        volume = _read_volume_ml(pump)
-        if volume is not None:
-            return self._ml_to_mm(volume)
-        return None
+        return read_telemetry(pump, self.steps_per_mm, self._status)
+
+    def _read_position_mm(self) -> Optional[float]:
+        telemetry = self._telemetry()
+        return None if telemetry is None else telemetry.position_mm
 
     def _flow_from_rpm(self, rpm: float) -> float:
         speed_steps_per_s = max(rpm, 0.1) * AXIS_SPEED_STEPS_PER_RPM
@@ -660,7 +1161,8 @@ class SyringeAxisDriver:
             raise RuntimeError(f"{self.name} homing disabled")
         pump = self._require_pump()
         pump.home()
-        emit_ui_log(f"[{self.name}] Waiting for homing standstill")
+        self._invalidate_status()
+        emit_ui_log("[%s] Waiting for homing standstill", self.name, level=LogLevel.DEBUG)
         if not wait_standstill(pump, timeout=60, poll=0.2):
             raise RuntimeError(f"{self.name} homing did not reach standstill")
         emit_ui_log(f"[{self.name}] Homing complete")
@@ -672,28 +1174,8 @@ class SyringeAxisDriver:
         return quick_stop_device(pump)
 
     def get_position_steps(self) -> Optional[int]:
-        pump = self._pump
-        if pump is None:
-            return None
-        try:
-            status = pump.read_status()
-            if status and "actual_position" in status:
-                return int(status["actual_position"])
-        except Exception:
-            pass
-        try:
-            feedback = pump.read_feedback()
-            if isinstance(feedback, int):
-                return feedback
-        except Exception:
-            pass
-        volume = _read_volume_ml(pump)
-        if volume is not None:
-            try:
-                return int(volume * pump.steps_per_ml)
-            except Exception:
-                return None
-        return None
+        telemetry = self._telemetry()
+        return None if telemetry is None else telemetry.position_steps
 
     def get_position_mm(self) -> Optional[float]:
         return self._read_position_mm()
@@ -701,12 +1183,24 @@ class SyringeAxisDriver:
     def move_to_mm(self, target_mm: float, rpm: float, context: str = "move"):
         pump = self._require_pump()
         target_mm = self._clamp_mm(float(target_mm))
+        # Redundant preset presses: one (possibly cached) status read decides
+        # before any standstill wait or further MODBUS traffic.
+        telemetry = read_telemetry(pump, self.steps_per_mm, self._status)
+        if (
+            telemetry.standstill
+            and telemetry.position_mm is not None
+            and abs(target_mm - telemetry.position_mm) < 0.01
+        ):
+            emit_ui_log(f"[{self.name}] {context}: already at target ({target_mm:.3f} mm)")
+            return
         target_ml = self._mm_to_ml(target_mm)
-        emit_ui_log(f"[{self.name}] {context}: ensuring standstill")
-        if not wait_standstill(pump, timeout=30, poll=0.2):
+        emit_ui_log("[%s] %s: ensuring standstill", self.name, context, level=LogLevel.DEBUG)
+        if not wait_standstill(pump, timeout=30):
             raise RuntimeError(f"{self.name} axis busy (no standstill)")
-        current_volume = _read_volume_ml(pump)
-        current_mm = self._read_position_mm()
+        self._invalidate_status()
+        telemetry = read_telemetry(pump, self.steps_per_mm, self._status)
+        current_volume = telemetry.volume_ml
+        current_mm = telemetry.position_mm
         delta_mm = None
         if current_mm is not None:
             delta_mm = target_mm - current_mm
@@ -727,12 +1221,16 @@ class SyringeAxisDriver:
         else:
             emit_ui_log(f"[{self.name}] {context}: target {target_mm:.3f} mm (no feedback)")
         pump.move(target_ml, flow)
-        emit_ui_log(f"[{self.name}] {context}: waiting for completion")
-        if not wait_pos_done(pump, timeout=600, poll=0.2):
+        self._invalidate_status()
+        emit_ui_log("[%s] %s: waiting for completion", self.name, context, level=LogLevel.DEBUG)
+        if not wait_pos_done(pump, timeout=600):
             raise RuntimeError(f"{self.name} move incomplete (no standstill/pos_ok)")
         emit_ui_log(f"[{self.name}] {context}: move complete")
 
 
+# (size, on_color, off_color) -> relay button sheet, shared by every button of that look.
+_RELAY_STYLE_CACHE: Dict[Tuple[int, str, str], str] = {}
+
 
 class RelayToggleButton(QPushButton):
     def __init__(
@@ -743,6 +1241,7 @@ class RelayToggleButton(QPushButton):
         on_color: str = "#f97316",
         off_color: str = "#3b82f6",
         size: int = 48,
+        apply_style: bool = True,
     ):
         super().__init__(label)
         self.channel = channel
@@ -754,9 +1253,32 @@ class RelayToggleButton(QPushButton):
         self.setFixedSize(size, size)
         self.setCursor(Qt.PointingHandCursor)
         self.setFocusPolicy(Qt.NoFocus)
+        self._state: Optional[bool] = None
+        self.setObjectName("relayToggle")
+        # apply_style=False: a parent already carries style_sheet() for this look.
+        if apply_style:
+            self.setStyleSheet(self.style_sheet(size, on_color, off_color))
         self._apply_style(False)
         self.clicked.connect(self._toggle)
 
+    @classmethod
+    def style_sheet(
+        cls, size: int = 48, on_color: str = "#f97316", off_color: str = "#3b82f6"
+    ) -> str:
+        """Sheet for relay buttons of one look; toggles only flip the "state" property."""
+        key = (size, on_color, off_color)
+        sheet = _RELAY_STYLE_CACHE.get(key)
+        if sheet is None:
+            radius = max(4, int(size * 0.2))
+            font_size = 11 if size <= 48 else 12
+            sheet = _RELAY_STYLE_CACHE[key] = (
+                f"QPushButton#relayToggle {{border-radius: {radius}px; color: #f8fafc;"
+                f" font-weight: 600; font-size: {font_size}px; border: none;}}"
+                f" QPushButton#relayToggle[state=\"on\"] {{background-color: {on_color};}}"
+                f" QPushButton#relayToggle[state=\"off\"] {{background-color: {off_color};}}"
+            )
+        return sheet
+
     def set_state(self, state: bool):
         self.blockSignals(True)
         self.setChecked(state)
@@ -764,13 +1286,14 @@ class RelayToggleButton(QPushButton):
         self.blockSignals(False)
 
     def _apply_style(self, state: bool):
-        color = self.on_color if state else self.off_color
-        radius = max(4, int(self._size * 0.2))
-        font_size = 11 if self._size <= 48 else 12
-        self.setStyleSheet(
-            f"border-radius: {radius}px; background-color: {color}; color: #f8fafc;"
-            f"font-weight: 600; font-size: {font_size}px; border: none;"
-        )
+        state = bool(state)
+        if state is self._state:
+            return
+        self._state = state
+        self.setProperty("state", "on" if state else "off")
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
 
     def _toggle(self):
         desired = self.isChecked()
@@ -982,7 +1505,7 @@ class PIDValvePanel(QWidget):
             time.sleep(0.5)
             self.controller.homing_routine()
 
-        threading.Thread(target=_run_home, daemon=True).start()
+        _IO_WORKERS.submit(_run_home)
 
     def _close_valve(self):
         if self.controller.enabled:
@@ -996,7 +1519,7 @@ class PIDValvePanel(QWidget):
             except Exception as exc:
                 emit_ui_log(f"[PIDValve] close error: {exc}")
 
-        threading.Thread(target=_run_close, daemon=True).start()
+        _IO_WORKERS.submit(_run_close)
 
     def _apply_enable_button_state(self, state: bool):
         self.enable_button.blockSignals(True)
@@ -1005,7 +1528,19 @@ class PIDValvePanel(QWidget):
         self.enable_button.setText("PID ON" if state else "Enable PID")
 
 
+def _always_allowed() -> bool:
+    """Default pre-move check for axes without an interlock."""
+    return True
+
+
 class StepperAxisControl(QWidget):
+    # Motion events from every axis, drained in one UI-thread dispatch.
+    _motion_lock = threading.Lock()
+    _pending_motion_events: "deque[Tuple[str, Callable[[], None]]]" = deque()
+    _motion_dispatch_pending = False
+    # Queued callable hop used by _invoke_ui from worker threads.
+    _ui_call_signal = pyqtSignal(object)
+
     def __init__(
         self,
         driver: SyringeAxisDriver,
@@ -1017,10 +1552,25 @@ class StepperAxisControl(QWidget):
         super().__init__()
         self.driver = driver
         self.name = driver.name
+        # This axis' presets keyed by normalized label, resolved once.
+        self._axis_targets: Dict[str, Tuple[str, float]] = {
+            key: target for (axis, key), target in _PRESET_MAP.items() if axis == self.name
+        }
         self._steps_per_mm = getattr(driver, "steps_per_mm", AXIS_JOG_STEPS_PER_MM) or AXIS_JOG_STEPS_PER_MM
         self._move_lock = threading.Lock()
+        # Latest position move requested while busy; only the last one is kept.
+        self._pending_lock = threading.Lock()
+        self._pending_move: Optional[Tuple[float, float]] = None
+        # True while a jog/move holds _move_lock; jog buttons are disabled meanwhile.
+        self._motion_active = False
+        # Driver ready state, kept current by the driver's ready listener.
+        self._hw_ready = driver.ready
+        driver.add_ready_listener(self._on_driver_ready_changed)
+        # (enabled, jog_enabled, warning) last applied by refresh_ready_state.
+        self._ready_view_state: Optional[Tuple[bool, bool, Optional[str]]] = None
         self._stop_flag = threading.Event()
         self._tasks = task_runner
+        self._ui_call_signal.connect(self._run_ui_call, Qt.QueuedConnection)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -1127,11 +1677,13 @@ class StepperAxisControl(QWidget):
                 if compact_buttons:
                     btn.setMaximumWidth(90)
                     btn.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-                    btn.setStyleSheet(PRIMARY_BUTTON_STYLE + " QPushButton {padding: 2px 6px; font-size: 12px;}")
+                    btn.setStyleSheet(COMPACT_BUTTON_STYLE)
                 else:
                     btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
                     btn.setStyleSheet(PRIMARY_BUTTON_STYLE)
-                btn.clicked.connect(lambda _, text=label: self._handle_extra_button(text))
+                btn.clicked.connect(
+                    partial(self._handle_extra_button, str(label), _preset_key(str(label)))
+                )
                 extra_row.addWidget(btn)
                 self._extra_buttons.append(btn)
             layout.addLayout(extra_row)
@@ -1155,8 +1707,12 @@ class StepperAxisControl(QWidget):
 
         self._safety_lock = False
         self._safety_message = ""
-        self._pre_move_check: Optional[Callable[[], bool]] = None
-        self._motion_callbacks: List[Callable[[], None]] = []
+        self._last_extra_click = float("-inf")
+        self._pre_move_check: Callable[[], bool] = _always_allowed
+        # Copy-on-write emission tuple plus a set index for O(1) de-duplication;
+        # emitters read the tuple without copying or locking.
+        self._motion_callbacks: Tuple[Callable[[], None], ...] = ()
+        self._motion_callback_set: Set[Callable[[], None]] = set()
 
         self._last_position_mm: Optional[float] = None
 
@@ -1171,9 +1727,9 @@ class StepperAxisControl(QWidget):
         self._stop_flag.clear()
         mm_distance = self.position_spin.value()
         rpm = self.speed_spin.value()
-        threading.Thread(
-            target=self._run_steps, args=(forward, mm_distance, rpm), daemon=True
-        ).start()
+        self._tasks.submit(
+            f"{self.name}-jog", lambda: self._run_steps(forward, mm_distance, rpm)
+        )
 
     def _move_to_position(self):
         if not self.driver.ready:
@@ -1185,15 +1741,22 @@ class StepperAxisControl(QWidget):
         target_mm = self.position_spin.value()
         rpm = self.speed_spin.value()
 
-        threading.Thread(
-            target=self._run_position_move,
-            args=(target_mm, rpm),
-            daemon=True,
-        ).start()
+        self._submit_position_move(target_mm, rpm)
+
+    def _submit_position_move(self, target_mm: float, rpm: float, preset: Optional[str] = None):
+        if preset is None:
+            task = lambda: self._run_position_move(target_mm, rpm)
+        else:
+            task = lambda: self._run_preset_move(preset, target_mm, rpm)
+        if self._tasks.submit(f"{self.name}-move", task, quiet=True) or self._tasks.closed:
+            return
+        # A move task is still active: _run_position_move queues behind it.
+        _IO_WORKERS.submit(task)
 
     def _run_steps(self, forward: bool, mm_distance: float, rpm: float):
         if not self._move_lock.acquire(blocking=False):
             return
+        self._set_motion_active(True)
         try:
             if self._stop_flag.is_set():
                 return
@@ -1203,8 +1766,8 @@ class StepperAxisControl(QWidget):
             steps_per_sec = rpm * AXIS_SPEED_STEPS_PER_RPM
             direction = '+' if forward else '-'
             emit_ui_log(
-                f"{self.name} jog {direction}{mm_distance:.3f} mm (~{steps} steps) "
-                f"@ {rpm:.1f} RPM"
+                "%s jog %s%.3f mm (~%d steps) @ %.1f RPM",
+                self.name, direction, mm_distance, steps, rpm,
             )
             self.driver.jog(forward, steps, steps_per_sec)
             delta_mm = mm_distance if forward else -mm_distance
@@ -1213,12 +1776,59 @@ class StepperAxisControl(QWidget):
         except Exception as exc:
             emit_ui_log(f"[{self.name}] jog error: {exc}")
         finally:
+            self._release_move_lock()
+
+    def _release_move_lock(self):
+        """Release the move lock and start the newest move queued meanwhile."""
+        with self._pending_lock:
             self._move_lock.release()
+            pending, self._pending_move = self._pending_move, None
+        if pending is not None and not self._stop_flag.is_set():
+            # The interlock may have changed since the move was queued.
+            self._invoke_ui(partial(self._dispatch_pending_move, *pending))
+        else:
+            self._set_motion_active(False)
 
-    def _run_position_move(self, target_mm: float, rpm: float):
-        if not self._move_lock.acquire(blocking=False):
-            emit_ui_log(f"[{self.name}] move skipped: another command in progress")
+    def _dispatch_pending_move(self, target_mm: float, rpm: float):
+        """Start a queued move on the UI thread once the pre-move check passes again."""
+        if self._stop_flag.is_set():
+            allowed = False
+        elif self._safety_lock:
+            message = self._safety_message or "Axis locked by safety interlock"
+            emit_ui_log(f"[{self.name}] {message}")
+            allowed = False
+        else:
+            allowed = self._check_pre_move()
+        if allowed:
+            _IO_WORKERS.submit(self._run_position_move, target_mm, rpm)
             return
+        emit_ui_log(f"[{self.name}] queued move -> {target_mm:.3f} mm dropped", level=LogLevel.WARN)
+        if not self._move_lock.locked():
+            self._set_motion_active(False)
+
+    def _set_motion_active(self, active: bool):
+        if active == self._motion_active:
+            return
+        self._motion_active = active
+        self._invoke_ui(self.refresh_ready_state)
+
+    def _invoke_ui(self, func: Callable[[], None]):
+        if threading.current_thread() is threading.main_thread():
+            func()
+        else:
+            self._ui_call_signal.emit(func)
+
+    @pyqtSlot(object)
+    def _run_ui_call(self, func: Callable[[], None]):
+        func()
+
+    def _run_position_move(self, target_mm: float, rpm: float):
+        with self._pending_lock:
+            if not self._move_lock.acquire(blocking=False):
+                self._pending_move = (target_mm, rpm)
+                emit_ui_log(f"[{self.name}] move -> {target_mm:.3f} mm queued behind current command")
+                return
+        self._set_motion_active(True)
         try:
             emit_ui_log(f"[{self.name}] Move -> {target_mm:.3f} mm request")
             self.driver.move_to_mm(target_mm, rpm, context="position")
@@ -1227,7 +1837,7 @@ class StepperAxisControl(QWidget):
         except Exception as exc:
             emit_ui_log(f"[{self.name}] move error: {exc}")
         finally:
-            self._move_lock.release()
+            self._release_move_lock()
 
     def _home(self):
         if not self.driver.ready:
@@ -1235,21 +1845,22 @@ class StepperAxisControl(QWidget):
             return
         if not self._check_pre_move():
             return
+        self._tasks.submit(f"{self.name}-home", self._run_home)
 
-        def _run_home():
-            emit_ui_log(f"Homing {self.name}")
-            try:
-                self.driver.home()
-                emit_ui_log(f"{self.name} homed")
-                self._update_cached_position(target_mm=self.position_spin.minimum())
-                self._emit_motion_callbacks()
-            except Exception as exc:
-                emit_ui_log(f"[{self.name}] home error: {exc}")
-
-        threading.Thread(target=_run_home, daemon=True).start()
+    def _run_home(self):
+        emit_ui_log(f"Homing {self.name}")
+        try:
+            self.driver.home()
+            emit_ui_log(f"{self.name} homed")
+            self._update_cached_position(target_mm=self.position_spin.minimum())
+            self._emit_motion_callbacks()
+        except Exception as exc:
+            emit_ui_log(f"[{self.name}] home error: {exc}")
 
     def force_stop(self, quiet: bool = False):
         self._stop_flag.set()
+        with self._pending_lock:
+            self._pending_move = None
         try:
             ok = self.driver.quick_stop()
             if not quiet:
@@ -1268,43 +1879,68 @@ class StepperAxisControl(QWidget):
         self._update_cached_position(target_mm=self.position_spin.minimum())
         self._emit_motion_callbacks()
 
+    def _on_driver_ready_changed(self, ready: bool):
+        self._hw_ready = ready
+        self._invoke_ui(self.refresh_ready_state)
+
     def refresh_ready_state(self):
-        hw_ready = self.driver.ready
+        hw_ready = self._hw_ready
+        if not hw_ready:
+            self._last_position_mm = None
         enabled = hw_ready and not self._safety_lock
-        for widget in self._control_widgets:
-            widget.setEnabled(enabled)
+        jog_enabled = enabled and not self._motion_active
         warning = None
         if not hw_ready:
             warning = self._warn_default
         elif self._safety_lock:
             warning = self._safety_message or "Axis locked by safety interlock"
-        if warning:
-            self._warn_label.setText(warning)
-            self._warn_label.setVisible(True)
-        else:
-            self._warn_label.setVisible(False)
-        if not hw_ready:
-            self._last_position_mm = None
-
-    def _handle_extra_button(self, label: str):
+        # Widgets are only touched when the applied state actually changes.
+        previous = self._ready_view_state
+        state = (enabled, jog_enabled, warning)
+        if state == previous:
+            return
+        self._ready_view_state = state
+        if previous is None or previous[:2] != state[:2]:
+            # pos_button stays live: position moves coalesce into _pending_move.
+            jog_buttons = (self.neg_button,)
+            # One repaint for the whole batch instead of one per widget.
+            self.setUpdatesEnabled(False)
+            try:
+                for widget in self._control_widgets:
+                    widget.setEnabled(jog_enabled if widget in jog_buttons else enabled)
+            finally:
+                self.setUpdatesEnabled(True)
+        if previous is None or previous[2] != warning:
+            if warning:
+                self._warn_label.setText(warning)
+            if previous is None or bool(previous[2]) != bool(warning):
+                self._warn_label.setVisible(bool(warning))
+
+    def _handle_extra_button(self, label: str, key: Optional[str] = None, _checked: bool = False):
+        now = time.monotonic()
+        if now - self._last_extra_click < EXTRA_BUTTON_DEBOUNCE_S:
+            return
+        self._last_extra_click = now
         if not self.driver.ready:
             emit_ui_log(f"IGNORED extra button '{label}' on {self.name}: axis unavailable")
             return
         if not self._check_pre_move():
             return
 
-        axis_targets = AXIS_PRESET_POSITIONS.get(self.name)
-        if not axis_targets:
+        target_info = self._axis_targets.get(key if key is not None else _preset_key(label))
+        if target_info is None and not self._axis_targets:
             emit_ui_log(f"[{self.name}] extra button '{label}' pressed (no presets configured)")
             return
-
-        normalized = label.strip().lower()
-        target_info = axis_targets.get(normalized)
         if target_info is None:
             emit_ui_log(f"[{self.name}] extra button '{label}' pressed (no action assigned)")
             return
 
         display_label, target_mm = target_info
+        rpm = self.speed_spin.value()
+        # The position probe is serial I/O, so it runs on the worker, not here.
+        self._submit_position_move(target_mm, rpm, display_label)
+
+    def _run_preset_move(self, display_label: str, target_mm: float, rpm: float):
         current_mm = self.driver.get_position_mm()
         if current_mm is not None:
             if abs(target_mm - current_mm) < 0.01:
@@ -1312,14 +1948,8 @@ class StepperAxisControl(QWidget):
                 return
         else:
             emit_ui_log(f"[{self.name}] {display_label}: no position feedback, moving anyway")
-
-        rpm = self.speed_spin.value()
         emit_ui_log(f"[{self.name}] {display_label} -> {target_mm:.3f} mm command requested")
-        threading.Thread(
-            target=self._run_position_move,
-            args=(target_mm, rpm),
-            daemon=True,
-        ).start()
+        self._run_position_move(target_mm, rpm)
 
     def set_safety_lock(self, active: bool, message: str = ""):
         if active == self._safety_lock and (not active or message == self._safety_message):
@@ -1329,11 +1959,12 @@ class StepperAxisControl(QWidget):
         self.refresh_ready_state()
 
     def set_pre_move_check(self, callback: Optional[Callable[[], bool]]):
-        self._pre_move_check = callback
+        self._pre_move_check = callback or _always_allowed
 
     def add_motion_callback(self, callback: Callable[[], None]):
-        if callback not in self._motion_callbacks:
-            self._motion_callbacks.append(callback)
+        if callback not in self._motion_callback_set:
+            self._motion_callback_set.add(callback)
+            self._motion_callbacks = self._motion_callbacks + (callback,)
 
     def get_cached_position_mm(self) -> Optional[float]:
         return self._last_position_mm
@@ -1367,24 +1998,41 @@ class StepperAxisControl(QWidget):
         return steps / self._steps_per_mm
 
     def _emit_motion_callbacks(self):
-        if not self._motion_callbacks:
+        callbacks = self._motion_callbacks
+        if not callbacks:
             return
-        callbacks = list(self._motion_callbacks)
-
-        def _dispatch():
-            for cb in callbacks:
-                try:
-                    cb()
-                except Exception as exc:
-                    emit_ui_log(f"[{self.name}] motion callback error: {exc}")
+        cls = StepperAxisControl
+        with cls._motion_lock:
+            cls._pending_motion_events.extend((self.name, cb) for cb in callbacks)
+            if cls._motion_dispatch_pending:
+                return
+            cls._motion_dispatch_pending = True
+        self._invoke_ui(cls._drain_motion_events)
 
-        QTimer.singleShot(0, _dispatch)
+    @staticmethod
+    def _drain_motion_events():
+        cls = StepperAxisControl
+        with cls._motion_lock:
+            events, cls._pending_motion_events = cls._pending_motion_events, deque()
+            cls._motion_dispatch_pending = False
+        # A callback registered on several axes, or emitted repeatedly within
+        # one burst, runs once.
+        seen = set()
+        for name, cb in events:
+            if cb in seen:
+                continue
+            seen.add(cb)
+            try:
+                cb()
+            except Exception as exc:
+                emit_ui_log(f"[{name}] motion callback error: {exc}")
 
     def _check_pre_move(self, raise_on_block: bool = False) -> bool:
-        if not self._pre_move_check:
+        check = self._pre_move_check
+        if check is _always_allowed:
             return True
         try:
-            allowed = bool(self._pre_move_check())
+            allowed = bool(check())
         except Exception as exc:
             if raise_on_block:
                 raise
@@ -1399,9 +2047,51 @@ class StepperAxisControl(QWidget):
         return True
 
 
+def _execute_syringe_move(
+    pump: SyringePump,
+    target_ml: float,
+    flow_ml_min: float,
+    log_prefix: str,
+    status_cb: Optional[Callable[[str], None]] = None,
+) -> bool:
+    """
+    Absolute syringe move shared by the panel and the sequence adapter:
+    standstill check, skip when already there, signed flow, move, settle.
+    Returns False when the pump was already at target_ml.
+    """
+    target_ml = float(target_ml)
+    flow = max(abs(float(flow_ml_min)), 0.1)
+    if status_cb:
+        status_cb("Ensuring standstill...")
+    if not wait_standstill(pump, timeout=30):
+        raise RuntimeError("Syringe not at standstill before move")
+    current_ml = _read_volume_ml(pump)
+    if current_ml is not None:
+        delta = target_ml - current_ml
+        if abs(delta) < 0.01:
+            emit_ui_log("%s already at %.3f mL (Δ %+.4f mL)", log_prefix, target_ml, delta)
+            return False
+        if delta < 0:
+            flow = -flow
+    elif target_ml < 0:
+        flow = -flow
+    emit_ui_log("%s move -> %.3f mL @ %.2f mL/min", log_prefix, target_ml, abs(flow))
+    if status_cb:
+        status_cb("Moving...")
+    pump.move(target_ml, flow)
+    if status_cb:
+        status_cb("Waiting for completion...")
+    if not wait_pos_done(pump, timeout=600):
+        raise RuntimeError("Syringe move did not settle")
+    emit_ui_log("%s reached %.3f mL", log_prefix, target_ml)
+    return True
+
+
 class _PeristalticSequenceAdapter:
     """Bridge the peristaltic panel pins to the MAF sequence motor API."""
 
+    __slots__ = ("panel",)
+
     def __init__(self, panel: Optional["PeristalticPumpPanel"]):
         self.panel = panel
 
@@ -1430,6 +2120,8 @@ class _PeristalticSequenceAdapter:
 class _RelayValveAdapter:
     """Maps relay channels to open/close valves for the MAF sequence."""
 
+    __slots__ = ("_relays_getter", "channel", "label")
+
     def __init__(
         self,
         relays_getter: Callable[[], Optional[RelayBoard06]],
@@ -1460,6 +2152,8 @@ class _RelayValveAdapter:
 class _SyringeSequenceAdapter:
     """Placeholder syringe adapter that logs sequence actions."""
 
+    __slots__ = ("panel",)
+
     def __init__(self, panel: Optional["SyringeControlPanel"]):
         self.panel = panel
 
@@ -1474,23 +2168,7 @@ class _SyringeSequenceAdapter:
         emit_ui_log(f"[MAF] Syringe {action} (action not yet implemented)")
 
     def goto_absolute(self, target_ml: float, flow_ml_min: float):
-        pump = self._require_pump()
-        if not wait_standstill(pump, timeout=30, poll=0.2):
-            raise RuntimeError("Syringe not at standstill before move")
-        current_ml = _read_volume_ml(pump)
-        delta = None
-        if current_ml is not None:
-            delta = float(target_ml) - current_ml
-            if abs(delta) < 0.01:
-                emit_ui_log(f"[MAF] Syringe already at {target_ml:.2f} mL")
-                return
-        flow = max(float(flow_ml_min), 0.1)
-        signed_flow = flow if (delta is None or delta >= 0.0) else -flow
-        emit_ui_log(f"[MAF] Syringe move -> {target_ml:.2f} mL @ {abs(signed_flow):.2f} mL/min")
-        pump.move(float(target_ml), signed_flow)
-        if not wait_pos_done(pump, timeout=600, poll=0.2):
-            raise RuntimeError("Syringe move did not settle")
-        emit_ui_log(f"[MAF] Syringe reached {target_ml:.2f} mL")
+        _execute_syringe_move(self._require_pump(), target_ml, flow_ml_min, "[MAF] Syringe")
 
     def suck_air(self):
         self._log("SUCK AIR")
@@ -1587,6 +2265,12 @@ class PeristalticPumpPanel(QWidget):
 class SyringeControlPanel(QWidget):
     """Minimal syringe pump control with Home / Move actions."""
 
+    # Worker -> UI status updates; AutoConnection queues them across threads.
+    status_signal = pyqtSignal(str)
+    idle_reset_signal = pyqtSignal()
+    # Queued callable hop used by _invoke_ui from worker threads.
+    _ui_call_signal = pyqtSignal(object)
+
     def __init__(
         self,
         port: str = SYRINGE_PORT,
@@ -1610,6 +2294,13 @@ class SyringeControlPanel(QWidget):
 
         self.status_label = QLabel("Status: Idle")
         self.status_label.setStyleSheet("font-weight: 600;")
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(1500)
+        self._idle_timer.timeout.connect(lambda: self._set_status("Status: Idle"))
+        self.status_signal.connect(self._set_status)
+        self._ui_call_signal.connect(self._run_ui_call, Qt.QueuedConnection)
+        self.idle_reset_signal.connect(self._idle_timer.start)
         layout.addWidget(self.status_label)
 
         form = QGridLayout()
@@ -1682,24 +2373,28 @@ class SyringeControlPanel(QWidget):
                 emit_ui_log(f"[Syringe] {name} error: {exc}")
             finally:
                 self._busy_flag.clear()
-                self._invoke_ui(lambda: QTimer.singleShot(1500, lambda: self._set_status("Status: Idle")))
+                self.idle_reset_signal.emit()
 
         if self._tasks and not self._tasks.submit(f"Syringe-{name}", worker):
             return
         if not self._tasks:
-            threading.Thread(target=worker, daemon=True).start()
+            _IO_WORKERS.submit(worker)
 
     def _invoke_ui(self, func: Callable[[], None]):
         if threading.current_thread() is threading.main_thread():
             func()
         else:
-            QTimer.singleShot(0, func)
+            self._ui_call_signal.emit(func)
+
+    @pyqtSlot(object)
+    def _run_ui_call(self, func: Callable[[], None]):
+        func()
 
     def _set_status(self, text: str):
         self.status_label.setText(text)
 
     def _set_status_safe(self, text: str):
-        self._invoke_ui(lambda: self._set_status(text))
+        self.status_signal.emit(text)
 
     def _move(self, volume: float, flow: float):
         self._perform_move(volume, flow)
@@ -1741,17 +2436,21 @@ class SyringeControlPanel(QWidget):
         )
         if verify and not probe_pump_response(pump, timeout=timeout):
             emit_ui_log(f"[Syringe] no response on {self.port} @ {self.address:#04x}")
+            _detach_status_poller(self._pump)
             self._pump = None
             self._apply_ready_state_safe()
             return False
-        self._pump = pump
+        previous, self._pump = self._pump, pump
+        _detach_status_poller(previous)
+        _attach_status_poller(pump)
         self._apply_ready_state_safe()
         emit_ui_log(f"Syringe control ready on {self.port} @ {self.address:#04x}")
         return True
 
     def disconnect(self):
         if self._pump is not None:
-            self._pump = None
+            pump, self._pump = self._pump, None
+            _detach_status_poller(pump)
             self._apply_ready_state_safe()
             emit_ui_log("Syringe control disconnected")
 
@@ -1769,31 +2468,11 @@ class SyringeControlPanel(QWidget):
         self._invoke_ui(self._apply_ready_state)
 
     def _perform_move(self, volume: float, flow: float):
-        pump = self._require_pump()
-        target_ml = float(volume)
-        flow = max(abs(float(flow)), 0.1)
-        self._set_status_safe("Ensuring standstill...")
-        emit_ui_log("[Syringe] Ensuring standstill before move")
-        if not wait_standstill(pump, timeout=30, poll=0.2):
-            raise RuntimeError("Syringe not at standstill")
-        current_ml = _read_volume_ml(pump)
-        if current_ml is not None:
-            delta = target_ml - current_ml
-            if abs(delta) < 0.01:
-                emit_ui_log(f"[Syringe] Already at {target_ml:.3f} mL (Δ {delta:+.4f} mL)")
-                self._set_status_safe("Status: Idle")
-                return
-            flow = flow if delta >= 0 else -flow
-        else:
-            flow = flow if target_ml >= 0 else -flow
-        emit_ui_log(f"[Syringe] Move to {target_ml:.3f} mL @ {abs(flow):.2f} mL/min")
-        self._set_status_safe("Moving...")
-        pump.move(target_ml, flow)
-        emit_ui_log("[Syringe] Waiting for move to finish")
-        self._set_status_safe("Waiting for completion...")
-        if not wait_pos_done(pump, timeout=600, poll=0.2):
-            raise RuntimeError("Syringe move did not settle")
-        emit_ui_log("[Syringe] Move complete")
+        moved = _execute_syringe_move(
+            self._require_pump(), volume, flow, "[Syringe]", status_cb=self._set_status_safe
+        )
+        if not moved:
+            self._set_status_safe("Status: Idle")
 
     def _perform_home(self, update_status: bool):
         pump = self._require_pump()
@@ -1801,7 +2480,7 @@ class SyringeControlPanel(QWidget):
             self._set_status_safe("Homing...")
         emit_ui_log("[Syringe] Homing sequence start")
         pump.home()
-        emit_ui_log("[Syringe] Waiting for homing standstill")
+        emit_ui_log("[Syringe] Waiting for homing standstill", level=LogLevel.DEBUG)
         if not wait_standstill(pump, timeout=100, poll=0.2):
             raise RuntimeError("Syringe homing did not reach standstill")
         emit_ui_log("[Syringe] Homing complete")
@@ -2086,6 +2765,7 @@ class TemperatureControlPanel(QWidget):
         self._ready_fallback_ok = True
         self._signal_state: Optional[bool] = None
         self._last_ready_state: Optional[bool] = None
+        self._status_rendered = False
         self._indicator_size = 32
         try:
             safe_plc_call("pin_mode", plc.pin_mode,TEMP_COMMAND_PIN, plc.OUTPUT)
@@ -2157,17 +2837,21 @@ class TemperatureControlPanel(QWidget):
         self._poll.start()
         self._update_status()
         self._command_state: Optional[bool] = None
+        self._command_styles: Optional[Tuple[str, str]] = None
         self._update_command_buttons()
 
     def _update_status(self):
         ready_state = self._read_ready_state()
-        if ready_state is None:
-            self.status_label.setText("Ready Signal: N/A")
-            self.status_label.setStyleSheet("color: #f97316; font-weight: 600;")
-        else:
-            self.status_label.setText(f"Ready Signal: {'ON' if ready_state else 'OFF'}")
-            color = "#22c55e" if ready_state else "#94a3b8"
-            self.status_label.setStyleSheet(f"color: {color}; font-weight: 600;")
+        # Only re-style on change; setStyleSheet forces a re-parse and repolish.
+        if ready_state is not self._last_ready_state or not self._status_rendered:
+            self._status_rendered = True
+            if ready_state is None:
+                self.status_label.setText("Ready Signal: N/A")
+                self.status_label.setStyleSheet("color: #f97316; font-weight: 600;")
+            else:
+                self.status_label.setText(f"Ready Signal: {'ON' if ready_state else 'OFF'}")
+                color = "#22c55e" if ready_state else "#94a3b8"
+                self.status_label.setStyleSheet(f"color: {color}; font-weight: 600;")
         if ready_state and self._last_ready_state is not True:
             emit_ui_log("Target Temperature Reached")
         self._last_ready_state = ready_state
@@ -2198,23 +2882,21 @@ class TemperatureControlPanel(QWidget):
 
     def _update_command_buttons(self):
         if hasattr(self, "signal_on_button") and hasattr(self, "signal_off_button"):
-            if not self._command_pin_ok:
-                self.signal_on_button.setEnabled(False)
-                self.signal_off_button.setEnabled(False)
-                self.signal_on_button.setStyleSheet(PRIMARY_BUTTON_STYLE)
-                self.signal_off_button.setStyleSheet(PRIMARY_BUTTON_STYLE)
-            else:
-                self.signal_on_button.setEnabled(True)
-                self.signal_off_button.setEnabled(True)
-                if self._command_state is True:
-                    self.signal_on_button.setStyleSheet(COMMAND_ON_ACTIVE_STYLE)
-                    self.signal_off_button.setStyleSheet(PRIMARY_BUTTON_STYLE)
-                elif self._command_state is False:
-                    self.signal_on_button.setStyleSheet(PRIMARY_BUTTON_STYLE)
-                    self.signal_off_button.setStyleSheet(COMMAND_OFF_ACTIVE_STYLE)
-                else:
-                    self.signal_on_button.setStyleSheet(PRIMARY_BUTTON_STYLE)
-                    self.signal_off_button.setStyleSheet(PRIMARY_BUTTON_STYLE)
+            enabled = self._command_pin_ok
+            self.signal_on_button.setEnabled(enabled)
+            self.signal_off_button.setEnabled(enabled)
+            on_style = off_style = PRIMARY_BUTTON_STYLE
+            if enabled and self._command_state is True:
+                on_style = COMMAND_ON_ACTIVE_STYLE
+            elif enabled and self._command_state is False:
+                off_style = COMMAND_OFF_ACTIVE_STYLE
+            # Only touch the button(s) whose style actually changed.
+            previous = self._command_styles or (None, None)
+            if on_style != previous[0]:
+                self.signal_on_button.setStyleSheet(on_style)
+            if off_style != previous[1]:
+                self.signal_off_button.setStyleSheet(off_style)
+            self._command_styles = (on_style, off_style)
 
     def force_stop(self):
         """Force the temperature command output low."""
@@ -2240,6 +2922,10 @@ class TemperatureControlPanel(QWidget):
         return None
 
     def _set_signal_indicator(self, state: Optional[bool]):
+        # Called on every poll; only restyle when the level actually changes.
+        # The constructor's initial False call always styles (state starts None).
+        if state is self._signal_state:
+            return
         self._signal_state = state
         if state is None:
             color = "#64748b"
@@ -2254,9 +2940,10 @@ class TemperatureControlPanel(QWidget):
 
 
 class MainWindow(QWidget):
-    log_signal = pyqtSignal(str)
     init_state_signal = pyqtSignal(bool)
     sequence_prompt_signal = pyqtSignal(str)
+    # Queued callable hop used by _invoke_ui from worker threads.
+    _ui_call_signal = pyqtSignal(object)
 
     def __init__(self):
         super().__init__()
@@ -2267,19 +2954,35 @@ class MainWindow(QWidget):
         plc.init("RPIPLC_V6", "RPIPLC_38AR")
 
         self.log_view: Optional[QPlainTextEdit] = None
+        # Mirror of the log view's lines; _flush_log pushes what is new.
+        self._log_lines: "deque[str]" = deque(maxlen=LOG_MAX_BLOCKS)
+        self._log_unflushed = 0
+        self._log_lock = threading.Lock()
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+        self._log_flush_timer.start()
         self.pid_panel: Optional[PIDValvePanel] = None
         self.peristaltic_panel: Optional[PeristalticPumpPanel] = None
         self.axis_controls: List[StepperAxisControl] = []
+        self._axis_by_name: Dict[str, StepperAxisControl] = {}
         self._peristaltic_sequence_adapter: Optional[_PeristalticSequenceAdapter] = None
         self._syringe_sequence_adapter: Optional[_SyringeSequenceAdapter] = None
         self._valve1_adapter: Optional[_RelayValveAdapter] = None
         self._valve2_adapter: Optional[_RelayValveAdapter] = None
         self._horizontal_lock_active = False
         self._horizontal_lock_message = ""
+        # Vertical-axis motion callbacks drive the interlock; this timer is only
+        # a slow fallback and runs only while the horizontal axis is locked.
         self._horizontal_lock_timer = QTimer(self)
-        self._horizontal_lock_timer.setInterval(1000)
+        self._horizontal_lock_timer.setInterval(5000)
         self._horizontal_lock_timer.timeout.connect(self._horizontal_lock_watchdog)
-        self._horizontal_lock_timer.start()
+        # Trailing-edge debounce for vertical motion bursts; the pre-move check
+        # still refreshes synchronously.
+        self._lock_refresh_timer = QTimer(self)
+        self._lock_refresh_timer.setSingleShot(True)
+        self._lock_refresh_timer.setInterval(30)
+        self._lock_refresh_timer.timeout.connect(self._refresh_horizontal_axis_lock)
         # SLF3S USB flow sensor on SCC1-USB cable
         self.flow_meter = SLF3SUSBFlowSensor(
             port=FLOW_SENSOR_PORT,
@@ -2292,9 +2995,13 @@ class MainWindow(QWidget):
         self.syringe_panel: Optional[SyringeControlPanel] = None
         self._init_running = False
         self._init_abort = threading.Event()
+        # Cleared while an Initialize run is in flight; set when it finishes.
+        self._init_done_event = threading.Event()
+        self._init_done_event.set()
         self._stop_event = threading.Event()
         self._sequence_lock = threading.Lock()
-        self._sequence_thread: Optional[threading.Thread] = None
+        # Set when the running sequence's worker finishes; None when idle.
+        self._sequence_done: Optional[threading.Event] = None
         self._sequence_name: Optional[str] = None
         self._sequence_cancel: Optional[Callable[[], None]] = None
         self.sequence1_button: Optional[QPushButton] = None
@@ -2302,8 +3009,8 @@ class MainWindow(QWidget):
         self.cleaning_button: Optional[QPushButton] = None
 
         register_ui_logger(self._append_log)
-        self.log_signal.connect(self._write_log_entry)
         self.init_state_signal.connect(self._apply_init_state)
+        self._ui_call_signal.connect(self._run_ui_call, Qt.QueuedConnection)
         # self.sequence_prompt_signal.connect(self._show_sequence_prompt_dialog)
         self._tasks = TaskManager(self._append_log)
         self._sequence_prompt_event = threading.Event()
@@ -2312,49 +3019,14 @@ class MainWindow(QWidget):
 
         self.pid_controller = PIDValveController(self._read_pid_feedback)
         self.relays: Optional[RelayBoard06] = None
-        self.relay_states: Dict[int, bool] = {channel: False for channel, _ in RELAY_OUTPUTS}
+        self.relay_states: Dict[int, bool] = dict.fromkeys(RELAY_CHANNELS, False)
         self.relay_buttons: Dict[int, RelayToggleButton] = {}
+        # Button refreshes from relay writes, coalesced into one UI flush.
+        self._pending_relay_updates: Dict[int, bool] = {}
+        self._relay_update_pending = False
+        self._relay_update_lock = threading.Lock()
 
-        self.setStyleSheet(
-            """
-            QWidget {
-                background-color: #0f172a;
-                color: #e2e8f0;
-                font-family: 'Segoe UI', 'Helvetica Neue', Arial, sans-serif;
-                font-size: 13px;
-            }
-            QLabel#panelTitle {
-                font-size: 14px;
-                font-weight: 600;
-                color: #f8fafc;
-                margin: 0;
-                padding: 0 0 6px 0;
-            }
-            QFrame#panel {
-                background-color: #1e293b;
-                border-radius: 12px;
-            }
-            QLineEdit {
-                background-color: #0f172a;
-                border: 1px solid #334155;
-                border-radius: 8px;
-                padding: 4px 10px;
-                color: #f8fafc;
-                font-weight: 500;
-            }
-            QLineEdit:focus {
-                border: 1px solid #38bdf8;
-            }
-            QPlainTextEdit {
-                background-color: #0f172a;
-                border: 1px solid #1e293b;
-                border-radius: 12px;
-                padding: 10px;
-                font-family: 'JetBrains Mono', 'SFMono', monospace;
-                font-size: 12px;
-            }
-            """
-        )
+        self.setStyleSheet(MAIN_WINDOW_QSS)
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(8, 8, 8, 12)
@@ -2409,6 +3081,8 @@ class MainWindow(QWidget):
             self.axis_controls.append(widget)
             motion_layout.addWidget(widget)
         motion_layout.addStretch()
+        # axis_controls is fixed after construction; freeze the name index once.
+        self._axis_by_name = {ctrl.name: ctrl for ctrl in self.axis_controls}
         self.syringe_panel = SyringeControlPanel(task_runner=self._tasks)
         self._syringe_sequence_adapter = _SyringeSequenceAdapter(self.syringe_panel)
         motion_layout.addWidget(self.syringe_panel)
@@ -2437,7 +3111,7 @@ class MainWindow(QWidget):
         ):
             button.setCursor(Qt.PointingHandCursor)
             button.setFocusPolicy(Qt.NoFocus)
-            button.setStyleSheet(PRIMARY_BUTTON_STYLE)
+            button.setProperty("class", "primary")
             button.setFixedHeight(32)
             button.clicked.connect(
                 lambda _, name=label: self._handle_sequence_placeholder(name)
@@ -2447,7 +3121,7 @@ class MainWindow(QWidget):
         self.cleaning_button = QPushButton("Cleaning Sequence")
         self.cleaning_button.setCursor(Qt.PointingHandCursor)
         self.cleaning_button.setFocusPolicy(Qt.NoFocus)
-        self.cleaning_button.setStyleSheet(PRIMARY_BUTTON_STYLE)
+        self.cleaning_button.setProperty("class", "primary")
         self.cleaning_button.setFixedHeight(32)
         self.cleaning_button.clicked.connect(self._start_cleaning_sequence)
         right_layout.addWidget(self.cleaning_button)
@@ -2458,7 +3132,7 @@ class MainWindow(QWidget):
 
         self.log_view = QPlainTextEdit()
         self.log_view.setReadOnly(True)
-        self.log_view.setMaximumBlockCount(400)
+        self.log_view.setMaximumBlockCount(LOG_MAX_BLOCKS)
         right_layout.addWidget(self.log_view, 1)
 
         right_layout.addSpacing(8)
@@ -2472,24 +3146,16 @@ class MainWindow(QWidget):
         self.stop_button = QPushButton("STOP ALL")
         self.stop_button.setCursor(Qt.PointingHandCursor)
         self.stop_button.setFocusPolicy(Qt.NoFocus)
-        self.stop_button.setStyleSheet(
-            "QPushButton {background-color: #dc2626; color: #f8fafc; font-weight: 700;"
-            "border: none; border-radius: 10px; padding: 10px 20px;}"
-            "QPushButton:pressed {background-color: #b91c1c;}"
-        )
+        self.stop_button.setObjectName("stopButton")
         self.stop_button.setFixedHeight(38)
         self.stop_button.clicked.connect(self._emergency_stop)
 
-        self.init_button = QPushButton("Initialize")
+        self.init_button = QPushButton(_INIT_LABELS[0])
         self.init_button.setCursor(Qt.PointingHandCursor)
         self.init_button.setFocusPolicy(Qt.NoFocus)
-        self.init_button.setStyleSheet(
-            "QPushButton {background-color: #22c55e; color: #0f172a; font-weight: 700;"
-            "border: none; border-radius: 10px; padding: 10px 20px;}"
-            "QPushButton:pressed {background-color: #16a34a;}"
-        )
+        self.init_button.setObjectName("initButton")
         self.init_button.setFixedHeight(38)
-        init_min_width = self.init_button.fontMetrics().horizontalAdvance("Initializing...") + 34
+        init_min_width = self.init_button.fontMetrics().horizontalAdvance(_INIT_LABELS[1]) + 34
         self.init_button.setMinimumWidth(init_min_width)
         self.init_button.clicked.connect(self._handle_initialize)
 
@@ -2514,28 +3180,50 @@ class MainWindow(QWidget):
         try:
             action()
         except Exception as exc:
-            emit_ui_log(f"[STOP] {label} error: {exc}")
+            emit_ui_log(f"[STOP] {label} error: {exc}", level=LogLevel.WARN)
 
     def _invoke_ui(self, func: Callable[[], None]):
         if threading.current_thread() is threading.main_thread():
             func()
         else:
-            QTimer.singleShot(0, func)
+            self._ui_call_signal.emit(func)
+
+    @pyqtSlot(object)
+    def _run_ui_call(self, func: Callable[[], None]):
+        func()
 
     def _emergency_stop(self):
-        emit_ui_log("EMERGENCY STOP triggered")
+        emit_ui_log("EMERGENCY STOP triggered", level=LogLevel.WARN)
         self._init_abort.set()
         self._stop_event.set()
         self._stop_active_sequence()
+        motor_stops = [
+            partial(self._safe_stop, axis.name, partial(axis.force_stop, quiet=True))
+            for axis in self.axis_controls
+        ]
+        if self.syringe_panel:
+            motor_stops.append(partial(self._safe_stop, "Syringe", self.syringe_panel.force_stop))
+        stops_done = threading.Event()
+        completed = [0]
+
+        def _run_motor_stops():
+            try:
+                for stop in motor_stops:
+                    stop()
+                    completed[0] += 1
+            finally:
+                stops_done.set()
+
+        _IO_WORKERS.submit(_run_motor_stops)
+        # PLC-driven outputs touch widgets, so they stay on the GUI thread.
         if self.pid_panel:
             self._safe_stop("PID panel", self.pid_panel.force_stop)
         if self.peristaltic_panel:
             self._safe_stop("Peristaltic pump", self.peristaltic_panel.force_stop)
-        if self.syringe_panel:
-            self._safe_stop("Syringe", self.syringe_panel.force_stop)
-        for axis in self.axis_controls:
-            self._safe_stop(axis.name, lambda ax=axis: ax.force_stop(quiet=True))
-        self._safe_stop("Relays", lambda: self._relays_all_off(auto=True))
+        if not stops_done.wait(EMERGENCY_STOP_WAIT_S):
+            pending = len(motor_stops) - completed[0]
+            emit_ui_log(f"[STOP] {pending} motor stop(s) still pending", level=LogLevel.WARN)
+        self._safe_stop("Relays", partial(self._relays_all_off, auto=True))
         if self.temperature_panel:
             self._safe_stop("Temperature controller", self.temperature_panel.force_stop)
         if getattr(self, "pid_controller", None):
@@ -2543,18 +3231,20 @@ class MainWindow(QWidget):
         if self._init_running:
             self._init_running = False
             self._set_init_enabled(True)
-        self._append_log("Emergency stop activated")
+        emit_ui_log("Emergency stop activated")
 
     def _handle_initialize(self):
         if self._init_running:
             emit_ui_log("Initialize already running")
             return
         self._stop_event.clear()
+        self._init_done_event.clear()
         self._init_running = True
         self._set_init_enabled(False)
         self._init_abort.clear()
         if not self._tasks.submit("Initialize", self._initialize_sequence):
             self._init_running = False
+            self._init_done_event.set()
             self._set_init_enabled(True)
 
     def _handle_sequence_placeholder(self, label: str):
@@ -2567,24 +3257,43 @@ class MainWindow(QWidget):
             return
         emit_ui_log(f"[{label}] sequence placeholder pressed (no action yet)")
 
-    def _register_sequence_runner(
+    def _sequence_active(self) -> bool:
+        done = self._sequence_done
+        return done is not None and not done.is_set()
+
+    def _launch_sequence(
         self,
         name: str,
-        thread: threading.Thread,
+        target: Callable[[], None],
         cancel_callback: Optional[Callable[[], None]] = None,
     ):
+        """Run target on a pooled worker under the single "Sequence" task slot."""
+        done = threading.Event()
+
+        def runner():
+            try:
+                target()
+            finally:
+                done.set()
+
         with self._sequence_lock:
-            self._sequence_thread = thread
+            self._sequence_done = done
             self._sequence_name = name
             self._sequence_cancel = cancel_callback
         self._stop_event.clear()
+        if not self._tasks.submit("Sequence", runner):
+            done.set()
+            with self._sequence_lock:
+                self._sequence_done = None
+                self._sequence_cancel = None
+                self._sequence_name = None
 
     def _stop_active_sequence(self):
         with self._sequence_lock:
-            thread = self._sequence_thread
+            done = self._sequence_done
             cancel_cb = self._sequence_cancel
             name = self._sequence_name
-        if not thread:
+        if not done:
             return
         emit_ui_log(f"[STOP] Canceling sequence {name or '(unnamed)'}")
         self._stop_event.set()
@@ -2596,22 +3305,21 @@ class MainWindow(QWidget):
 
         def _join_sequence():
             try:
-                thread.join(timeout=2.0)
-            except Exception as exc:
-                emit_ui_log(f"[STOP] Sequence join error: {exc}")
+                done.wait(timeout=2.0)
             finally:
                 with self._sequence_lock:
-                    self._sequence_thread = None
-                    self._sequence_cancel = None
-                    self._sequence_name = None
+                    if self._sequence_done is done:
+                        self._sequence_done = None
+                        self._sequence_cancel = None
+                        self._sequence_name = None
 
-        threading.Thread(target=_join_sequence, daemon=True).start()
+        _IO_WORKERS.submit(_join_sequence)
 
     # ----- Sequence 1 / MAF integration -----
 
     def _start_maf_sequence(self):
         with self._sequence_lock:
-            if self._sequence_thread and self._sequence_thread.is_alive():
+            if self._sequence_active():
                 emit_ui_log("[MAF] Sequence already running")
                 return
         emit_ui_log("Sequence 1 begin")
@@ -2620,9 +3328,7 @@ class MainWindow(QWidget):
         self._maf_start_flow_meter_ui()
 
         self._sequence_prompt_title = "Sequence 1 Step"
-        thread = threading.Thread(target=self._run_maf_sequence, daemon=True)
-        self._register_sequence_runner("MAF Sequence", thread, cancel_callback=self._cancel_maf_sequence)
-        thread.start()
+        self._launch_sequence("MAF Sequence", self._run_maf_sequence, cancel_callback=self._cancel_maf_sequence)
 
     def _cancel_maf_sequence(self):
         emit_ui_log("[MAF] Cancel requested")
@@ -2670,11 +3376,11 @@ class MainWindow(QWidget):
             )
             emit_ui_log("Sequence 1 complete")
         except Exception as exc:
-            emit_ui_log(f"[MAF] Sequence error: {exc}")
+            emit_ui_log(f"[MAF] Sequence error: {exc}", level=LogLevel.ERROR)
         finally:
             self._stop_event.clear()
             with self._sequence_lock:
-                self._sequence_thread = None
+                self._sequence_done = None
                 self._sequence_cancel = None
                 self._sequence_name = None
             self._sequence_prompt_title = "Sequence Step"
@@ -2683,7 +3389,7 @@ class MainWindow(QWidget):
 
     def _start_maf_sequence_v2(self):
         with self._sequence_lock:
-            if self._sequence_thread and self._sequence_thread.is_alive():
+            if self._sequence_active():
                 emit_ui_log("[MAF2] Sequence already running")
                 return
         emit_ui_log("Sequence 2 begin")
@@ -2692,13 +3398,11 @@ class MainWindow(QWidget):
         self._maf_start_flow_meter_ui()
 
         self._sequence_prompt_title = "Sequence 2 Step"
-        thread = threading.Thread(target=self._run_maf_sequence_v2, daemon=True)
-        self._register_sequence_runner(
+        self._launch_sequence(
             "MAF Sequence 2",
-            thread,
+            self._run_maf_sequence_v2,
             cancel_callback=self._cancel_maf_sequence_v2,
         )
-        thread.start()
 
     def _cancel_maf_sequence_v2(self):
         emit_ui_log("[MAF2] Cancel requested")
@@ -2765,11 +3469,11 @@ class MainWindow(QWidget):
             )
             emit_ui_log("Sequence 2 complete")
         except Exception as exc:
-            emit_ui_log(f"[MAF2] Sequence error: {exc}")
+            emit_ui_log(f"[MAF2] Sequence error: {exc}", level=LogLevel.ERROR)
         finally:
             self._stop_event.clear()
             with self._sequence_lock:
-                self._sequence_thread = None
+                self._sequence_done = None
             self._sequence_cancel = None
             self._sequence_name = None
         self._sequence_prompt_title = "Sequence Step"
@@ -2778,20 +3482,18 @@ class MainWindow(QWidget):
 
     def _start_cleaning_sequence(self):
         with self._sequence_lock:
-            if self._sequence_thread and self._sequence_thread.is_alive():
+            if self._sequence_active():
                 emit_ui_log("[Cleaning] Sequence already running")
                 return
         emit_ui_log("Cleaning sequence begin")
         # Keep elapsed timer in sync with sequences
         self._maf_start_flow_meter_ui()
         self._sequence_prompt_title = "Cleaning Step"
-        thread = threading.Thread(target=self._run_cleaning_sequence, daemon=True)
-        self._register_sequence_runner(
+        self._launch_sequence(
             "Cleaning Sequence",
-            thread,
+            self._run_cleaning_sequence,
             cancel_callback=self._cancel_cleaning_sequence,
         )
-        thread.start()
 
     def _cancel_cleaning_sequence(self):
         emit_ui_log("[Cleaning] Cancel requested")
@@ -2823,19 +3525,22 @@ class MainWindow(QWidget):
             )
             emit_ui_log("Cleaning sequence complete")
         except Exception as exc:
-            emit_ui_log(f"[Cleaning] Sequence error: {exc}")
+            emit_ui_log(f"[Cleaning] Sequence error: {exc}", level=LogLevel.ERROR)
         finally:
             self._stop_event.clear()
             with self._sequence_lock:
-                self._sequence_thread = None
+                self._sequence_done = None
                 self._sequence_cancel = None
                 self._sequence_name = None
             self._sequence_prompt_title = "Sequence Step"
 
     def _run_sequence_initialization(self, tag: str):
         emit_ui_log(f"[{tag}] Pre-sequence initialization start")
-        if self._init_running:
-            raise RuntimeError("Initialization already in progress")
+        if not self._init_done_event.is_set():
+            emit_ui_log(f"[{tag}] Waiting for running initialization to finish")
+        while not self._init_done_event.wait(timeout=0.25):
+            if self._stop_event.is_set():
+                raise RuntimeError(f"{tag} canceled while waiting for initialization")
         self._init_abort.clear()
         try:
             self._init_devices()
@@ -2931,22 +3636,17 @@ class MainWindow(QWidget):
         raise RuntimeError("Temperature controller ready timeout")
 
     def _maf_wait_for_maf_heating(self, duration: float = 10.0):    # 14 mins total = 840 sec (4 mins for MAF to reach temperature plus 10 mins for lising)
-        end = time.time() + duration
-        while time.time() < end:
-            if self._stop_event.is_set():
-                raise InterruptedError("Sequence canceled")
-            time.sleep(0.5)
+        if self._stop_event.wait(max(duration, 0.0)):
+            raise InterruptedError("Sequence canceled")
 
     def _maf_move_axis_to_preset(self, axis_name: str, preset_key: str):
         ctrl = self._get_axis_control(axis_name)
         if ctrl is None:
             raise RuntimeError(f"{axis_name} control unavailable")
         ctrl._check_pre_move(raise_on_block=True)
-        presets = AXIS_PRESET_POSITIONS.get(axis_name, {})
-        target_info = presets.get(preset_key)
-        if target_info is None:
+        target_mm = preset_mm(axis_name, preset_key)
+        if target_mm is None:
             raise RuntimeError(f"No preset '{preset_key}' configured for {axis_name}")
-        _, target_mm = target_info
         if not ctrl.driver.ready:
             raise RuntimeError(f"{axis_name} not connected")
         rpm = SEQUENCE_AXIS_SPEED_RPM
@@ -2996,7 +3696,7 @@ class MainWindow(QWidget):
             except Exception as exc:
                 emit_ui_log(f"[PID] Homing error after STOP: {exc}")
 
-        threading.Thread(target=_home, daemon=True).start()
+        _IO_WORKERS.submit(_home)
 
     def _home_pid_valve_blocking(self):
         """Home the PID valve synchronously for sequence steps."""
@@ -3016,11 +3716,13 @@ class MainWindow(QWidget):
         self.init_button.setEnabled(enabled)
         if hasattr(self, 'verify_checkbox') and self.verify_checkbox is not None:
             self.verify_checkbox.setEnabled(enabled)
+        label = _INIT_LABELS[0] if enabled else _INIT_LABELS[1]
+        if self.init_button.text() != label:
+            self.init_button.setText(label)
         if enabled:
-            self.init_button.setText('Initialize')
-            self.unsetCursor()
-        else:
-            self.init_button.setText('Initializing...')
+            if self.testAttribute(Qt.WA_SetCursor):
+                self.unsetCursor()
+        elif self.cursor().shape() != Qt.BusyCursor:
             self.setCursor(Qt.BusyCursor)
 
     def _initialize_sequence(self):
@@ -3032,10 +3734,11 @@ class MainWindow(QWidget):
             if self._init_abort.is_set():
                 emit_ui_log("Initialization aborted by user")
             else:
-                emit_ui_log(f"Initialization failed: {exc}")
+                emit_ui_log(f"Initialization failed: {exc}", level=LogLevel.ERROR)
         finally:
             self._set_init_enabled(True)
             self._init_running = False
+            self._init_done_event.set()
 
     def _check_init_abort(self):
         if self._init_abort.is_set():
@@ -3064,7 +3767,6 @@ class MainWindow(QWidget):
             except Exception as exc:
                 ok = False
                 emit_ui_log(f"[{driver.name}] init failed: {exc}")
-            self._invoke_ui(ctrl.refresh_ready_state)
             if not ok:
                 raise RuntimeError(f"{driver.name} unavailable (no response)")
             emit_ui_log(f"[{driver.name}] Ready")
@@ -3144,14 +3846,22 @@ class MainWindow(QWidget):
         self._refresh_horizontal_axis_lock()
 
     def _horizontal_lock_watchdog(self):
-        if self._horizontal_lock_active:
+        if self._horizontal_lock_active and not self._lock_refresh_timer.isActive():
             self._refresh_horizontal_axis_lock()
 
+    def _sync_horizontal_lock_timer(self):
+        if self._horizontal_lock_active:
+            if not self._horizontal_lock_timer.isActive():
+                self._horizontal_lock_timer.start()
+        else:
+            self._horizontal_lock_timer.stop()
+
     def _handle_vertical_motion_update(self):
+        # start() on an active timer restarts it, so a burst yields one refresh.
         if threading.current_thread() is threading.main_thread():
-            self._refresh_horizontal_axis_lock()
+            self._lock_refresh_timer.start()
         else:
-            self._invoke_ui(self._refresh_horizontal_axis_lock)
+            self._invoke_ui(self._lock_refresh_timer.start)
 
     def _horizontal_axis_precheck(self) -> bool:
         allowed = self._refresh_horizontal_axis_lock()
@@ -3171,6 +3881,7 @@ class MainWindow(QWidget):
         if horizontal:
             horizontal.set_safety_lock(not allowed, message)
         if state_changed:
+            self._invoke_ui(self._sync_horizontal_lock_timer)
             if not allowed:
                 emit_ui_log(message or "Horizontal axis locked by safety interlock")
             else:
@@ -3236,46 +3947,45 @@ class MainWindow(QWidget):
             self._relays_all_off(auto=False)
 
     def _get_axis_control(self, name: str) -> Optional["StepperAxisControl"]:
-        return next((ctrl for ctrl in self.axis_controls if ctrl.name == name), None)
+        return self._axis_by_name.get(name)
 
     def _connect_relays(self):
         try:
-            self.relays = RelayBoard06(port=RELAY_PORT, address=RELAY_ADDRESS)
+            self.relays = RelayBoard06(
+                port=RELAY_PORT, address=RELAY_ADDRESS, frame_gap=RELAY_COMMAND_DELAY
+            )
             emit_ui_log(f"Relay board ready on {RELAY_PORT} @ {RELAY_ADDRESS:#04x}")
         except Exception as exc:
             self.relays = None
             emit_ui_log(f"[Relays] board init failed: {exc}")
 
         # Reset relay states to known board channels only
-        self.relay_states = {ch: False for ch, _ in RELAY_OUTPUTS}
-        def _reset_buttons():
-            for ch in self.relay_states.keys():
-                self._update_relay_button(ch, False)
-        self._invoke_ui(_reset_buttons)
+        self.relay_states = dict.fromkeys(RELAY_CHANNELS, False)
+        self._queue_relay_buttons(dict.fromkeys(RELAY_CHANNELS, False))
         self._relays_all_off(auto=True)
 
     def _handle_relay_toggle(self, channel: int, state: bool) -> bool:
         return self._set_relay_state(channel, state)
 
     def _set_relay_state(self, channel: int, state: bool, quiet: bool = False) -> bool:
-        try:
-            if not self.relays:
-                raise RuntimeError("Relay board not initialized")
-            cmd = self.relays.on if state else self.relays.off
-            ok = bool(cmd(int(channel)))
-            if not ok:
-                raise RuntimeError("No ACK")
-        except Exception as exc:
+        relays = self.relays
+        error = None
+        if not relays:
+            error = "Relay board not initialized"
+        else:
+            try:
+                if not (relays.on if state else relays.off)(int(channel)):
+                    error = "No ACK"
+            except Exception as exc:
+                error = exc
+        if error is not None:
             if not quiet:
-                emit_ui_log(f"[Relay {channel}] error: {exc}")
-            fallback_state = self.relay_states.get(channel, False)
-            self._invoke_ui(
-                lambda ch=channel, st=fallback_state: self._update_relay_button(ch, st)
-            )
+                emit_ui_log(f"[Relay {channel}] error: {error}", level=LogLevel.WARN)
+            self._queue_relay_buttons({channel: self.relay_states.get(channel, False)})
             return False
 
         self.relay_states[channel] = state
-        self._invoke_ui(lambda ch=channel, st=state: self._update_relay_button(ch, st))
+        self._queue_relay_buttons({channel: state})
         if not quiet:
             emit_ui_log(f"[Relay {channel}] -> {'ON' if state else 'OFF'}")
         return True
@@ -3285,24 +3995,77 @@ class MainWindow(QWidget):
         if btn:
             btn.set_state(state)
 
-    def _relays_all_on(self):
-        ok = True
-        channels = sorted(self.relay_states.keys())
-        for idx, channel in enumerate(channels):
-            if not self._set_relay_state(channel, True):
-                ok = False
-            if idx < len(channels) - 1:
+    def _queue_relay_buttons(self, updates: Dict[int, bool]):
+        """Record button states; the first pending update schedules one flush."""
+        with self._relay_update_lock:
+            self._pending_relay_updates.update(updates)
+            if self._relay_update_pending:
+                return
+            self._relay_update_pending = True
+        self._ui_call_signal.emit(self._flush_relay_buttons)
+
+    def _flush_relay_buttons(self):
+        with self._relay_update_lock:
+            updates = self._pending_relay_updates
+            self._pending_relay_updates = {}
+            self._relay_update_pending = False
+        for channel, state in updates.items():
+            self._update_relay_button(channel, state)
+
+    def _set_relay_states(self, state: bool, quiet: bool = False) -> bool:
+        """Switch every known relay in one board transaction, per channel on failure."""
+        channels = RELAY_CHANNELS
+        updates = dict.fromkeys(channels, state)
+        try:
+            if not self.relays:
+                raise RuntimeError("Relay board not initialized")
+            if not self.relays.set_many(updates):
+                raise RuntimeError("No ACK")
+        except Exception as exc:
+            if not quiet:
+                emit_ui_log(f"[Relays] error: {exc}", level=LogLevel.WARN)
+            if not self.relays:
+                return False
+            # Bulk frame rejected: retry channel by channel, back to back.
+            failed = self._set_relay_bulk(updates)
+            if failed and not quiet:
+                emit_ui_log(f"[Relays] no ACK from channel(s) {', '.join(map(str, failed))}", level=LogLevel.WARN)
+            return not failed
+        self.relay_states.update(updates)
+        self._queue_relay_buttons(updates)
+        return True
+
+    def _set_relay_bulk(self, states: Dict[int, bool]) -> List[int]:
+        """Write each channel with its own frame; returns the channels that failed."""
+        relays = self.relays
+        if not relays:
+            return list(states)
+        on, off = relays.on, relays.off
+        failed: List[int] = []
+        applied: Dict[int, bool] = {}
+        for idx, (channel, state) in enumerate(states.items()):
+            if idx:
                 time.sleep(RELAY_COMMAND_DELAY)
+            try:
+                ok = (on if state else off)(channel)
+            except Exception:
+                ok = False
+            if ok:
+                applied[channel] = state
+            else:
+                failed.append(channel)
+        self.relay_states.update(applied)
+        # Failed channels fall back to their last known state.
+        applied.update((ch, self.relay_states.get(ch, False)) for ch in failed)
+        self._queue_relay_buttons(applied)
+        return failed
+
+    def _relays_all_on(self):
+        ok = self._set_relay_states(True)
         emit_ui_log(f"[Relays] ALL ON {'OK' if ok else 'incomplete'}")
 
     def _relays_all_off(self, auto: bool = False):
-        ok = True
-        channels = sorted(self.relay_states.keys())
-        for idx, channel in enumerate(channels):
-            if not self._set_relay_state(channel, False, quiet=auto):
-                ok = False
-            if idx < len(channels) - 1:
-                time.sleep(RELAY_COMMAND_DELAY)
+        ok = self._set_relay_states(False, quiet=auto)
         if not auto:
             emit_ui_log(f"[Relays] ALL OFF {'OK' if ok else 'incomplete'}")
 
@@ -3314,6 +4077,8 @@ class MainWindow(QWidget):
     ) -> Tuple[QWidget, QHBoxLayout]:
         container = QWidget()
         container.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        # One sheet for the whole grid instead of one parse per relay button.
+        container.setStyleSheet(RelayToggleButton.style_sheet(size))
         layout = QVBoxLayout(container)
         padding = 4 if title is None else 0
         bottom_padding = padding if title is None else 8
@@ -3337,6 +4102,7 @@ class MainWindow(QWidget):
                 label=label,
                 toggle_callback=self._handle_relay_toggle,
                 size=size,
+                apply_style=False,
             )
             btn.set_state(self.relay_states.get(channel, False))
             self.relay_buttons[channel] = btn
@@ -3353,7 +4119,7 @@ class MainWindow(QWidget):
         for btn in (all_on, all_off):
             btn.setCursor(Qt.PointingHandCursor)
             btn.setFocusPolicy(Qt.NoFocus)
-            btn.setStyleSheet(PRIMARY_BUTTON_STYLE)
+            btn.setProperty("class", "primary")
             btn.setFixedHeight(28)
         all_on.clicked.connect(self._relays_all_on)
         all_off.clicked.connect(self._relays_all_off)
@@ -3361,18 +4127,47 @@ class MainWindow(QWidget):
         ctrl_row.addWidget(all_off)
         return container, ctrl_row
 
+    def closeEvent(self, event):
+        """Stop timers and detach the UI logger before the window goes away."""
+        self._horizontal_lock_timer.stop()
+        self._lock_refresh_timer.stop()
+        self._tasks.shutdown()
+        register_ui_logger(None)
+        self._log_flush_timer.stop()
+        super().closeEvent(event)
+
     def _append_log(self, message: str):
+        # message may be a newline-joined batch from the log drainer.
         timestamp = time.strftime("%H:%M:%S")
-        entry = f"[{timestamp}] {message}"
+        lines = [f"[{timestamp}] {line}" for line in message.split("\n")]
         if self.log_view is None:
-            print(entry)
+            print("\n".join(lines))
             return
-        self.log_signal.emit(entry)
-
-    @pyqtSlot(str)
-    def _write_log_entry(self, entry: str):
-        if self.log_view:
-            self.log_view.appendPlainText(entry)
+        with self._log_lock:
+            self._log_lines.extend(lines)
+            self._log_unflushed += len(lines)
+
+    def _flush_log(self):
+        """Timer slot: push buffered lines to the view, at most once per tick."""
+        view = self.log_view
+        if view is None or not view.isVisible():
+            return
+        with self._log_lock:
+            pending = self._log_unflushed
+            if not pending:
+                return
+            self._log_unflushed = 0
+            total = len(self._log_lines)
+            if pending < total:
+                lines = list(islice(self._log_lines, total - pending, None))
+            else:
+                lines = list(self._log_lines)
+        if pending < total:
+            view.appendPlainText("\n".join(lines))
+        else:
+            # Everything on screen was rotated out: one replacement, not N appends.
+            view.setPlainText("\n".join(lines))
+            view.moveCursor(QTextCursor.End)
 
     def _read_pid_feedback(self) -> float:
         """Return latest flow feedback (mL/min) for PID control."""
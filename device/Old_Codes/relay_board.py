@@ -1,6 +1,9 @@
 # relay_board06.py
 import serial, struct, time
 
+_PDU_STRUCT = struct.Struct('>BBHH')  # addr, func, register, value
+_CRC_STRUCT = struct.Struct('<H')
+
 class RelayBoard06:
     """
     Modbus RTU relay board controlled with Function 0x06 (Write Single Register).
@@ -10,12 +13,14 @@ class RelayBoard06:
     - Open/Close all at register 0x0000 with 0x0700 / 0x0800
     """
     def __init__(self, port='/dev/ttySC2', address=0x02, baudrate=9600,
-                 parity=serial.PARITY_NONE, timeout=0.3):
+                 parity=serial.PARITY_NONE, timeout=0.3, frame_gap=0.08):
         self.port = port
         self.address = address
         self.baudrate = baudrate
         self.parity = parity
         self.timeout = timeout
+        # Pause between back-to-back frames; the board needs it on a shared bus.
+        self.frame_gap = frame_gap
 
     @staticmethod
     def _crc16_modbus(data: bytes) -> bytes:
@@ -24,7 +29,7 @@ class RelayBoard06:
             crc ^= b
             for _ in range(8):
                 crc = (crc >> 1) ^ 0xA001 if (crc & 1) else crc >> 1
-        return struct.pack('<H', crc)  # little-endian
+        return _CRC_STRUCT.pack(crc)  # little-endian
 
     def _open(self):
         ser = serial.Serial(
@@ -38,17 +43,26 @@ class RelayBoard06:
             pass
         return ser
 
-    def _write_register(self, reg: int, value: int) -> bool:
-        hi_reg, lo_reg = (reg >> 8) & 0xFF, reg & 0xFF
-        hi_val, lo_val = (value >> 8) & 0xFF, value & 0xFF
-        pdu = bytes([self.address, 0x06, hi_reg, lo_reg, hi_val, lo_val])
-        frame = pdu + self._crc16_modbus(pdu)
+    def _pdu(self, reg: int, value: int) -> bytes:
+        return _PDU_STRUCT.pack(self.address, 0x06, reg & 0xFFFF, value & 0xFFFF)
+
+    def _write_registers(self, writes) -> bool:
+        """Send several 0x06 writes over one port open; True only if all echo back."""
+        ok = True
         with self._open() as s:
             s.reset_input_buffer(); s.reset_output_buffer()
-            s.write(frame)
-            # Expect 8-byte echo for 0x06
-            resp = s.read(8)
-            return len(resp) == 8 and resp[:6] == pdu
+            for idx, (reg, value) in enumerate(writes):
+                if idx:
+                    time.sleep(self.frame_gap)
+                pdu = self._pdu(reg, value)
+                s.write(pdu + self._crc16_modbus(pdu))
+                # Expect 8-byte echo for 0x06
+                resp = s.read(8)
+                ok = ok and len(resp) == 8 and resp[:6] == pdu
+        return ok
+
+    def _write_register(self, reg: int, value: int) -> bool:
+        return self._write_registers(((reg, value),))
 
     # ---------- Public API ----------
     def on(self, relay_num: int) -> bool:
@@ -66,3 +80,20 @@ class RelayBoard06:
 
     def all_off(self) -> bool:
         return self._write_register(0x0000, 0x0800)
+
+    def set_many(self, states) -> bool:
+        """
+        Apply {relay_num: on} in as few frames as possible: the all-open/all-close
+        register when all 8 relays get the same state, otherwise one port open
+        for the per-relay writes.
+        """
+        states = dict(states)
+        for relay_num in states:
+            if not (1 <= relay_num <= 8):
+                raise ValueError("relay_num must be 1..8")
+        values = set(states.values())
+        if len(states) == 8 and len(values) == 1:
+            return self.all_on() if values.pop() else self.all_off()
+        return self._write_registers(
+            (relay_num, 0x0100 if on else 0x0200) for relay_num, on in sorted(states.items())
+        )
@@ -1,11 +1,61 @@
-from typing import Callable, Optional
-
-from domain.sleeper import InterruptibleSleeper
+from typing import Callable, Mapping, Optional
+import threading
+
+from domain.sequence_runner import (
+    SequenceAbort,
+    SequenceRunner,
+    call,
+    relay_off,
+    relay_on,
+    wait,
+)
+
+
+STEPS = (
+    call("Step 1: Initialization"),
+    call("Step 2: Move horizontal axis to FILTERING position", "move_horizontal_to_filtering"),
+    call("Step 3: Close plate (vertical axis)", "move_vertical_close_plate"),
+    relay_on("Step 4: Valve 4 CLOSED (Relay 4 ON)", 4),
+    call("Step 5: Enable peristaltic pump", "enable_peristaltic"),
+    call("Step 6: Close PID valve (wait 25 sec)", "close_pid", wait_after=25.0),
+    relay_off("Step 7: Valve 4 OPEN (Relay 4 OFF) (wait 3 sec)", 4, wait_after=3.0),
+    relay_on("Step 8: Valve 4 CLOSED (Relay 4 ON)", 4),
+    call("Step 9: Home PID valve", "home_pid"),
+    relay_on("Step 10: Valve 3 CLOSED (Relay 3 ON)", 3),
+    wait("Step 10: Wait 20 min", 20 * 60.0),
+    relay_off("Step 11: Valve 3 OPEN (Relay 3 OFF)", 3),
+    call("Step 13: Close PID valve", "close_pid"),
+    call("Step 12: Prompt message to change inlet to WATER"),
+    wait("Step 14: Wait 10 sec", 10.0),
+    relay_on("Step 15: Valve 3 CLOSED (Relay 3 ON)", 3),
+    call("Step 14: Home PID valve", "home_pid", wait_after=10.0),
+    call("Step 17: Close PID valve", "close_pid"),
+    relay_off("Step 16: Valve 3 OPEN (Relay 3 OFF) (wait 10 sec)", 3, wait_after=10.0),
+    relay_on("Step 15: Valve 3 CLOSED (Relay 3 ON)", 3),
+    call("Step 14: Home PID valve", "home_pid", wait_after=10.0),
+    call("Step 17: Close PID valve", "close_pid"),
+    relay_off("Step 16: Valve 3 OPEN (Relay 3 OFF) (wait 10 sec)", 3, wait_after=10.0),
+    relay_on("Step 22: Valve 3 CLOSED (Relay 3 ON)", 3),
+    relay_off("Step 23: Valve 4 OPEN (Relay 4 OFF) (wait 5 sec)", 4, wait_after=5.0),
+    relay_on("Step 24: Valve 4 CLOSED (Relay 4 ON)", 4),
+    relay_off("Step 25: Valve 3 OPEN (Relay 3 OFF)", 3),
+    call("Step 26: Prompt message to REMOVE inlet from water"),
+    call("Step 27: Switch peristaltic to HIGH speed for 30 sec", "pump_high_speed", wait_after=30.0),
+    call("Step 28: Home PID valve", "home_pid", wait_after=2.0),
+    call("Step 29: Close PID valve", "close_pid", wait_after=10.0),
+    call("Step 30: Home PID valve", "home_pid", wait_after=15.0),
+    call("Step 31: Close PID valve", "close_pid", wait_after=10.0),
+    call("Step 32: Stop peristaltic pump", "disable_peristaltic"),
+    call("Step 33: Home PID valve", "home_pid"),
+    relay_off("Step 34: Valve 4 OPEN (Relay 4 OFF)", 4),
+    call("Step 35: Open plate (vertical axis)", "move_vertical_open_plate"),
+    call("Step 36: Move horizontal axis to HOME position", "move_horizontal_to_home"),
+)
 
 
 def run_maf_cleaning_sequence(
     *,
-    stop_flag: Callable[[], bool],
+    stop_event: threading.Event,
     log: Optional[Callable[[str], None]] = None,
     relays=None,
     motor_pump=None,
@@ -16,26 +66,13 @@ def run_maf_cleaning_sequence(
     move_vertical_close_plate: Optional[Callable[[], None]] = None,
     move_vertical_open_plate: Optional[Callable[[], None]] = None,
     before_step: Optional[Callable[[str], None]] = None,
+    step_settle_s: Optional[Mapping[str, float]] = None,
 ):
     """
     MAF CLEANING SEQUENCE (ported from Old_Codes/Cleaning_Sequence(1).py).
     """
 
-    def _log(msg: str):
-        if log:
-            log(msg)
-        else:
-            print(msg)
-
-    sleeper = InterruptibleSleeper(stop_flag)
-
-    class SequenceAbort(Exception):
-        """Internal signal used to unwind the sequence safely."""
-
-    def check_stop() -> bool:
-        if not stop_flag():
-            return False
-        _log("[INFO] MAF cleaning sequence aborted by STOP.")
+    def _safe_outputs():
         try:
             if motor_pump is not None:
                 motor_pump.set_enabled(False)
@@ -48,58 +85,6 @@ def run_maf_cleaning_sequence(
                 pid_controller.set_enabled(False)
         except Exception:
             pass
-        return True
-
-    MIN_STEP_DELAY = 0.5
-    POST_COMMAND_DELAY = 0.2
-
-    def _wait_block(duration: float):
-        duration = max(duration, 0.0)
-        if duration == 0.0:
-            return
-        try:
-            sleeper.sleep(duration)
-        except InterruptedError:
-            check_stop()
-            raise SequenceAbort
-
-    def _run_step(
-        step_label: str,
-        action: Optional[Callable[[], None]] = None,
-        wait_after: float = MIN_STEP_DELAY,
-    ):
-        if before_step:
-            try:
-                before_step(step_label)
-            except InterruptedError:
-                check_stop()
-                raise SequenceAbort
-            except Exception as exc:
-                _log(f"[WARN] Step prompt failed ({step_label}): {exc}")
-
-        if check_stop():
-            raise SequenceAbort
-
-        _log(step_label)
-        success = True
-        if action:
-            try:
-                action()
-            except SequenceAbort:
-                raise
-            except InterruptedError:
-                check_stop()
-                raise SequenceAbort
-            except Exception as exc:
-                success = False
-                _log(f"[WARN] {step_label} failed: {exc}")
-                raise SequenceAbort
-
-        if success:
-            _log(f"{step_label} completed")
-
-        _wait_block(max(wait_after, MIN_STEP_DELAY))
-        _wait_block(POST_COMMAND_DELAY)
 
     def _enable_peristaltic():
         if motor_pump is None:
@@ -134,50 +119,34 @@ def run_maf_cleaning_sequence(
             raise RuntimeError("motor_pump object is required")
         motor_pump.set_speed_checked(False)
 
-    _log("=== MAF CLEANING sequence start ===")
+    runner = SequenceRunner(
+        name="MAF cleaning sequence",
+        stop_event=stop_event,
+        log=log,
+        relays=relays,
+        before_step=before_step,
+        settle_s=step_settle_s,
+        on_abort=_safe_outputs,
+        actions={
+            "enable_peristaltic": _enable_peristaltic,
+            "disable_peristaltic": _disable_peristaltic,
+            "pump_high_speed": _pid_high_speed,
+            "home_pid": _home_pid,
+            "close_pid": _close_pid,
+            "move_horizontal_to_filtering": move_horizontal_to_filtering,
+            "move_horizontal_to_home": move_horizontal_to_home,
+            "move_vertical_close_plate": move_vertical_close_plate,
+            "move_vertical_open_plate": move_vertical_open_plate,
+        },
+        post_command_delay=0.2,
+    )
+
+    runner.log("=== MAF CLEANING sequence start ===")
 
     try:
-        _run_step("Step 1: Initialization")
-        _run_step("Step 2: Move horizontal axis to FILTERING position", move_horizontal_to_filtering)
-        _run_step("Step 3: Close plate (vertical axis)", move_vertical_close_plate)
-        _run_step("Step 4: Valve 4 CLOSED (Relay 4 ON)", lambda: relays.on(4))
-        _run_step("Step 5: Enable peristaltic pump", _enable_peristaltic)
-        _run_step("Step 6: Close PID valve (wait 25 sec)", _close_pid, wait_after=25.0)
-        _run_step("Step 7: Valve 4 OPEN (Relay 4 OFF) (wait 3 sec)", lambda: relays.off(4), wait_after=3.0)
-        _run_step("Step 8: Valve 4 CLOSED (Relay 4 ON)", lambda: relays.on(4))
-        _run_step("Step 9: Home PID valve", _home_pid)
-        _run_step("Step 10: Valve 3 CLOSED (Relay 3 ON)", lambda: relays.on(3))
-        _run_step("Step 10: Wait 20 min", wait_after=20 * 60.0)
-        _run_step("Step 11: Valve 3 OPEN (Relay 3 OFF)", lambda: relays.off(3))
-        _run_step("Step 13: Close PID valve", _close_pid)
-        _run_step("Step 12: Prompt message to change inlet to WATER", action=None)
-        _run_step("Step 14: Wait 10 sec", wait_after=10.0)
-        _run_step("Step 15: Valve 3 CLOSED (Relay 3 ON)", lambda: relays.on(3))
-        _run_step("Step 14: Home PID valve", _home_pid, wait_after=10.0)
-        _run_step("Step 17: Close PID valve", _close_pid)
-        _run_step("Step 16: Valve 3 OPEN (Relay 3 OFF) (wait 10 sec)", lambda: relays.off(3), wait_after=10.0)
-        _run_step("Step 15: Valve 3 CLOSED (Relay 3 ON)", lambda: relays.on(3))
-        _run_step("Step 14: Home PID valve", _home_pid, wait_after=10.0)
-        _run_step("Step 17: Close PID valve", _close_pid)
-        _run_step("Step 16: Valve 3 OPEN (Relay 3 OFF) (wait 10 sec)", lambda: relays.off(3), wait_after=10.0)
-        _run_step("Step 22: Valve 3 CLOSED (Relay 3 ON)", lambda: relays.on(3))
-        _run_step("Step 23: Valve 4 OPEN (Relay 4 OFF) (wait 5 sec)", lambda: relays.off(4), wait_after=5.0)
-        _run_step("Step 24: Valve 4 CLOSED (Relay 4 ON)", lambda: relays.on(4))
-        _run_step("Step 25: Valve 3 OPEN (Relay 3 OFF)", lambda: relays.off(3))
-        _run_step("Step 26: Prompt message to REMOVE inlet from water", action=None)
-        _run_step("Step 27: Switch peristaltic to HIGH speed for 30 sec", _pid_high_speed, wait_after=30.0)
-        _run_step("Step 28: Home PID valve", _home_pid, wait_after=2.0)
-        _run_step("Step 29: Close PID valve", _close_pid, wait_after=10.0)
-        _run_step("Step 30: Home PID valve", _home_pid, wait_after=15.0)
-        _run_step("Step 31: Close PID valve", _close_pid, wait_after=10.0)
-        _run_step("Step 32: Stop peristaltic pump", _disable_peristaltic)
-        _run_step("Step 33: Home PID valve", _home_pid)
-        _run_step("Step 34: Valve 4 OPEN (Relay 4 OFF)", lambda: relays.off(4))
-        _run_step("Step 35: Open plate (vertical axis)", move_vertical_open_plate)
-        _run_step("Step 36: Move horizontal axis to HOME position", move_horizontal_to_home)
-
+        runner.run(STEPS)
     except SequenceAbort:
-        _log("=== MAF CLEANING sequence aborted ===")
+        runner.log("=== MAF CLEANING sequence aborted ===")
         return
 
-    _log("=== MAF CLEANING sequence complete ===")
+    runner.log("=== MAF CLEANING sequence complete ===")
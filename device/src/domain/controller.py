@@ -2,11 +2,18 @@ import threading
 import time
 import asyncio
 import json
+import logging
+from collections import deque
 import sys
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from typing import Callable, Optional
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 from hardware.relay_board import RelayBoard
 from hardware.syringe_pump import SyringePump
 from hardware.axis_driver import AxisDriver
@@ -21,8 +28,10 @@ from domain.sequence1 import run_maf_sampling_sequence
 from domain.sequence2 import run_sequence2
 from domain.cleaning_sequence import run_maf_cleaning_sequence
 
+logger = logging.getLogger(__name__)
+
 
-@dataclass
+@dataclass(slots=True)
 class DeviceState:
     state: str = "IDLE"  # IDLE, RUNNING, ERROR
     current_sequence: Optional[str] = None
@@ -57,6 +66,16 @@ class DeviceState:
     target_volume_ml: Optional[float] = None
 
 
+_STATE_FIELDS = tuple(f.name for f in fields(DeviceState))
+
+
+def _dumps_status(snapshot: dict) -> bytes:
+    if orjson is not None:
+        # relay_states is keyed by int channel; json.dumps stringifies those itself.
+        return orjson.dumps(snapshot, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(snapshot, separators=(",", ":")).encode("utf-8")
+
+
 class DeviceController:
     def __init__(self, config: DeviceConfig):
         self.config = config
@@ -85,7 +104,16 @@ class DeviceController:
         self._sequence_stop_timeout_s = 5.0
         self._state_lock = threading.Lock()
         self._log_lock = threading.Lock()
-        self._log_buffer: list[str] = []
+        self._log_buffer: deque[str] = deque(maxlen=100)
+        # Total lines ever appended; lets clients fetch only new log lines.
+        self._log_seq = 0
+        self._log_seq_synced = -1
+        # Set by _append_log; the status poller does the trailing broadcast.
+        self._log_broadcast_pending = False
+        self._snapshot_lock = threading.Lock()
+        self._status_snapshot: Optional[dict] = None
+        # Serialized snapshot; None until requested after the snapshot changed.
+        self._status_json: Optional[bytes] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._sse_subscribers: list[asyncio.Queue] = []
         # Serialize all physical motion (axes, syringe) across threads.
@@ -99,15 +127,21 @@ class DeviceController:
             "X": self._resolve_axis_limit(config.horizontal_axis.max_mm, 133.0),
         }
 
-        # Relay caches for UI feedback
+        # Relay caches for UI feedback; bump _relay_seq (via _store_relay_states)
+        # on every change so snapshots only re-copy the dict when it changed.
         self.relay_states = {ch: False for ch in range(1, 9)}
+        self._relay_seq = 0
+        self._relay_seq_synced = -1
 
         # --- Live syringe status polling ---
         self._syringe_poll_stop = threading.Event()
         self._syringe_poll_thread: Optional[threading.Thread] = None
+        # Set by the poller when the syringe goes ACTIVE -> IDLE; wakes move waits early.
+        self._syringe_idle_event = threading.Event()
         self._live_poll_stop = threading.Event()
         self._flow_poll_thread: Optional[threading.Thread] = None
         self._temp_poll_thread: Optional[threading.Thread] = None
+        self._status_poll_thread: Optional[threading.Thread] = None
 
         # Best-effort initial connections for axes
         try:
@@ -121,11 +155,44 @@ class DeviceController:
         self._start_syringe_poller(interval_s=0.25)
         self._start_flow_poller(interval_s=0.2)
         self._start_temp_poller(interval_s=0.5)
+        self._start_status_poller(interval_s=config.status_poll_ms / 1000.0)
 
     # ---------------------------------------------------
     # STATUS
     # ---------------------------------------------------
-    def get_status(self) -> dict:
+    def get_status(self, since: Optional[int] = None) -> dict:
+        """
+        Return the latest cached snapshot. It is rebuilt by the status poller and
+        on every broadcast, so API reads never contend with hardware pollers.
+        With since=<log_seq from a previous call>, logs holds only newer lines.
+        """
+        with self._snapshot_lock:
+            snapshot = self._status_snapshot
+        if snapshot is None:
+            snapshot = self._refresh_status_snapshot()
+        result = dict(snapshot)
+        if since is not None:
+            new_lines = max(0, result["log_seq"] - int(since))
+            logs = result["logs"]
+            result["logs"] = logs[len(logs) - min(new_lines, len(logs)):]
+        return result
+
+    def get_status_json(self) -> bytes:
+        """Serialized form of get_status(), re-encoded only when the snapshot changed."""
+        with self._snapshot_lock:
+            payload = self._status_json
+            snapshot = self._status_snapshot
+        if payload is not None:
+            return payload
+        if snapshot is None:
+            snapshot = self._refresh_status_snapshot()
+        payload = _dumps_status(snapshot)
+        with self._snapshot_lock:
+            if self._status_snapshot is snapshot:
+                self._status_json = payload
+        return payload
+
+    def _refresh_status_snapshot(self) -> dict:
         with self._state_lock:
             # Live flow/temperature are updated asynchronously by pollers.
             self.state.temp_enabled = self.temperature.state.enabled
@@ -138,9 +205,24 @@ class DeviceController:
             self.state.pid_setpoint = self.pid_valve.state.setpoint
             self.state.pid_hall = self.pid_valve.state.hall_state
             # update cached UI fields
-            self.state.relay_states = dict(self.relay_states)
-            self.state.logs = list(self._log_buffer)
-            snapshot = self._snapshot_unlocked()
+            if self._relay_seq_synced != self._relay_seq:
+                self.state.relay_states = dict(self.relay_states)
+                self._relay_seq_synced = self._relay_seq
+            with self._log_lock:
+                # Only re-copy the log buffer when lines were added/cleared.
+                if self._log_seq_synced != self._log_seq:
+                    self.state.logs = list(self._log_buffer)
+                    self._log_seq_synced = self._log_seq
+                # Sequence number of exactly the lines copied into state.logs.
+                log_seq = self._log_seq_synced
+            snapshot = self._snapshot_unlocked(log_seq)
+        with self._snapshot_lock:
+            previous = self._status_snapshot
+            if previous is not None and previous == snapshot:
+                # Keep the old object so the cached JSON stays valid.
+                return previous
+            self._status_snapshot = snapshot
+            self._status_json = None
         return snapshot
 
     def attach_event_loop(self, loop: asyncio.AbstractEventLoop) -> None:
@@ -229,8 +311,7 @@ class DeviceController:
             pass
         try:
             self.relays.all_off()
-            for ch in range(1, 9):
-                self.relay_states[ch] = False
+            self._store_relay_states(range(1, 9), False)
         except Exception:
             pass
         with self._state_lock:
@@ -260,10 +341,7 @@ class DeviceController:
         )
         self._log(f"[Relay] ALL {'ON' if enabled else 'OFF'}")
         if ok:
-            for ch in range(1, 9):
-                self.relay_states[ch] = enabled
-            with self._state_lock:
-                self.state.relay_states = dict(self.relay_states)
+            self._store_relay_states(range(1, 9), enabled)
             self._broadcast_status()
         return ok
 
@@ -405,10 +483,7 @@ class DeviceController:
             for attempt in range(1, 3):
                 if self._stop_event.is_set():
                     raise RuntimeError("Operation stopped")
-                self.syringe.goto_absolute(volume_ml, flow_ml_min)
-                ok = self.syringe.wait_until_at_target(
-                    timeout=120, stop_flag=self._stop_event.is_set
-                )
+                ok = self._goto_syringe_and_wait(volume_ml, flow_ml_min)
                 if ok:
                     break
                 if attempt >= 2:
@@ -418,6 +493,43 @@ class DeviceController:
         # Do not overwrite syringe_volume_ml here; poller updates it continuously.
         self._broadcast_status()
 
+    def _goto_syringe_and_wait(
+        self, volume_ml: float, flow_ml_min: float, timeout: float = 120.0
+    ) -> bool:
+        """
+        Command an absolute syringe move and block until it is at target.
+
+        The live poller already reads syringe status, so for most of the expected
+        travel time (distance / flow) we only wait on its idle edge instead of
+        issuing our own status reads; a confirmation pass follows.
+        Caller must hold _motion_lock.
+        """
+        with self._state_lock:
+            current_ml = self.state.syringe_volume_ml
+        expected_s = 0.0
+        if current_ml is not None and flow_ml_min:
+            expected_s = abs(volume_ml - current_ml) / abs(flow_ml_min) * 60.0
+        deadline = time.monotonic() + timeout
+
+        self._syringe_idle_event.clear()
+        self.syringe.goto_absolute(volume_ml, flow_ml_min)
+
+        quiet_until = time.monotonic() + min(expected_s * 0.8, timeout)
+        while not self._stop_event.is_set():
+            remaining = quiet_until - time.monotonic()
+            if remaining <= 0:
+                break
+            if self._syringe_idle_event.wait(min(remaining, 0.1)):
+                break
+        if self._stop_event.is_set():
+            return False
+
+        return self.syringe.wait_until_at_target(
+            timeout=max(0.0, deadline - time.monotonic()),
+            stop_flag=self._stop_event.is_set,
+            wake_event=self._syringe_idle_event,
+        )
+
     def _stop_syringe(self, force: bool = False) -> None:
         # Allow stopping even during homing sequence
         if not force and self.state.state == "RUNNING" and self.state.current_sequence != "homing":
@@ -449,9 +561,12 @@ class DeviceController:
             for attempt in range(1, 3):
                 if self._stop_event.is_set():
                     raise RuntimeError("Operation stopped")
+                self._syringe_idle_event.clear()
                 self.syringe.home(stop_flag=self._stop_event.is_set)
                 ok = self.syringe.wait_until_at_target(
-                    timeout=120, stop_flag=self._stop_event.is_set
+                    timeout=120,
+                    stop_flag=self._stop_event.is_set,
+                    wake_event=self._syringe_idle_event,
                 )
                 if ok:
                     break
@@ -593,13 +708,35 @@ class DeviceController:
         )
         self._temp_poll_thread.start()
 
+    def _start_status_poller(self, interval_s: float = 0.2) -> None:
+        if self._status_poll_thread and self._status_poll_thread.is_alive():
+            return
+        self._status_poll_thread = threading.Thread(
+            target=self._status_poller_loop, args=(interval_s,), daemon=True
+        )
+        self._status_poll_thread.start()
+
+    def _status_poller_loop(self, interval_s: float) -> None:
+        while not self._live_poll_stop.is_set():
+            with self._log_lock:
+                logs_pending, self._log_broadcast_pending = self._log_broadcast_pending, False
+            if logs_pending:
+                # Bursts of log lines share one snapshot rebuild/broadcast per poll.
+                self._broadcast_status()
+            else:
+                try:
+                    self._refresh_status_snapshot()
+                except Exception:
+                    pass
+            self._live_poll_stop.wait(max(0.05, interval_s))
+
     def _flow_poller_loop(self, interval_s: float) -> None:
         while not self._live_poll_stop.is_set():
             changed = False
             try:
                 flow = self.flow_sensor.read()
-                flow_ml_min = float(flow.get("flow_ml_min", 0.0))
-                total_ml = float(flow.get("total_ml", 0.0))
+                flow_ml_min = flow["flow_ml_min"]
+                total_ml = flow["total_ml"]
                 running = bool(self.flow_sensor.is_running())
                 err = self.flow_sensor.get_last_error()
 
@@ -629,11 +766,12 @@ class DeviceController:
         while not self._live_poll_stop.is_set():
             changed = False
             try:
-                current = self.temperature.read_current_c()
-                ready = self.temperature.read_ready()
-                enabled = bool(self.temperature.state.enabled)
-                target = float(self.temperature.state.target_c)
-                err = self.temperature.state.error
+                reading = self.temperature.snapshot()
+                current = reading.current_c
+                ready = reading.ready
+                enabled = bool(reading.enabled)
+                target = float(reading.target_c)
+                err = reading.error
                 with self._state_lock:
                     if self.state.temp_current_c != current:
                         self.state.temp_current_c = current
@@ -708,6 +846,8 @@ class DeviceController:
                     if is_active != self.state.syringe_busy:
                         self.state.syringe_busy = is_active
                         changed = True
+                        if not is_active:
+                            self._syringe_idle_event.set()
 
                     if volume_ml is not None:
                         try:
@@ -750,7 +890,7 @@ class DeviceController:
                 )
                 self._execute_sequence(
                     lambda: run_maf_sampling_sequence(
-                        stop_flag=self._stop_event.is_set,
+                        stop_event=self._stop_event,
                         reset_flow_totals=self._flow_reset,
                         start_flow_meter=self._flow_start,
                         stop_flow_meter=self._flow_stop,
@@ -777,6 +917,7 @@ class DeviceController:
                         stagnant_timeout_s=self.config.sequence1.stagnant_timeout_s,
                         stagnant_epsilon_ml=self.config.sequence1.stagnant_epsilon_ml,
                         before_step=self._before_step,
+                        step_settle_s=self._step_settle_s(),
                     )
                 )
             elif seq in {"sequence2", "seq2", "maf2"}:
@@ -787,7 +928,7 @@ class DeviceController:
                 )
                 self._execute_sequence(
                     lambda: run_sequence2(
-                        stop_flag=self._stop_event.is_set,
+                        stop_event=self._stop_event,
                         log=self._log,
                         relays=relay_adapter,
                         syringe=syringe_adapter,
@@ -806,12 +947,13 @@ class DeviceController:
                         stagnant_timeout_s=self.config.sequence2.stagnant_timeout_s,
                         stagnant_epsilon_ml=self.config.sequence2.stagnant_epsilon_ml,
                         before_step=self._before_step,
+                        step_settle_s=self._step_settle_s(),
                     )
                 )
             elif seq in {"cleaning", "clean", "cleaning_sequence"}:
                 self._execute_sequence(
                     lambda: run_maf_cleaning_sequence(
-                        stop_flag=self._stop_event.is_set,
+                        stop_event=self._stop_event,
                         log=self._log,
                         relays=relay_adapter,
                         motor_pump=self.peristaltic,
@@ -822,6 +964,7 @@ class DeviceController:
                         move_vertical_close_plate=self._move_vertical_preset("close"),
                         move_vertical_open_plate=self._move_vertical_preset("open"),
                         before_step=self._before_step,
+                        step_settle_s=self._step_settle_s(),
                     )
                 )
             else:
@@ -848,6 +991,15 @@ class DeviceController:
     def _execute_sequence(self, func: Callable[[], None]) -> None:
         func()
 
+    def _step_settle_s(self) -> dict:
+        timing = self.config.sequence_timing
+        return {
+            "action": timing.action_settle_s,
+            "syringe": timing.syringe_settle_s,
+            "port": timing.port_settle_s,
+            "relay": timing.relay_settle_s,
+        }
+
     def _before_step(self, step_label: str) -> None:
         with self._state_lock:
             self.state.sequence_step = step_label
@@ -856,18 +1008,18 @@ class DeviceController:
 
     def _log(self, message: str) -> None:
         self._append_log(message)
-        print(message)
+        logger.info("%s", message)
 
     def _append_log(self, message: str) -> None:
         with self._log_lock:
             self._log_buffer.append(message)
-            if len(self._log_buffer) > 100:
-                self._log_buffer = self._log_buffer[-100:]
-        self._broadcast_status()
+            self._log_seq += 1
+            self._log_broadcast_pending = True
 
     def clear_logs(self) -> None:
         with self._log_lock:
-            self._log_buffer = []
+            self._log_buffer.clear()
+            self._log_seq_synced = -1
         with self._state_lock:
             self.state.logs = []
         self._broadcast_status()
@@ -962,10 +1114,7 @@ class DeviceController:
             else:
                 for ch in range(1, 9):
                     self.relays.off(ch)
-            for ch in range(1, 9):
-                self.relay_states[ch] = False
-            with self._state_lock:
-                self.state.relay_states = dict(self.relay_states)
+            self._store_relay_states(range(1, 9), False)
             self._log("[Relays] All OFF before homing")
             self._broadcast_status()
             time.sleep(0.5)  # Allow relays to settle
@@ -1056,20 +1205,13 @@ class DeviceController:
 
         relay_gap_s = 0.15
 
-        for idx, ch in enumerate((6, 7)):
-            self._check_stop()
-            ok = self._retry_bool(
-                f"Relay R{ch} OFF (init)",
-                lambda ch=ch: self._set_relay(ch, False, allow_when_running=True),
-            )
-            if not ok:
-                raise RuntimeError(f"Relay R{ch} OFF failed during initialize")
-            # Small settle time between back-to-back relay writes on shared RS485.
-            if idx < 1:
-                end_gap = time.time() + relay_gap_s
-                while time.time() < end_gap:
-                    self._check_stop()
-                    time.sleep(0.02)
+        self._check_stop()
+        ok = self._retry_bool(
+            "Relays R6+R7 OFF (init)",
+            lambda: self._set_relays((6, 7), False),
+        )
+        if not ok:
+            raise RuntimeError("Relay R6/R7 OFF failed during initialize")
 
         hold_s = 4.0
         self._append_log(f"[Init] Holding {hold_s:.1f}s before turning R5 OFF")
@@ -1142,12 +1284,25 @@ class DeviceController:
         # Allow relay control even if a sequence is running.
         ok = self.relays.on(channel) if enabled else self.relays.off(channel)
         if ok:
-            self.relay_states[channel] = enabled
-            with self._state_lock:
-                self.state.relay_states = dict(self.relay_states)
+            self._store_relay_states((channel,), enabled)
+            self._broadcast_status()
+        return ok
+
+    def _set_relays(self, channels, enabled: bool) -> bool:
+        """Batched variant of _set_relay: one board transaction for several channels."""
+        chans = tuple(channels)
+        ok = self.relays.write_mask(chans, enabled)
+        if ok:
+            self._store_relay_states(chans, enabled)
             self._broadcast_status()
         return ok
 
+    def _store_relay_states(self, channels, enabled: bool) -> None:
+        with self._state_lock:
+            for ch in channels:
+                self.relay_states[ch] = enabled
+            self._relay_seq += 1
+
     def _ensure_manual_allowed(self) -> None:
         with self._state_lock:
             running = self.state.state == "RUNNING"
@@ -1267,19 +1422,31 @@ class DeviceController:
         self._home_horizontal_axis()
 
     def _broadcast_status(self) -> None:
-        if not self._loop or not self._sse_subscribers:
+        # Called from hardware, logging and sequence paths: never let a snapshot
+        # or serialization error propagate into the caller.
+        try:
+            self._refresh_status_snapshot()
+            if not self._loop or not self._sse_subscribers:
+                return
+            payload = self.get_status_json().decode("utf-8")
+        except Exception:
+            logger.exception("Status broadcast failed")
             return
-        with self._state_lock:
-            snapshot = self._snapshot_unlocked()
-        payload = json.dumps(snapshot)
         for q in list(self._sse_subscribers):
             try:
                 self._loop.call_soon_threadsafe(q.put_nowait, payload)
             except Exception:
                 continue
 
-    def _snapshot_unlocked(self) -> dict:
-        return {"device_id": self.config.device_id, **asdict(self.state)}
+    def _snapshot_unlocked(self, log_seq: int) -> dict:
+        # Shallow field copy: relay_states/logs are replaced (never mutated) on
+        # refresh, so the recursive deep copy asdict() makes is unnecessary.
+        state = self.state
+        snapshot = {"device_id": self.config.device_id}
+        for name in _STATE_FIELDS:
+            snapshot[name] = getattr(state, name)
+        snapshot["log_seq"] = log_seq
+        return snapshot
 
     def _maybe_force_detach_sequence(self) -> bool:
         """
@@ -1325,6 +1492,19 @@ class _RelayAdapter:
             raise RuntimeError(f"Relay R{channel} OFF failed")
         return ok
 
+    def write_mask(self, channels, on: bool) -> bool:
+        if self.stop_event.is_set():
+            raise RuntimeError("Operation stopped")
+        chans = tuple(channels)
+        label = "+".join(f"R{ch}" for ch in chans)
+        ok = self.controller._retry_bool(
+            f"Relays {label} {'ON' if on else 'OFF'} (sequence)",
+            lambda: self.controller._set_relays(chans, on),
+        )
+        if not ok:
+            raise RuntimeError(f"Relays {label} {'ON' if on else 'OFF'} failed")
+        return ok
+
 
 class _SyringeAdapter:
     """Adapter used by sequences to serialize syringe motion and allow STOP checks."""
@@ -1337,9 +1517,6 @@ class _SyringeAdapter:
         if self.stop_event.is_set():
             raise RuntimeError("Operation stopped")
         with self.controller._motion_lock:
-            self.controller.syringe.goto_absolute(volume_ml, flow_ml_min)
-            ok = self.controller.syringe.wait_until_at_target(
-                timeout=120, stop_flag=self.stop_event.is_set
-            )
+            ok = self.controller._goto_syringe_and_wait(volume_ml, flow_ml_min)
         if not ok:
             raise RuntimeError("Syringe move timed out")
@@ -1,12 +1,89 @@
-from typing import Callable, Optional
+from typing import Callable, Mapping, Optional
+import threading
 import time
 
-from domain.sleeper import InterruptibleSleeper
+from domain.sequence_runner import (
+    SequenceAbort,
+    SequenceRunner,
+    call,
+    port,
+    relay_off,
+    relay_on,
+    syringe_to,
+    wait,
+)
+
+
+def _rinse_cycle(i: int) -> tuple:
+    return (
+        port(f"Step 25.{i}: Rotary Valve -> Port 3", 3),
+        syringe_to(f"Step 26.{i}: Syringe -> 2.5 mL", 2.5),
+        port(f"Step 27.{i}: Rotary Valve -> Port 5", 5),
+        syringe_to(f"Step 28.{i}: Syringe -> 0.0 mL", 0.0),
+    )
+
+
+STEPS = (
+    # INITIAL AXIS POSITIONING
+    call("Step 1: Move X-Axis to FILTERING", "move_horizontal_to_filtering"),
+    call("Step 2: Close filter (vertical axis)", "move_vertical_close_plate"),
+    # MAIN OPERATIONS
+    port("Step 3: Rotary Valve -> Port 3", 3),
+    syringe_to("Step 4: Syringe -> 2.5 mL", 2.5),
+    port("Step 5: Rotary Valve -> Port 1", 1),
+    syringe_to("Step 6: Syringe -> 0.0 mL", 0.0),
+    port("Step 7: Rotary Valve -> Port 3", 3),
+    syringe_to("Step 8: Syringe -> 2.5 mL", 2.5),
+    port("Step 9: Rotary Valve -> Port 5", 5),
+    syringe_to("Step 10: Syringe -> 0.0 mL", 0.0),
+    port("Step 11: Rotary Valve -> Port 4", 4),
+    syringe_to("Step 12: Syringe -> 2.0 mL", 2.0),
+    port("Step 13: Rotary Valve -> Port 5", 5),
+    syringe_to("Step 14: Syringe -> 0.0 mL", 0.0),
+    relay_on("Step 15: Valve 1 ON", 1),
+    syringe_to("Step 16: Syringe -> 2.5 mL", 2.5),
+    # Optional wait (just a delay)
+    wait("Step 17: Optional wait", 1.0),
+    relay_off("Step 18: Valve 1 OFF", 1),
+    syringe_to("Step 19: Syringe -> 0.0 mL", 0.0),
+    port("Step 20: Rotary Valve -> Port 6", 6),
+    syringe_to("Step 21: Syringe -> 2.5 mL", 2.5),
+    port("Step 22: Rotary Valve -> Port 1", 1),
+    call(
+        "Step 23: Run flow until target reached (or >=92.5% + hold, or stagnant 20s)",
+        "run_flow",
+    ),
+    syringe_to("Step 24: Syringe -> 0.0 mL", 0.0),
+    # Repeat cycle
+    *_rinse_cycle(0),
+    *_rinse_cycle(1),
+    # Final yellow block
+    port("Step 29: Rotary Valve -> Port 3", 3),
+    syringe_to("Step 30: Syringe -> 1.0 mL", 1.0),
+    port("Step 31: Rotary Valve -> Port 5", 5),
+    relay_on("Step 32: Valve 2 ON", 2),
+    syringe_to("Step 33: Syringe -> 0.0 mL", 0.0),
+    relay_off("Step 34: Valve 2 OFF", 2),
+    # Post-rinse block
+    port("Step 35: Rotary Valve -> Port 4", 4),
+    syringe_to("Step 36: Syringe -> 2.5 mL", 2.5),
+    port("Step 37: Rotary Valve -> Port 5", 5),
+    syringe_to("Step 38: Syringe -> 0.0 mL", 0.0),
+    port("Step 39: Rotary Valve -> Port 4", 4),
+    syringe_to("Step 40: Syringe -> 1.0 mL", 1.0),
+    port("Step 41: Rotary Valve -> Port 5", 5),
+    relay_on("Step 42: Valve 2 ON", 2),
+    syringe_to("Step 43: Syringe -> 0.0 mL", 0.0),
+    relay_off("Step 44: Valve 2 OFF", 2),
+    # FINAL POSITIONING
+    call("Step 45: Open filter", "move_vertical_open_plate"),
+    call("Step 46: Move X-Axis HOME", "move_horizontal_home"),
+)
 
 
 def run_sequence2(
     *,
-    stop_flag: Callable[[], bool],
+    stop_event: threading.Event,
     log: Optional[Callable[[str], None]] = None,
     relays=None,  # expects .on(ch) / .off(ch)
     syringe=None,  # expects .goto_absolute(volume_ml, flow_ml_min)
@@ -20,6 +97,7 @@ def run_sequence2(
     stop_flow_meter: Optional[Callable[[], None]] = None,
     get_total_volume_ml: Optional[Callable[[], float]] = None,
     before_step: Optional[Callable[[str], None]] = None,
+    step_settle_s: Optional[Mapping[str, float]] = None,
     syringe_flow_ml_min: float = 2.0,
     target_volume_ml: float = 50.0,
     early_complete_ratio: float = 0.925,
@@ -29,69 +107,6 @@ def run_sequence2(
 ):
     """Sequence 2."""
 
-    def _log(msg: str):
-        if log:
-            log(msg)
-        else:
-            print(msg)
-
-    sleeper = InterruptibleSleeper(stop_flag)
-
-    class SequenceAbort(Exception):
-        pass
-
-    MIN_STEP_DELAY = 0.5
-
-    def _wait_block(duration: float):
-        duration = max(duration, 0.0)
-        if duration == 0:
-            return
-        try:
-            sleeper.sleep(duration)
-        except InterruptedError:
-            raise SequenceAbort
-
-    def _run_step(
-        step_label: str,
-        action: Optional[Callable[[], None]] = None,
-        wait_after: float = MIN_STEP_DELAY,
-    ):
-        if before_step:
-            try:
-                before_step(step_label)
-            except Exception:
-                raise SequenceAbort
-
-        if stop_flag():
-            _log("[INFO] Sequence 2 aborted by STOP.")
-            raise SequenceAbort
-
-        _log(step_label)
-        ok = True
-
-        if action:
-            try:
-                action()
-            except Exception as exc:
-                ok = False
-                _log(f"[WARN] {step_label} failed: {exc}")
-                raise SequenceAbort
-
-        if ok:
-            _log(f"{step_label} completed")
-
-        _wait_block(wait_after)
-
-    def _syringe_move(target_ml: float):
-        if syringe is None:
-            raise RuntimeError("Syringe unavailable")
-        syringe.goto_absolute(target_ml, float(syringe_flow_ml_min))
-
-    def _set_port(port: int):
-        if select_rotary_port is None:
-            raise RuntimeError("Rotary valve adapter unavailable")
-        select_rotary_port(port)
-
     def _stop_flow_meter_safe():
         if stop_flow_meter is None:
             return
@@ -100,9 +115,9 @@ def run_sequence2(
                 stop_flow_meter()
                 return
             except Exception as exc:
-                _log(f"[WARN] Stop flow meter failed (attempt {attempt}/3): {exc}")
-                _wait_block(0.2)
-        _log("[WARN] Stop flow meter failed after retries; continuing sequence")
+                runner.log(f"[WARN] Stop flow meter failed (attempt {attempt}/3): {exc}")
+                runner.wait(0.2)
+        runner.log("[WARN] Stop flow meter failed after retries; continuing sequence")
 
     def _volume_loop():
         if get_total_volume_ml is None:
@@ -113,21 +128,20 @@ def run_sequence2(
         stagnant_since: Optional[float] = None
 
         while True:
-            if stop_flag():
-                _log("[INFO] Sequence 2 aborted by STOP.")
+            if runner.check_stop():
                 raise SequenceAbort
             try:
                 total = float(get_total_volume_ml())
             except Exception:
                 total = 0.0
-            _log(f"  [Flow] Total volume = {total:.2f} mL")
+            runner.log(f"  [Flow] Total volume = {total:.2f} mL")
 
             if total >= early_threshold_ml:
-                _log(
+                runner.log(
                     f"  [Flow] Reached {early_complete_ratio * 100:.1f}% of target "
                     f"({total:.2f}/{target_volume_ml:.2f} mL). Holding {early_complete_wait_s:.1f}s."
                 )
-                _wait_block(early_complete_wait_s)
+                runner.wait(early_complete_wait_s)
                 break
 
             now = time.monotonic()
@@ -138,7 +152,7 @@ def run_sequence2(
                 if stagnant_since is None:
                     stagnant_since = now
                 if (now - stagnant_since) >= stagnant_timeout_s:
-                    _log(
+                    runner.log(
                         f"  [Flow] Total volume unchanged for {stagnant_timeout_s:.1f}s "
                         f"at {total:.2f} mL. Proceeding to next step."
                     )
@@ -146,7 +160,7 @@ def run_sequence2(
 
             if total >= target_volume_ml:
                 break
-            _wait_block(0.2)
+            runner.wait(0.2)
 
     def _run_flow_until_target_or_contingency():
         # If flow-meter adapters are not wired, preserve legacy behavior.
@@ -156,8 +170,8 @@ def run_sequence2(
             or stop_flow_meter is None
             or get_total_volume_ml is None
         ):
-            _log("[WARN] Flow meter adapters unavailable in Sequence 2; using fallback wait 1s.")
-            _wait_block(1.0)
+            runner.log("[WARN] Flow meter adapters unavailable in Sequence 2; using fallback wait 1s.")
+            runner.wait(1.0)
             return
 
         reset_flow_totals()
@@ -167,95 +181,33 @@ def run_sequence2(
         finally:
             _stop_flow_meter_safe()
 
-    _log("=== Sequence 2 start ===")
+    runner = SequenceRunner(
+        name="Sequence 2",
+        stop_event=stop_event,
+        log=log,
+        relays=relays,
+        syringe=syringe,
+        select_rotary_port=select_rotary_port,
+        before_step=before_step,
+        # Sequence 2 has always treated a failed step prompt as an abort.
+        abort_on_prompt_error=True,
+        settle_s=step_settle_s,
+        actions={
+            "move_horizontal_to_filtering": move_horizontal_to_filtering,
+            "move_vertical_close_plate": move_vertical_close_plate,
+            "move_vertical_open_plate": move_vertical_open_plate,
+            "move_horizontal_home": move_horizontal_home,
+            "run_flow": _run_flow_until_target_or_contingency,
+        },
+        syringe_flow_ml_min=syringe_flow_ml_min,
+    )
+
+    runner.log("=== Sequence 2 start ===")
 
     try:
-        # INITIAL AXIS POSITIONING
-        _run_step("Step 1: Move X-Axis to FILTERING", move_horizontal_to_filtering)
-        _run_step("Step 2: Close filter (vertical axis)", move_vertical_close_plate)
-
-        # MAIN OPERATIONS
-
-        _run_step("Step 3: Rotary Valve -> Port 3", lambda: _set_port(3))
-        _run_step("Step 4: Syringe -> 2.5 mL", lambda: _syringe_move(2.5))
-
-        _run_step("Step 5: Rotary Valve -> Port 1", lambda: _set_port(1))
-        _run_step("Step 6: Syringe -> 0.0 mL", lambda: _syringe_move(0.0))
-
-        _run_step("Step 7: Rotary Valve -> Port 3", lambda: _set_port(3))
-        _run_step("Step 8: Syringe -> 2.5 mL", lambda: _syringe_move(2.5))
-
-        _run_step("Step 9: Rotary Valve -> Port 5", lambda: _set_port(5))
-        _run_step("Step 10: Syringe -> 0.0 mL", lambda: _syringe_move(0.0))
-
-        _run_step("Step 11: Rotary Valve -> Port 4", lambda: _set_port(4))
-        _run_step("Step 12: Syringe -> 2.0 mL", lambda: _syringe_move(2.0))
-
-        _run_step("Step 13: Rotary Valve -> Port 5", lambda: _set_port(5))
-        _run_step("Step 14: Syringe -> 0.0 mL", lambda: _syringe_move(0.0))
-
-        # Valve 1 ON
-        _run_step("Step 15: Valve 1 ON", lambda: relays.on(1))
-
-        _run_step("Step 16: Syringe -> 2.5 mL", lambda: _syringe_move(2.5))
-
-        # Optional wait (just a delay)
-        _run_step("Step 17: Optional wait", None, wait_after=1.0)
-
-        _run_step("Step 18: Valve 1 OFF", lambda: relays.off(1))
-        _run_step("Step 19: Syringe -> 0.0 mL", lambda: _syringe_move(0.0))
-
-        _run_step("Step 20: Rotary Valve -> Port 6", lambda: _set_port(6))
-        _run_step("Step 21: Syringe -> 2.5 mL", lambda: _syringe_move(2.5))
-
-        _run_step("Step 22: Rotary Valve -> Port 1", lambda: _set_port(1))
-
-        _run_step(
-            "Step 23: Run flow until target reached (or >=92.5% + hold, or stagnant 20s)",
-            _run_flow_until_target_or_contingency,
-        )
-
-        _run_step("Step 24: Syringe -> 0.0 mL", lambda: _syringe_move(0.0))
-
-        # Repeat cycle
-        for i in range(2):
-            _run_step(f"Step 25.{i}: Rotary Valve -> Port 3", lambda: _set_port(3))
-            _run_step(f"Step 26.{i}: Syringe -> 2.5 mL", lambda: _syringe_move(2.5))
-            _run_step(f"Step 27.{i}: Rotary Valve -> Port 5", lambda: _set_port(5))
-            _run_step(f"Step 28.{i}: Syringe -> 0.0 mL", lambda: _syringe_move(0.0))
-
-        # Final yellow block
-        _run_step("Step 29: Rotary Valve -> Port 3", lambda: _set_port(3))
-        _run_step("Step 30: Syringe -> 1.0 mL", lambda: _syringe_move(1.0))
-
-        _run_step("Step 31: Rotary Valve -> Port 5", lambda: _set_port(5))
-
-        _run_step("Step 32: Valve 2 ON", lambda: relays.on(2))
-        _run_step("Step 33: Syringe -> 0.0 mL", lambda: _syringe_move(0.0))
-        _run_step("Step 34: Valve 2 OFF", lambda: relays.off(2))
-
-        # Post-rinse block
-        _run_step("Step 35: Rotary Valve -> Port 4", lambda: _set_port(4))
-        _run_step("Step 36: Syringe -> 2.5 mL", lambda: _syringe_move(2.5))
-
-        _run_step("Step 37: Rotary Valve -> Port 5", lambda: _set_port(5))
-        _run_step("Step 38: Syringe -> 0.0 mL", lambda: _syringe_move(0.0))
-
-        _run_step("Step 39: Rotary Valve -> Port 4", lambda: _set_port(4))
-        _run_step("Step 40: Syringe -> 1.0 mL", lambda: _syringe_move(1.0))
-
-        _run_step("Step 41: Rotary Valve -> Port 5", lambda: _set_port(5))
-
-        _run_step("Step 42: Valve 2 ON", lambda: relays.on(2))
-        _run_step("Step 43: Syringe -> 0.0 mL", lambda: _syringe_move(0.0))
-        _run_step("Step 44: Valve 2 OFF", lambda: relays.off(2))
-
-        # FINAL POSITIONING
-        _run_step("Step 45: Open filter", move_vertical_open_plate)
-        _run_step("Step 46: Move X-Axis HOME", move_horizontal_home)
-
+        runner.run(STEPS)
     except SequenceAbort:
-        _log("=== Sequence 2 aborted ===")
+        runner.log("=== Sequence 2 aborted ===")
         return
 
-    _log("=== Sequence 2 complete ===")
+    runner.log("=== Sequence 2 complete ===")
@@ -0,0 +1,253 @@
+"""Shared step runner for the automated sequences."""
+
+import logging
+import threading
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Callable, Mapping, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+MIN_STEP_DELAY = 0.5
+
+# Default minimum settle per step category. Relay/valve steps keep the same
+# settle as every other hardware step (valves need time to actuate); only
+# plain wait steps skip it.
+DEFAULT_SETTLE_S = {
+    "action": MIN_STEP_DELAY,
+    "syringe": MIN_STEP_DELAY,
+    "port": MIN_STEP_DELAY,
+    "relay": MIN_STEP_DELAY,
+}
+
+
+class Op(IntEnum):
+    CALL = 0
+    RELAY_ON = 1
+    RELAY_OFF = 2
+    RELAYS = 3
+    PORT = 4
+    SYRINGE = 5
+    WAIT = 6
+
+
+# Settle category per opcode, indexed by Op (None = no settle floor).
+_OP_CATEGORY = ("action", "relay", "relay", "relay", "port", "syringe", None)
+
+
+class SequenceAbort(Exception):
+    """Internal signal used to unwind a sequence safely."""
+
+
+@dataclass(frozen=True)
+class Step:
+    # May reference runner params as {name}; formatted when the step runs.
+    label: str
+    op: Op
+    args: tuple = ()
+    # Seconds, or the name of a runner param holding the seconds.
+    wait_after: Union[float, str] = 0.0
+    # Per-step settle floor; None uses the runner's default for the step category.
+    min_wait_after: Optional[float] = None
+
+
+def call(
+    label: str,
+    name: Optional[str] = None,
+    wait_after: Union[float, str] = 0.0,
+    min_wait_after: Optional[float] = None,
+) -> Step:
+    """Run the named action from the sequence's action map (None = log only)."""
+    return Step(label, Op.CALL, (name,), wait_after, min_wait_after)
+
+
+def relay_on(label: str, channel: int, wait_after: float = 0.0) -> Step:
+    return Step(label, Op.RELAY_ON, (channel,), wait_after)
+
+
+def relay_off(label: str, channel: int, wait_after: float = 0.0) -> Step:
+    return Step(label, Op.RELAY_OFF, (channel,), wait_after)
+
+
+def relays_set(label: str, channels: tuple, on: bool, wait_after: float = 0.0) -> Step:
+    """Switch several relay channels in one board transaction."""
+    return Step(label, Op.RELAYS, (tuple(channels), on), wait_after)
+
+
+def port(label: str, number: int, wait_after: float = 0.0) -> Step:
+    return Step(label, Op.PORT, (number,), wait_after)
+
+
+def syringe_to(
+    label: str,
+    volume_ml: float,
+    flow_ml_min: Optional[float] = None,
+    wait_after: float = 0.0,
+) -> Step:
+    """Absolute syringe move; flow None uses the runner's default syringe flow."""
+    return Step(label, Op.SYRINGE, (volume_ml, flow_ml_min), wait_after)
+
+
+def wait(label: str, seconds: Union[float, str]) -> Step:
+    return Step(label, Op.WAIT, (), seconds, 0.0)
+
+
+class SequenceRunner:
+    """
+    Executes a step table against the hardware adapters.
+
+    Each step: before_step prompt -> STOP check -> action -> wait_after,
+    floored at the step's settle time. Steps with a non-zero settle also
+    get post_command_delay; plain waits do not.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        stop_event: threading.Event,
+        log: Optional[Callable[[str], None]] = None,
+        relays=None,
+        syringe=None,
+        select_rotary_port: Optional[Callable[[int], None]] = None,
+        before_step: Optional[Callable[[str], None]] = None,
+        on_abort: Optional[Callable[[], None]] = None,
+        actions: Optional[Mapping[str, Optional[Callable[[], None]]]] = None,
+        params: Optional[Mapping[str, float]] = None,
+        syringe_flow_ml_min: float = 1.0,
+        settle_s: Optional[Mapping[str, float]] = None,
+        post_command_delay: float = 0.0,
+        abort_on_prompt_error: bool = False,
+    ) -> None:
+        self.name = name
+        self.stop_event = stop_event
+        self._log_fn = log
+        self.relays = relays
+        self.syringe = syringe
+        self.select_rotary_port = select_rotary_port
+        self.before_step = before_step
+        self.on_abort = on_abort
+        self.actions = dict(actions or {})
+        self.params = dict(params or {})
+        self.syringe_flow_ml_min = float(syringe_flow_ml_min)
+        self.settle_s = dict(DEFAULT_SETTLE_S)
+        if settle_s:
+            self.settle_s.update(settle_s)
+        self.post_command_delay = float(post_command_delay)
+        self.abort_on_prompt_error = abort_on_prompt_error
+
+    def log(self, msg: str) -> None:
+        if self._log_fn:
+            self._log_fn(msg)
+        else:
+            logger.info("%s", msg)
+
+    def check_stop(self) -> bool:
+        """Return True (after putting outputs in a safe state) if STOP is requested."""
+        if not self.stop_event.is_set():
+            return False
+        self.log(f"[INFO] {self.name} aborted by STOP.")
+        if self.on_abort:
+            try:
+                self.on_abort()
+            except Exception:
+                pass
+        return True
+
+    def wait(self, duration: float) -> None:
+        duration = max(duration, 0.0)
+        if duration == 0.0:
+            return
+        if self.stop_event.wait(duration):
+            self.check_stop()
+            raise SequenceAbort
+
+    def run(self, steps) -> None:
+        """Run every step in order; raises SequenceAbort on STOP or step failure."""
+        for step in steps:
+            self.run_step(step)
+
+    def run_step(self, step: Step) -> None:
+        label = step.label
+        if self.params and "{" in label:
+            label = label.format_map(self.params)
+        if self.before_step:
+            try:
+                self.before_step(label)
+            except InterruptedError:
+                self.check_stop()
+                raise SequenceAbort
+            except Exception as exc:
+                if self.abort_on_prompt_error:
+                    raise SequenceAbort
+                self.log(f"[WARN] Step prompt failed ({label}): {exc}")
+        if self.check_stop():
+            raise SequenceAbort
+        self.log(label)
+        try:
+            _OP_TABLE[step.op](self, *step.args)
+        except SequenceAbort:
+            raise
+        except InterruptedError:
+            self.check_stop()
+            raise SequenceAbort
+        except Exception as exc:
+            self.log(f"[WARN] {label} failed: {exc}")
+            raise SequenceAbort
+        self.log(f"{label} completed")
+        wait_after = step.wait_after
+        if isinstance(wait_after, str):
+            wait_after = float(self.params[wait_after])
+        settle = step.min_wait_after
+        if settle is None:
+            settle = self.settle_s.get(_OP_CATEGORY[step.op], 0.0)
+        self.wait(max(wait_after, settle))
+        if settle > 0.0:
+            self.wait(self.post_command_delay)
+
+    # Opcode handlers ---------------------------------------------
+    def _op_call(self, name: Optional[str]) -> None:
+        action = self.actions.get(name) if name else None
+        if action:
+            action()
+
+    def _op_relay_on(self, channel: int) -> None:
+        self._require_relays().on(channel)
+
+    def _op_relay_off(self, channel: int) -> None:
+        self._require_relays().off(channel)
+
+    def _op_relays(self, channels: tuple, on: bool) -> None:
+        self._require_relays().write_mask(channels, on)
+
+    def _op_port(self, number: int) -> None:
+        if self.select_rotary_port is None:
+            raise RuntimeError("Rotary valve adapter unavailable")
+        self.select_rotary_port(number)
+
+    def _op_syringe(self, volume_ml: float, flow_ml_min: Optional[float]) -> None:
+        if self.syringe is None:
+            raise RuntimeError("Syringe adapter unavailable")
+        if flow_ml_min is None:
+            flow_ml_min = self.syringe_flow_ml_min
+        self.syringe.goto_absolute(volume_ml, flow_ml_min)
+
+    def _op_wait(self) -> None:
+        pass
+
+    def _require_relays(self):
+        if self.relays is None:
+            raise RuntimeError("Relay adapter unavailable")
+        return self.relays
+
+
+# Dispatch table indexed by Op; order must match the enum values.
+_OP_TABLE = (
+    SequenceRunner._op_call,
+    SequenceRunner._op_relay_on,
+    SequenceRunner._op_relay_off,
+    SequenceRunner._op_relays,
+    SequenceRunner._op_port,
+    SequenceRunner._op_syringe,
+    SequenceRunner._op_wait,
+)
@@ -1,24 +1,47 @@
+import importlib.util
+import sys
 import threading
+from operator import itemgetter
 from typing import Optional
 from pathlib import Path
-import sys
 
 from infra.config import FlowSensorConfig
 
-_OLD_CODES = Path(__file__).resolve().parents[2] / "Old_Codes"
-if str(_OLD_CODES) not in sys.path:
-    sys.path.append(str(_OLD_CODES))
+# The SLF3S driver lives with the legacy GUI (which imports it by name), so it
+# is loaded from its file rather than by adding Old_Codes to sys.path.
+_SLF3S_PATH = Path(__file__).resolve().parents[2] / "Old_Codes" / "slf3s_usb_sensor.py"
+
+
+def _load_slf3s_driver():
+    module = sys.modules.get("slf3s_usb_sensor")
+    if module is None:
+        spec = importlib.util.spec_from_file_location("slf3s_usb_sensor", _SLF3S_PATH)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["slf3s_usb_sensor"] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop("slf3s_usb_sensor", None)
+            raise
+    return module.SLF3SUSBFlowSensor
+
 
 try:
-    from slf3s_usb_sensor import SLF3SUSBFlowSensor  # type: ignore
+    SLF3SUSBFlowSensor = _load_slf3s_driver()
 except Exception:
     SLF3SUSBFlowSensor = None
 
 
 class FlowSensor:
+    __slots__ = ("config", "_sensor", "_read", "_running", "_lock", "_last_error", "_last_data")
+
+    # The SLF3S driver already returns floats for these keys.
+    _FIELDS = itemgetter("flow_ml_min", "total_ml", "total_l")
+
     def __init__(self, config: FlowSensorConfig) -> None:
         self.config = config
         self._sensor = None
+        self._read = None
         self._running = False
         self._lock = threading.Lock()
         self._last_error: Optional[str] = None
@@ -44,6 +67,7 @@ class FlowSensor:
             stale_seconds=self.config.stale_seconds,
             auto_start=False,
         )
+        self._read = self._sensor.read
         return self._sensor
 
     def start(self) -> None:
@@ -73,14 +97,14 @@ class FlowSensor:
 
     def read(self) -> dict:
         with self._lock:
-            if self._sensor is None:
+            if self._read is None:
                 return dict(self._last_data)
             try:
-                data = self._sensor.read()
+                flow_ml_min, total_ml, total_l = self._FIELDS(self._read())
                 self._last_data = {
-                    "flow_ml_min": float(data.get("flow_ml_min", 0.0)),
-                    "total_ml": float(data.get("total_ml", 0.0)),
-                    "total_l": float(data.get("total_l", 0.0)),
+                    "flow_ml_min": flow_ml_min,
+                    "total_ml": total_ml,
+                    "total_l": total_l,
                 }
                 self._last_error = None
                 return dict(self._last_data)
@@ -107,4 +131,5 @@ class FlowSensor:
             except Exception:
                 pass
             self._sensor = None
+            self._read = None
             self._running = False
@@ -5,11 +5,11 @@ import threading
 import serial
 
 from infra.config import PeristalticConfig
-from hardware.plc_utils import plc, safe_plc_call, ensure_plc_init
+from hardware.plc_utils import plc, safe_plc_call, safe_plc_call_many, ensure_plc_init
 from hardware.syringe_pump import SyringePump
 
 
-@dataclass
+@dataclass(slots=True)
 class PeristalticState:
     enabled: bool = False
     direction_forward: bool = True
@@ -22,9 +22,9 @@ class PeristalticPump:
         self.state = PeristalticState()
         ensure_plc_init()
         if plc:
-            for pin in (config.enable_pin, config.dir_reverse_pin, config.speed_pin):
-                safe_plc_call("pin_mode", plc.pin_mode, pin, plc.OUTPUT)
-                safe_plc_call("digital_write", plc.digital_write, pin, False)
+            pins = (config.enable_pin, config.dir_reverse_pin, config.speed_pin)
+            safe_plc_call_many("pin_mode", plc.pin_mode, [(pin, plc.OUTPUT) for pin in pins])
+            safe_plc_call_many("digital_write", plc.digital_write, [(pin, False) for pin in pins])
 
     def _port_lock(self) -> threading.Lock:
         key = str(self.config.dir_driver_port)
@@ -85,6 +85,7 @@ class PeristalticPump:
                 ser.reset_input_buffer()
                 ser.reset_output_buffer()
                 ser.write(frame)
+                ser.flush()
                 ser.read(8)
 
     def set_enabled(self, enabled: bool) -> None:
@@ -6,10 +6,10 @@ from typing import Callable, Optional
 from simple_pid import PID
 
 from infra.config import PidValveConfig
-from hardware.plc_utils import plc, safe_plc_call, ensure_plc_init
+from hardware.plc_utils import plc, safe_plc_call, safe_plc_call_many, ensure_plc_init
 
 
-@dataclass
+@dataclass(slots=True)
 class PidValveState:
     enabled: bool = False
     setpoint: float = 1.0
@@ -27,9 +27,16 @@ class PidValveController:
 
         ensure_plc_init()
         if plc:
-            for pin in (config.step_pin, config.dir_pin, config.en_pin):
-                safe_plc_call("pin_mode", plc.pin_mode, pin, plc.OUTPUT)
-            safe_plc_call("pin_mode", plc.pin_mode, config.hall_pin, plc.INPUT)
+            safe_plc_call_many(
+                "pin_mode",
+                plc.pin_mode,
+                [
+                    (config.step_pin, plc.OUTPUT),
+                    (config.dir_pin, plc.OUTPUT),
+                    (config.en_pin, plc.OUTPUT),
+                    (config.hall_pin, plc.INPUT),
+                ],
+            )
 
         self._loop_interval = max(config.sample_time, 0.05)
         self._start_hall_monitor()
@@ -70,7 +77,7 @@ class PidValveController:
         def monitor():
             while True:
                 val = safe_plc_call("digital_read", plc.digital_read, self.config.hall_pin)
-                if isinstance(val, int):
+                if val is not None:
                     self.state.hall_state = val
                 time.sleep(1.0)
 
@@ -84,9 +91,7 @@ class PidValveController:
         # Match legacy GUI behavior: step while hall reads 1, stop when it drops to 0.
         while True:
             val = safe_plc_call("digital_read", plc.digital_read, self.config.hall_pin)
-            if not isinstance(val, int):
-                val = 0
-            if val == 0:
+            if not val:
                 break
             safe_plc_call("digital_write", plc.digital_write, self.config.step_pin, True)
             time.sleep(0.001)
@@ -101,7 +106,7 @@ class PidValveController:
         deadline = time.time() + max(timeout, 1.0)
         while True:
             val = safe_plc_call("digital_read", plc.digital_read, self.config.hall_pin)
-            if isinstance(val, int) and val == 1:
+            if val == 1:
                 break
             self._step_valve(direction=True, steps=1500)
             if time.time() > deadline:
@@ -1,5 +1,5 @@
 import threading
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterable, Optional
 
 try:
     from librpiplc import rpiplc as plc  # type: ignore
@@ -39,4 +39,25 @@ def safe_plc_call(op_name: str, func: Callable[..., Any], *args, **kwargs) -> Op
         return None
 
 
-__all__ = ["plc", "safe_plc_call", "ensure_plc_init"]
+def safe_plc_call_many(
+    op_name: str, func: Callable[..., Any], calls: Iterable[tuple]
+) -> list[Optional[Any]]:
+    """
+    Batched safe_plc_call: run func(*args) for each args tuple under a single
+    PLC lock acquisition. A failing pin yields None without skipping the rest.
+    """
+    calls = list(calls)
+    if plc is None:
+        return [None] * len(calls)
+    ensure_plc_init()
+    results: list[Optional[Any]] = []
+    with _plc_lock:
+        for args in calls:
+            try:
+                results.append(func(*args))
+            except Exception:
+                results.append(None)
+    return results
+
+
+__all__ = ["plc", "safe_plc_call", "safe_plc_call_many", "ensure_plc_init"]
@@ -1,4 +1,7 @@
 import struct
+import time
+from typing import Iterable
+
 import serial
 
 from infra.config import RelayConfig
@@ -41,22 +44,33 @@ class RelayBoard:
             pass
         return ser
 
-    def _write_register(self, reg: int, value: int) -> bool:
+    def _register_pdu(self, reg: int, value: int) -> bytes:
         hi_reg, lo_reg = (reg >> 8) & 0xFF, reg & 0xFF
         hi_val, lo_val = (value >> 8) & 0xFF, value & 0xFF
-        pdu = bytes([self.config.address, 0x06, hi_reg, lo_reg, hi_val, lo_val])
-        return self._write_frame(pdu)
+        return bytes([self.config.address, 0x06, hi_reg, lo_reg, hi_val, lo_val])
+
+    def _write_register(self, reg: int, value: int) -> bool:
+        return self._write_frame(self._register_pdu(reg, value))
 
     def _write_frame(self, pdu: bytes, expected_len: int = 8) -> bool:
         """Send a pre-built PDU with CRC and validate the echo."""
-        frame = pdu + self._crc16_modbus(pdu)
+        return self._write_frames([pdu], expected_len)
+
+    def _write_frames(self, pdus: list[bytes], expected_len: int = 8) -> bool:
+        """Send several PDUs in one port open/lock; True only if every echo matches."""
+        ok = True
         with get_port_lock(self.config.port):
             with self._open() as serial_port:
-                serial_port.reset_input_buffer()
-                serial_port.reset_output_buffer()
-                serial_port.write(frame)
-                resp = serial_port.read(expected_len)
-                return len(resp) == expected_len and resp[: len(pdu)] == pdu
+                for idx, pdu in enumerate(pdus):
+                    if idx:
+                        time.sleep(self.config.inter_frame_gap_s)
+                    serial_port.reset_input_buffer()
+                    serial_port.reset_output_buffer()
+                    serial_port.write(pdu + self._crc16_modbus(pdu))
+                    serial_port.flush()
+                    resp = serial_port.read(expected_len)
+                    ok = ok and len(resp) == expected_len and resp[: len(pdu)] == pdu
+        return ok
 
     def on(self, relay_num: int) -> bool:
         if not (1 <= relay_num <= 8):
@@ -68,6 +82,22 @@ class RelayBoard:
             raise ValueError("relay_num must be 1..8")
         return self._write_register(relay_num, 0x0200)
 
+    def write_mask(self, channels: Iterable[int], on: bool) -> bool:
+        """
+        Switch several channels with one port session instead of one per channel.
+        All eight channels collapse to the single all-on/all-off frame.
+        """
+        chans = sorted(set(channels))
+        for ch in chans:
+            if not (1 <= ch <= 8):
+                raise ValueError("relay_num must be 1..8")
+        if not chans:
+            return True
+        if chans == list(range(1, 9)):
+            return self.all_on() if on else self.all_off()
+        value = 0x0100 if on else 0x0200
+        return self._write_frames([self._register_pdu(ch, value) for ch in chans])
+
     def all_on(self) -> bool:
         """
         All ON command frame (addressed): addr 0x??, 06, 00, 00, 07, 00, CRC16.
@@ -51,6 +51,7 @@ class RotaryValve:
                 serial_port.reset_input_buffer()
                 serial_port.reset_output_buffer()
                 serial_port.write(frame)
+                serial_port.flush()
                 ack = serial_port.read(8)  # echo for 0x06
                 return len(ack) == 8 and ack[:6] == pdu
 
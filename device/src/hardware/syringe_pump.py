@@ -1,5 +1,6 @@
 import struct
 import os
+import threading
 import time
 from typing import Optional, Callable
 import serial
@@ -100,10 +101,11 @@ class SyringePump:
             with self._open_serial(timeout=0.5) as ser:
                 ser.reset_input_buffer()
                 ser.reset_output_buffer()
-                ser.flush()
                 ser.write(command)
-                time.sleep(0.5)
-                resp = ser.read(30)
+                ser.flush()
+                # 0x10 (write multiple registers) answers with an 8-byte echo; read returns
+                # as soon as it arrives instead of always sleeping 0.5 s and waiting out read(30).
+                resp = ser.read(8)
         if self._debug_hex:
             print(f"[TX] addr={self.config.address} cmd={command.hex(' ')} rx={resp.hex(' ')}")
         return resp
@@ -330,14 +332,20 @@ class SyringePump:
         timeout: Optional[float] = None,
         stop_flag: Optional[Callable[[], bool]] = None,
         tol_steps: int = 500,
+        wake_event: Optional[threading.Event] = None,
     ) -> bool:
         """
         Wait until standstill + pos_ok and within tolerance of last commanded target.
         Returns False on timeout or if stop_flag() becomes True.
+
+        If wake_event is given (set by a status poller when motion ends), the wait
+        wakes on it immediately; otherwise status is re-read with a backoff that
+        starts short and grows to 0.5 s.
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         target_steps = self.target_position
         vel_thresh_steps = 5
+        delay = 0.05
         while True:
             if stop_flag and stop_flag():
                 return False
@@ -354,9 +362,17 @@ class SyringePump:
                     and abs(actual_vel) <= vel_thresh_steps
                 ):
                     return True
-            if timeout is not None and (time.time() - start_time) >= timeout:
+            elapsed = time.monotonic() - start_time
+            if timeout is not None and elapsed >= timeout:
                 return False
-            time.sleep(0.5)
+            if timeout is not None:
+                delay = min(delay, max(0.0, timeout - elapsed))
+            if wake_event is not None:
+                if wake_event.wait(delay):
+                    wake_event.clear()
+            else:
+                time.sleep(delay)
+            delay = min(delay * 2, 0.5)
 
     def home(self, stop_flag: Optional[Callable[[], bool]] = None) -> None:
         """Send homing frames and wait until the pump reports idle."""
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
-from typing import Optional
+from functools import partial
+from typing import NamedTuple, Optional
+import logging
 import threading
+import time
 
 try:
     import RPi.GPIO as GPIO  # type: ignore
@@ -9,7 +12,7 @@ except Exception:
     GPIO = None
 
 from infra.config import TemperatureConfig
-from hardware.plc_utils import plc, safe_plc_call, ensure_plc_init
+from hardware.plc_utils import plc, safe_plc_call, safe_plc_call_many, ensure_plc_init
 
 try:
     from mecom import MeComSerial, ResponseException, WrongChecksum  # type: ignore
@@ -22,8 +25,25 @@ except Exception:
     SerialException = Exception
     PortNotOpenError = Exception
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+_gpio_mode_lock = threading.Lock()
+_gpio_mode_set = False
+
+
+def _ensure_gpio_mode() -> None:
+    """Select BCM numbering once per process (unless something already chose a mode)."""
+    global _gpio_mode_set
+    if _gpio_mode_set:
+        return
+    with _gpio_mode_lock:
+        if not _gpio_mode_set:
+            if GPIO.getmode() is None:
+                GPIO.setmode(GPIO.BCM)
+            _gpio_mode_set = True
+
+
+@dataclass(slots=True)
 class TemperatureState:
     enabled: bool = False
     ready: Optional[bool] = None
@@ -32,7 +52,34 @@ class TemperatureState:
     error: Optional[str] = None
 
 
+class TemperatureReading(NamedTuple):
+    """Consistent view of TemperatureState taken under one lock hold."""
+
+    current_c: Optional[float]
+    ready: Optional[bool]
+    enabled: bool
+    target_c: float
+    error: Optional[str]
+
+
+# MeCom 1200 semantics: 0 = regulation not active, 1 = not stable, 2 = stable.
+_STABLE_FLAG = {0: False, 1: False, 2: True}
+
+# Pause between transaction attempts so other callers can take the lock.
+_RETRY_PAUSE_S = 0.02
+
+# Targets closer than this to the last pushed value are not re-sent.
+_TARGET_EPS_C = 1e-3
+
+
 class _TecDriver:
+    __slots__ = (
+        "port", "channel", "address", "baudrate", "timeout_s", "retry_count",
+        "cache_ttl_s", "_retry_logged", "_session", "_address", "_lock",
+        "_read_cache", "_last_pushed_target_c", "_connect_failures",
+        "_backoff_until", "_last_connect_error", "_kwargs", "_inflight",
+    )
+
     def __init__(
         self,
         port: str,
@@ -40,6 +87,8 @@ class _TecDriver:
         address: Optional[int] = None,
         baudrate: int = 57600,
         timeout_s: float = 0.35,
+        cache_ttl_s: float = 0.2,
+        retry_count: int = 3,
     ) -> None:
         if MeComSerial is None:
             raise RuntimeError("pyMeCom is not available in this environment")
@@ -48,13 +97,50 @@ class _TecDriver:
         self.address = None if address is None else int(address)
         self.baudrate = int(baudrate)
         self.timeout_s = float(timeout_s)
+        self.retry_count = max(1, int(retry_count))
+        self._retry_logged = False
         self._session = None
         self._address = None
+        # address/parameter_instance kwargs for every MeCom call; bound on connect.
+        self._kwargs: Optional[dict] = None
+        # Held per transaction attempt (see _with_retry), never across retries.
         self._lock = threading.Lock()
+        self.cache_ttl_s = max(0.0, float(cache_ttl_s))
+        # parameter_id -> (value, monotonic expiry); guarded by self._lock.
+        self._read_cache: dict[int, tuple[object, float]] = {}
+        # key -> (done event, [result]) for reads currently on the wire.
+        self._inflight: dict[object, tuple[threading.Event, list]] = {}
+        # Last target written to the TEC; None = unknown (e.g. after reconnect).
+        self._last_pushed_target_c: Optional[float] = None
+        # Exponential reconnect backoff while the TEC is unreachable.
+        self._connect_failures = 0
+        self._backoff_until = 0.0
+        self._last_connect_error: Optional[BaseException] = None
 
-    def _connect(self) -> None:
+    def _connect(self, ignore_backoff: bool = False) -> None:
+        """
+        Open the session if needed. A new call fails fast while backing off;
+        retries inside the same call (ignore_backoff) always try the port.
+        """
         if self._session is not None and self._address is not None:
             return
+        now = time.monotonic()
+        if not ignore_backoff and now < self._backoff_until:
+            raise RuntimeError(
+                f"TEC reconnect backing off {self._backoff_until - now:.1f}s: {self._last_connect_error}"
+            ) from self._last_connect_error
+        try:
+            self._open_session()
+        except Exception as exc:
+            self._reset()
+            self._connect_failures += 1
+            self._last_connect_error = exc
+            self._backoff_until = time.monotonic() + min(0.05 * 2 ** self._connect_failures, 5.0)
+            raise
+        self._connect_failures = 0
+        self._backoff_until = 0.0
+
+    def _open_session(self) -> None:
         kwargs = {
             "serialport": self.port,
             "baudrate": self.baudrate,
@@ -65,10 +151,39 @@ class _TecDriver:
         except TypeError:
             kwargs.pop("timeout", None)
             self._session = MeComSerial(**kwargs)
+        self._enable_low_latency()
         if self.address is not None:
             self._address = int(self.address)
         else:
             self._address = self._session.identify()
+        self._kwargs = {"address": self._address, "parameter_instance": self.channel}
+
+    def _enable_low_latency(self) -> None:
+        """
+        Ask the kernel for ASYNC_LOW_LATENCY on the TEC port (FTDI default latency
+        timer is 16 ms per short MeCom reply). Best effort; unsupported ports skip it.
+        """
+        setter = getattr(self._serial(), "set_low_latency_mode", None)
+        if setter is None:
+            return
+        try:
+            setter(True)
+        except Exception:
+            pass
+
+    def _serial(self):
+        """The pyserial port behind the MeCom session, if the library exposes it."""
+        return getattr(self._session, "ser", None) or getattr(self._session, "_ser", None)
+
+    def _discard_stale_input(self) -> None:
+        # Bytes left over from a timed-out reply would corrupt the next frame.
+        ser = self._serial()
+        if ser is None:
+            return
+        try:
+            ser.reset_input_buffer()
+        except Exception:
+            pass
 
     def _reset(self) -> None:
         if self._session is not None:
@@ -78,61 +193,157 @@ class _TecDriver:
                 pass
         self._session = None
         self._address = None
+        self._kwargs = None
+        self._read_cache.clear()
+        self._last_pushed_target_c = None
 
-    def _with_retry(self, func):
-        with self._lock:
-            for attempt in range(2):
+    def _with_retry(self, txn, *args):
+        """
+        Run txn(session, *args) with up to retry_count attempts. The
+        lock is taken per attempt, so other callers can get in between retries.
+        """
+        for attempt in range(self.retry_count):
+            if attempt:
+                time.sleep(_RETRY_PAUSE_S)
+            with self._lock:
                 try:
-                    self._connect()
-                    return func(self._session, self._address)
-                except (ResponseException, WrongChecksum, SerialException, PortNotOpenError):
+                    self._connect(ignore_backoff=attempt > 0)
+                    self._discard_stale_input()
+                    result = txn(self._session, *args)
+                except (SerialException, PortNotOpenError):
+                    # Transport failure: reopen (and re-identify) on the next attempt.
                     self._reset()
-                    if attempt >= 1:
+                    if attempt + 1 >= self.retry_count:
                         raise
+                    continue
+                except (ResponseException, WrongChecksum):
+                    # Garbled/negative reply on a healthy port: retry on the same session.
+                    if attempt + 1 >= self.retry_count:
+                        raise
+                    continue
+            if attempt and not self._retry_logged:
+                self._retry_logged = True
+                logger.warning("TEC on %s needed %d attempts (further retries not logged)", self.port, attempt + 1)
+            return result
+
+    # Transactions: run by _with_retry with the lock held and a connected session;
+    # self._kwargs supplies address/parameter_instance.
+    def _txn_get(self, s, parameter_id: int):
+        value = s.get_parameter(parameter_id=parameter_id, **self._kwargs)
+        self._read_cache[parameter_id] = (value, time.monotonic() + self.cache_ttl_s)
+        return value
+
+    def _txn_set(self, s, parameter_id: int, value) -> None:
+        s.set_parameter(parameter_id=parameter_id, value=value, **self._kwargs)
+        self._read_cache.clear()
+
+    def _txn_target(self, s, target: float) -> None:
+        # Re-checked per attempt: a reconnect forgets the pushed target.
+        if not self._target_is_current(target):
+            self._txn_set(s, 3000, target)
+            self._last_pushed_target_c = target
+
+    def _txn_target_and_enabled(self, s, target: float, status: int) -> None:
+        self._txn_target(s, target)
+        self._txn_set(s, 2010, status)
+
+    def _txn_ready_bundle(self, s):
+        current = s.get_parameter(parameter_id=1000, **self._kwargs)
+        try:
+            stable = s.get_parameter(parameter_id=1200, **self._kwargs)
+        except (ResponseException, WrongChecksum):
+            stable = None
+        expiry = time.monotonic() + self.cache_ttl_s
+        self._read_cache[1000] = (current, expiry)
+        if stable is not None:
+            self._read_cache[1200] = (stable, expiry)
+        return current, stable
+
+    def _cached(self, parameter_id: int):
+        # Caller holds self._lock.
+        cached = self._read_cache.get(parameter_id)
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached
+        return None
+
+    def _get_parameter(self, parameter_id: int, force_refresh: bool = False):
+        """get_parameter with a short per-parameter cache to collapse repeated reads."""
+        if not force_refresh:
+            with self._lock:
+                cached = self._cached(parameter_id)
+            if cached is not None:
+                return cached[0]
+        return self._single_flight(parameter_id, self._txn_get, parameter_id)
+
+    def _single_flight(self, key, txn, *args):
+        """
+        Run a read transaction, or if an identical one is already in progress,
+        wait for it and share its result instead of issuing a second one.
+        """
+        with self._lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = (threading.Event(), [])
+        done, result = flight
+        if not leader:
+            done.wait()
+            if result:
+                return result[0]
+            # The shared read failed; try on our own.
+            return self._with_retry(txn, *args)
+        try:
+            value = self._with_retry(txn, *args)
+            result.append(value)
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            done.set()
+
+    def _target_is_current(self, target_c: float) -> bool:
+        last = self._last_pushed_target_c
+        return last is not None and abs(last - target_c) < _TARGET_EPS_C
 
     def set_target_c(self, value: float) -> None:
-        v = float(value)
-        self._with_retry(
-            lambda s, a: s.set_parameter(
-                parameter_id=3000, value=v, address=a, parameter_instance=self.channel
-            )
-        )
+        self._with_retry(self._txn_target, float(value))
 
     def set_enabled(self, enabled: bool) -> None:
-        v = 1 if enabled else 0
-        self._with_retry(
-            lambda s, a: s.set_parameter(
-                value=v, parameter_id=2010, address=a, parameter_instance=self.channel
-            )
-        )
+        self._with_retry(self._txn_set, 2010, 1 if enabled else 0)
 
-    def read_current_c(self) -> float:
-        return float(
-            self._with_retry(
-                lambda s, a: s.get_parameter(
-                    parameter_id=1000, address=a, parameter_instance=self.channel
-                )
-            )
-        )
+    def set_target_and_enabled(self, target_c: float, enabled: bool) -> None:
+        """Write target then output enable in one connection/lock acquisition."""
+        self._with_retry(self._txn_target_and_enabled, float(target_c), 1 if enabled else 0)
 
-    def read_stable_flag(self) -> Optional[bool]:
+    def read_current_c(self, force_refresh: bool = False) -> float:
+        # pyMeCom decodes parameter 1000 (FLOAT32) to a Python float.
+        return self._get_parameter(1000, force_refresh)
+
+    def read_stable_flag(self, force_refresh: bool = False) -> Optional[bool]:
         try:
-            v = self._with_retry(
-                lambda s, a: s.get_parameter(
-                    parameter_id=1200, address=a, parameter_instance=self.channel
-                )
-            )
-            # MeCom 1200 semantics:
-            # 0 = regulation not active, 1 = not stable, 2 = stable
-            iv = int(v)
-            if iv == 2:
-                return True
-            if iv in (0, 1):
-                return False
-            return None
+            return self._stable_from_raw(self._get_parameter(1200, force_refresh))
         except Exception:
             return None
 
+    @staticmethod
+    def _stable_from_raw(v) -> Optional[bool]:
+        # pyMeCom already decodes 1200 as an int; unknown values/None map to None.
+        return _STABLE_FLAG.get(v)
+
+    def read_ready_bundle(self, force_refresh: bool = False) -> tuple[float, Optional[bool]]:
+        """
+        (current_c, stable) with both parameters read back-to-back in one
+        transaction attempt. Cached values are reused like the single reads.
+        """
+        if not force_refresh:
+            with self._lock:
+                cur = self._cached(1000)
+                stab = self._cached(1200)
+            if cur is not None and stab is not None:
+                return cur[0], self._stable_from_raw(stab[0])
+        current, stable = self._single_flight("ready_bundle", self._txn_ready_bundle)
+        return current, self._stable_from_raw(stable)
+
 
 class TemperatureController:
     def __init__(self, config: TemperatureConfig) -> None:
@@ -147,17 +358,35 @@ class TemperatureController:
         )
         self._poll_stop = threading.Event()
         self._poll_thread: Optional[threading.Thread] = None
+        # Hysteresis for the tolerance-based ready fallback: enter tight, leave loose.
+        self._ready_tol_enter = float(config.tec_ready_tolerance_c)
+        self._ready_tol_exit = self._ready_tol_enter * 1.5
+        self._ready_ttl_s = max(0.0, float(config.ready_ttl_s))
+        self._ready_cache_ts = float("-inf")
+        self._ready_cache_val: Optional[bool] = None
+        self._ready_stable_reads = max(1, int(config.ready_stable_reads))
+        self._ready_candidate: Optional[bool] = None
+        self._ready_candidate_count = 0
+        # Pre-bound PLC read (still serialized by safe_plc_call's PLC lock).
+        self._read_plc_ready = (
+            partial(safe_plc_call, "digital_read", plc.digital_read, config.ready_pin)
+            if plc
+            else None
+        )
         ensure_plc_init()
         if plc:
-            safe_plc_call("pin_mode", plc.pin_mode, config.command_pin, plc.OUTPUT)
+            safe_plc_call_many(
+                "pin_mode",
+                plc.pin_mode,
+                [(config.command_pin, plc.OUTPUT), (config.ready_pin, plc.INPUT)],
+            )
             safe_plc_call("digital_write", plc.digital_write, config.command_pin, False)
-            safe_plc_call("pin_mode", plc.pin_mode, config.ready_pin, plc.INPUT)
 
         self._gpio_ready_ok = False
+        self._gpio_edge_ok = False
         if GPIO is not None:
             try:
-                if GPIO.getmode() is None:
-                    GPIO.setmode(GPIO.BCM)
+                _ensure_gpio_mode()
                 GPIO.setup(config.ready_gpio_pin, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
                 self._gpio_ready_ok = True
             except Exception:
@@ -172,6 +401,8 @@ class TemperatureController:
                     address=config.tec_address,
                     baudrate=config.tec_baudrate,
                     timeout_s=config.tec_timeout_s,
+                    cache_ttl_s=config.tec_read_cache_s,
+                    retry_count=config.tec_retry_count,
                 )
             except Exception as exc:
                 with self._lock:
@@ -180,7 +411,13 @@ class TemperatureController:
             with self._lock:
                 self.state.error = "TEC disabled: temperature.tec_port is not configured"
 
-        if self._tec is not None:
+        if self._tec is None and self._gpio_ready_ok:
+            self._start_ready_edge_detect()
+        # Without a TEC (and without GPIO edge events) the poller samples the
+        # ready input instead, so readers never block on GPIO/PLC access either.
+        if self._tec is not None or (
+            not self._gpio_edge_ok and (self._gpio_ready_ok or plc)
+        ):
             self._start_polling()
 
     def set_target_c(self, target_c: float) -> None:
@@ -232,8 +469,7 @@ class TemperatureController:
                 # Ensure target is pushed before enabling control loop.
                 with self._lock:
                     target_c = self.state.target_c
-                self._tec.set_target_c(target_c)
-                self._tec.set_enabled(bool(enabled))
+                self._tec.set_target_and_enabled(target_c, True)
                 with self._lock:
                     self.state.error = None
             except Exception as exc:
@@ -245,45 +481,110 @@ class TemperatureController:
     def force_off(self) -> None:
         self.set_enabled(False)
 
-    def read_current_c(self) -> Optional[float]:
+    def read_current_c(self, force_refresh: bool = False) -> Optional[float]:
+        if force_refresh and self._tec is not None:
+            self._sample_tec(force_refresh=True)
         with self._lock:
             return self.state.current_c
 
-    def read_ready(self) -> Optional[bool]:
+    def snapshot(self, force_refresh: bool = False) -> TemperatureReading:
+        """
+        Current temperature, ready flag and settings in one call. With a TEC,
+        force_refresh samples current and stable flag in a single transaction.
+        """
+        if self._tec is not None:
+            if force_refresh:
+                self._sample_tec(force_refresh=True)
+        else:
+            self.read_ready(force_refresh)
+        with self._lock:
+            st = self.state
+            return TemperatureReading(st.current_c, st.ready, st.enabled, st.target_c, st.error)
+
+    def read_ready(self, force_refresh: bool = False) -> Optional[bool]:
+        """
+        Last polled ready flag. force_refresh=True reads the TEC (or the ready
+        input) directly instead of returning the cached value.
+        """
         if self._tec is not None:
+            if force_refresh:
+                self._sample_tec(force_refresh=True)
             with self._lock:
                 return self.state.ready
+        if not force_refresh and self._polling():
+            with self._lock:
+                return self.state.ready
+        if force_refresh:
+            self._ready_cache_ts = float("-inf")
         return self._read_ready_from_inputs()
 
     def _read_ready_from_inputs(self) -> Optional[bool]:
+        now = time.monotonic()
+        if now - self._ready_cache_ts < self._ready_ttl_s:
+            return self._ready_cache_val
+        ready = self._sample_ready_inputs()
+        self._ready_cache_val = ready
+        self._ready_cache_ts = now
+        return ready
+
+    def _sample_ready_inputs(self) -> Optional[bool]:
         ready: Optional[bool] = None
 
+        if self._gpio_edge_ok:
+            # Kept current by _on_ready_edge; no GPIO access needed.
+            with self._lock:
+                return self.state.ready
+
         # Prefer GPIO ready if configured/available (external sensor)
-        if GPIO is not None:
+        if self._gpio_ready_ok:
             try:
-                if not self._gpio_ready_ok:
-                    if GPIO.getmode() is None:
-                        GPIO.setmode(GPIO.BCM)
-                    GPIO.setup(self.config.ready_gpio_pin, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
-                    self._gpio_ready_ok = True
-                ready = bool(GPIO.input(self.config.ready_gpio_pin))
-                with self._lock:
-                    self.state.ready = ready
-                return ready
+                return self._apply_polled_ready(bool(GPIO.input(self.config.ready_gpio_pin)))
             except Exception:
                 self._gpio_ready_ok = False
-        if plc:
-            val = safe_plc_call("digital_read", plc.digital_read, self.config.ready_pin)
-            if isinstance(val, int):
-                ready = bool(val)
-                with self._lock:
-                    self.state.ready = ready
-                return ready
+        if self._read_plc_ready is not None:
+            val = self._read_plc_ready()
+            if val is not None:
+                return self._apply_polled_ready(bool(val))
         with self._lock:
             self.state.ready = None
         return ready
 
-    def _sample_tec(self) -> None:
+    def _apply_polled_ready(self, raw: bool) -> Optional[bool]:
+        """Software debounce: accept a new level after N identical consecutive reads."""
+        with self._lock:
+            # Candidate/count are shared with read_ready(force_refresh) callers.
+            if raw == self._ready_candidate:
+                self._ready_candidate_count += 1
+            else:
+                self._ready_candidate = raw
+                self._ready_candidate_count = 1
+            # The first valid read is taken as-is so startup is not delayed.
+            if self.state.ready is None or self._ready_candidate_count >= self._ready_stable_reads:
+                self.state.ready = raw
+            return self.state.ready
+
+    def _start_ready_edge_detect(self) -> None:
+        pin = self.config.ready_gpio_pin
+        kwargs = {}
+        if self.config.ready_debounce_ms > 0:
+            kwargs["bouncetime"] = int(self.config.ready_debounce_ms)
+        try:
+            GPIO.add_event_detect(pin, GPIO.BOTH, callback=self._on_ready_edge, **kwargs)
+        except Exception:
+            return
+        self._gpio_edge_ok = True
+        # Seed the state; later changes arrive through the edge callback.
+        self._on_ready_edge(pin)
+
+    def _on_ready_edge(self, channel) -> None:
+        try:
+            ready: Optional[bool] = bool(GPIO.input(self.config.ready_gpio_pin))
+        except Exception:
+            ready = None
+        with self._lock:
+            self.state.ready = ready
+
+    def _sample_tec(self, force_refresh: bool = False) -> None:
         if self._tec is None:
             return
         with self._lock:
@@ -299,11 +600,12 @@ class TemperatureController:
         err: Optional[str] = None
 
         try:
-            current = float(self._tec.read_current_c())
-            stable = self._tec.read_stable_flag()
+            current, stable = self._tec.read_ready_bundle(force_refresh)
             with self._lock:
                 target_c = self.state.target_c
-            close_to_target = abs(current - target_c) <= float(self.config.tec_ready_tolerance_c)
+                was_ready = self.state.ready
+            tol = self._ready_tol_exit if was_ready else self._ready_tol_enter
+            close_to_target = abs(current - target_c) <= tol
             ready = bool(stable) if stable is not None else close_to_target
         except Exception as exc:
             err = f"TEC read failed: {exc}"
@@ -314,10 +616,18 @@ class TemperatureController:
             self.state.error = err
 
     def _poll_loop(self, interval_s: float) -> None:
+        sample = self._sample_tec if self._tec is not None else self._read_ready_from_inputs
         while not self._poll_stop.is_set():
-            self._sample_tec()
+            try:
+                sample()
+            except Exception:
+                pass
             self._poll_stop.wait(interval_s)
 
+    def _polling(self) -> bool:
+        thread = self._poll_thread
+        return thread is not None and thread.is_alive()
+
     def _start_polling(self) -> None:
         if self._poll_thread and self._poll_thread.is_alive():
             return
@@ -327,3 +637,10 @@ class TemperatureController:
             target=self._poll_loop, args=(interval_s,), daemon=True
         )
         self._poll_thread.start()
+
+    def stop_polling(self, timeout: float = 1.0) -> None:
+        self._poll_stop.set()
+        thread = self._poll_thread
+        if thread and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+        self._poll_thread = None
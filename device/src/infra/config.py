@@ -1,9 +1,15 @@
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml bindings when available
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _YamlLoader
+
 
 @dataclass
 class NetworkConfig:
@@ -17,6 +23,8 @@ class RelayConfig:
     baudrate: int = 9600
     parity: str = "N"
     timeout: float = 0.3
+    # Quiet time between back-to-back frames on the shared RS-485 bus.
+    inter_frame_gap_s: float = 0.15
 
 
 @dataclass
@@ -109,16 +117,34 @@ class Sequence2Config:
     stagnant_epsilon_ml: float = 0.001
 
 
+@dataclass
+class SequenceTimingConfig:
+    # Minimum settle after each step category (explicit step waits still apply).
+    action_settle_s: float = 0.5
+    syringe_settle_s: float = 0.5
+    port_settle_s: float = 0.5
+    relay_settle_s: float = 0.5
+
+
 @dataclass
 class TemperatureConfig:
     command_pin: str = "Q0.6"
     ready_pin: str = "I0.11"
     ready_gpio_pin: int = 4
+    # Reuse a ready-input read for this long (no-TEC fallback path).
+    ready_ttl_s: float = 0.1
+    # Debounce for the ready input: RPi.GPIO bouncetime for edge events, and
+    # consecutive identical reads required before a polled change is accepted.
+    ready_debounce_ms: int = 20
+    ready_stable_reads: int = 3
     tec_port: Optional[str] = None
     tec_address: Optional[int] = None
     tec_baudrate: int = 57600
     tec_timeout_s: float = 0.35
+    tec_retry_count: int = 3
     tec_poll_interval_s: float = 0.5
+    # Repeated TEC parameter reads within this window reuse the last value.
+    tec_read_cache_s: float = 0.2
     tec_channel: int = 1
     tec_default_target_c: float = 58.0
     tec_ready_tolerance_c: float = 0.5
@@ -127,6 +153,8 @@ class TemperatureConfig:
 @dataclass
 class DeviceConfig:
     device_id: str = "device2"
+    # Cadence of the background status snapshot served by GET /status.
+    status_poll_ms: int = 200
     network: NetworkConfig = field(default_factory=NetworkConfig)
     relay: RelayConfig = field(default_factory=RelayConfig)
     rotary_valve: RotaryValveConfig = field(default_factory=RotaryValveConfig)
@@ -140,15 +168,23 @@ class DeviceConfig:
     flow_sensor: FlowSensorConfig = field(default_factory=FlowSensorConfig)
     sequence1: Sequence1Config = field(default_factory=Sequence1Config)
     sequence2: Sequence2Config = field(default_factory=Sequence2Config)
+    sequence_timing: SequenceTimingConfig = field(default_factory=SequenceTimingConfig)
     temperature: TemperatureConfig = field(default_factory=TemperatureConfig)
 
 
-def _load_yaml(path: str) -> Dict[str, Any]:
+@lru_cache(maxsize=4)
+def _parse_yaml(path: str, mtime_ns: int) -> Dict[str, Any]:
     raw = Path(path).read_text()
-    data = yaml.safe_load(raw) if raw else {}
+    data = yaml.load(raw, Loader=_YamlLoader) if raw else {}
     return data or {}
 
 
+def _load_yaml(path: str) -> Dict[str, Any]:
+    # Keyed on mtime so an edited file is re-parsed; unchanged reloads are free.
+    resolved = str(Path(path).resolve())
+    return _parse_yaml(resolved, Path(resolved).stat().st_mtime_ns)
+
+
 def load_config(path: str) -> DeviceConfig:
     """
     Read YAML config into a typed DeviceConfig with sensible defaults.
@@ -158,6 +194,7 @@ def load_config(path: str) -> DeviceConfig:
 
     return DeviceConfig(
         device_id=data.get("device_id", "device2"),
+        status_poll_ms=int(data.get("status_poll_ms", 200)),
         network=NetworkConfig(**data.get("network", {})),
         relay=RelayConfig(**data.get("relay", {})),
         rotary_valve=RotaryValveConfig(**data.get("rotary_valve", {})),
@@ -169,5 +206,6 @@ def load_config(path: str) -> DeviceConfig:
         flow_sensor=FlowSensorConfig(**data.get("flow_sensor", {})),
         sequence1=Sequence1Config(**data.get("sequence1", {})),
         sequence2=Sequence2Config(**data.get("sequence2", {})),
+        sequence_timing=SequenceTimingConfig(**data.get("sequence_timing", {})),
         temperature=TemperatureConfig(**data.get("temperature", {})),
     )
@@ -1,10 +1,9 @@
 import asyncio
-import json
 from typing import Literal, Optional
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 
 from domain.controller import DeviceController
@@ -68,8 +67,11 @@ def create_app(config: DeviceConfig, config_path: str):
     controller.attach_event_loop(asyncio.get_event_loop())
 
     @app.get("/status")
-    def status():
-        return controller.get_status()
+    def status(since: Optional[int] = None):
+        if since is None:
+            # Pre-serialized bytes; skips FastAPI's per-request JSON encoding.
+            return Response(content=controller.get_status_json(), media_type="application/json")
+        return controller.get_status(since=since)
 
     @app.post("/command/start/{sequence_name}")
     def start(sequence_name: str, payload: Optional[StartSequence] = None):
@@ -267,7 +269,7 @@ def create_app(config: DeviceConfig, config_path: str):
         queue: asyncio.Queue = asyncio.Queue()
         controller._sse_subscribers.append(queue)
         # push initial status
-        await queue.put(json.dumps(controller.get_status()))
+        await queue.put(controller.get_status_json().decode("utf-8"))
 
         async def event_generator():
             try:
@@ -10,6 +10,7 @@ if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
 from infra.config import load_config, DeviceConfig
+from infra.log_setup import configure_logging
 from interfaces.api import create_app
 
 
@@ -26,6 +27,7 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> None:
     args = parse_args()
+    configure_logging()
 
     # Load configuration (returns DeviceConfig)
     cfg: DeviceConfig = load_config(args.config)